@@ -47,31 +47,28 @@ raw_log_index = hdf_util.hdf5_to_log_index(filename=LOGFILE)
 #Generate indexes with only Rx_OFDM events
 log_index_rx = log_util.filter_log_index(raw_log_index, include_only=['RX_OFDM'])
 
-# Generate numpy array of all OFDM Rx entries
-log_np = log_util.log_data_to_np_arrays(log_data, log_index_rx)
-log_rx_ofdm = log_np['RX_OFDM']
-
 #################################################################
 # Filter the OFDM Rx Entries
 #  Find the source address for which we have the most receptions
 
-#Extract unique values for address 2 (transmitting address in received MAC headers)
-uniq_addrs = np.unique(log_rx_ofdm['addr2'])
+#Index the Rx_OFDM entries by the addresses in their MAC headers
+# The index is built from the MAC headers in the log data, so no entries are decoded here
+addr_index = log_util.gen_addr_index(log_data, log_index_rx)
 
-#Count the number of receptions per source address
-num_rx = list()
-for ii,ua in enumerate(uniq_addrs):
-    num_rx.append(np.sum(log_rx_ofdm['addr2'] == ua))
+#Unique values for address 2 (transmitting address in received MAC headers) and
+# the number of receptions per source address
+(uniq_addrs, addr_starts, _) = addr_index['RX_OFDM']['addr2']
+num_rx = np.diff(addr_starts)
 
 #Find the source address responsible for the most receptions
-most_rx = max(num_rx)
-most_common_addr = uniq_addrs[num_rx.index(most_rx)]
+most_rx = int(num_rx.max())
+most_common_addr = uniq_addrs[num_rx.argmax()]
 
 print("Found {0} receptions from {1}".format(most_rx, wlan_exp_util.mac_addr_to_str(most_common_addr)))
 
-#Create new numpy array of all receptions from most-common source
-arr_rx_one_src = np.empty(most_rx, dtype=log_rx_ofdm.dtype)
-arr_rx_one_src[:] = log_rx_ofdm[(log_rx_ofdm['addr2'] == most_common_addr)]
+#Generate numpy array of just the receptions from most-common source
+log_index_one_src = log_util.filter_log_index_by_addr(addr_index, most_common_addr, 'addr2')
+arr_rx_one_src = log_util.log_data_to_np_arrays(log_data, log_index_one_src)['RX_OFDM']
 
 #Create some strings to use as attributes in the HDF5 file
 # attributes are only for convenience - they aren't required for writing or reading HDF5 files
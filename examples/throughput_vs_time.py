@@ -1,52 +1,37 @@
-import numpy as np
-import pandas as pd
-
 from matplotlib.pyplot import *
 
 import wlan_exp.log.util as log_util
+import wlan_exp.log.util_bin as log_util_bin
+import wlan_exp.log.util_agg as log_util_agg
 
-with open('big_logs/sta_log_stats_2014_03_06.bin', 'rb') as fh:
-    print("Reading log file...")
-    log_b = fh.read()
+print("Reading log file...")
+log_b = log_util_bin.bin_to_log_data('big_logs/sta_log_stats_2014_03_06.bin')
 
+# The raw log index is cached next to the log file after the first run
 print("Generating log index...")
-log_index_raw = log_util.gen_log_index_raw(log_b)
+log_index_raw = log_util_bin.bin_to_log_index('big_logs/sta_log_stats_2014_03_06.bin')
 
 #Extract just OFDM Rx events
 log_idx_rx_ofdm = log_util.filter_log_index(log_index_raw, include_only=['RX_OFDM'])
 
 #Generate numpy array
 print("Generating numpy arrays...")
-log_nd = log_util.gen_log_np_arrays(log_b, log_idx_rx_ofdm)
+log_nd = log_util.log_data_to_np_arrays(log_b, log_idx_rx_ofdm, fields=['timestamp', 'length'])
 rx = log_nd['RX_OFDM']
 
-#Extract length and timestamp fields
-l = rx['length']
-t = rx['timestamp']
-
-#Convert to pandas dataset, indexed by microsecond timestamp
 print("Calculating throughput...")
-t_pd = pd.to_datetime(t, unit='us')
-len_pd = pd.Series(l, index=t_pd)
-
 rs_interval = 100 #msec
 rolling_winow = 600 #samples
 
-#Resample length vector, summing in each interval; fill empty intervals with 0
-# Interval argument must be 'NL' for Nmsec ('100L' for 100msec)
-len_rs = len_pd.resample(('%dL' % rs_interval), how='sum').fillna(value=0)
-
-#Calculate rolling mean of throghput (units of bytes per rs_interval)
-xput_roll = pd.rolling_mean(len_rs, rolling_winow)
-
-#Scale to Mb/sec
-xput_roll = xput_roll  * (1.0e-6 * 8.0 * (1.0/(rs_interval * 1e-3)))
+#Sum the length of the Rx entries in each interval, then calculate the rolling
+# mean of the throughput in Mb/sec
+(t_bins, xput_roll) = log_util_agg.throughput_vs_time(rx, interval=(rs_interval * 1000), window=rolling_winow)
 
 #----------------------
 # Plot results
 
 #X axis in units of minutes
-t_p = np.linspace(0, (1.0/60) * 1e-6 * (max(t) - min(t)), len(xput_roll))
+t_p = (1.0/60) * 1e-6 * (t_bins - t_bins[0])
 
 #enter interactive mode from script, so figures/plots update live
 ion()
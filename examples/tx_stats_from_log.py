@@ -1,13 +1,11 @@
 import os
 import sys
 
-import numpy as np
-import matplotlib.mlab as mlab
-
 import wlan_exp.util as wlan_exp_util
 
 import wlan_exp.log.util as log_util
 import wlan_exp.log.util_hdf as hdf_util
+import wlan_exp.log.util_agg as agg_util
 
 
 #Use log file given as command line argument, if present
@@ -35,21 +33,22 @@ raw_log_index = hdf_util.hdf5_to_log_index(filename=LOGFILE)
 tx_log_index  = log_util.filter_log_index(raw_log_index, include_only=['TX'])
 
 # Generate numpy array
-tx_recs       = log_np = log_util.log_data_to_np_arrays(log_data, tx_log_index)
+log_np        = log_util.log_data_to_np_arrays(log_data, tx_log_index)
+tx_recs       = log_np['TX']
 
 # Define the fields to group by
 group_fields = ('addr1',)
 
 # Define the aggregation functions
 stat_calc = (
-    ('retry_count',  np.mean, 'avg_num_tx'),
-    ('length',       len,     'num_pkts'),
-    ('length',       np.mean, 'avg_len'),
-    ('length',       sum,     'tot_len'),
-    ('time_to_done', np.mean, 'avg_time'))
+    ('num_tx',       'mean',  'avg_num_tx'),
+    ('length',       'count', 'num_pkts'),
+    ('length',       'mean',  'avg_len'),
+    ('length',       'sum',   'tot_len'),
+    ('time_to_done', 'mean',  'avg_time'))
 
 # Calculate the aggregate statistics
-tx_stats = mlab.rec_groupby(tx_recs, group_fields, stat_calc)
+tx_stats = agg_util.group_by(tx_recs, group_fields, stat_calc)
 
 # Display the results
 print('\nTx Statistics for {0}:\n'.format(LOGFILE))
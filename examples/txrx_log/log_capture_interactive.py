@@ -83,6 +83,9 @@ def add_data_to_log(log_tail_pad=500):
     print("\nWriting {0:15,d} bytes of data to log file {1}...".format(len(data), LOGFILE))
     log_container.write_log_data(data)
 
+    # Index the new data; only the bytes appended since the last call are indexed
+    log_container.write_log_index()
+
 
 def get_log_size_str(nodes):
     """Gets the log size str for each node."""
@@ -223,7 +226,7 @@ def end_experiment():
     # Get the last of the data
     add_data_to_log(log_tail_pad=0)
 
-    # Create the log index
+    # Index any remaining log data
     log_container.write_log_index()
 
     # Get the end time as an attribute
@@ -28,6 +28,7 @@ from  wlan_exp.util import wlan_rates
 
 import wlan_exp.log.util as log_util
 import wlan_exp.log.util_hdf as hdf_util
+import wlan_exp.log.util_agg as agg_util
 import wlan_exp.log.util_sample_data as sample_data_util
 
 from wlan_exp.log.entry_types import log_entry_types
@@ -138,23 +139,10 @@ if('TX' in log_np.keys()):
     # Extract all OFDM transmissions
     log_tx = log_np['TX']
 
-    # Count number of packets transmitted to each unique address in the 'addr1' field
-    tx_addrs_1 = log_tx['addr1']
-    tx_counts = dict()
-
-    for addr in np.unique(tx_addrs_1):
-        # Find indexes of all instances where addresses match
-        #   np.squeeze here flattens the result to a 1-D array
-        addr_idx = np.squeeze(tx_addrs_1 == addr)
-
-        # Count the number of packets (True values in index array) to this address
-        tx_pkts_to_addr  = np.sum(addr_idx)
-
-        # Count the number of bytes to this address
-        tx_bytes_to_addr = np.sum(log_tx['length'][addr_idx])
-
-        # Record the results in the output dictionary
-        tx_counts[addr] = (tx_pkts_to_addr, tx_bytes_to_addr)
+    # Count number of packets and bytes transmitted to each unique address in the 'addr1' field
+    #   group_by returns one element per unique address, sorted by address
+    tx_counts = agg_util.group_by(log_tx, 'addr1', (('length', 'count', 'num_pkts'),
+                                                    ('length', 'sum',   'num_bytes')))
 
     # Print the results
     print("\nExample 2: Tx MPDU Counts:");
@@ -164,13 +152,13 @@ if('TX' in log_np.keys()):
         "# Bytes",
         "MAC Addr Type"))
 
-    for k in sorted(tx_counts.keys()):
+    for c in tx_counts:
         # Use the string version of the MAC address as the key for readability
         print("{0:18}\t{1:>7}\t{2:>10}\t{3}".format(
-            wlan_exp_util.mac_addr_to_str(k), 
-            tx_counts[k][0], 
-            tx_counts[k][1], 
-            wlan_exp_util.mac_addr_desc(k)))
+            wlan_exp_util.mac_addr_to_str(c['addr1']), 
+            c['num_pkts'], 
+            c['num_bytes'], 
+            wlan_exp_util.mac_addr_desc(c['addr1'])))
 
 #################################################################################################
 # Example 3: Calculate total number of packets and bytes received from each distinct MAC address
@@ -185,24 +173,10 @@ if('RX_OFDM' in log_np.keys()):
     # Extract only Rx entries with good checksum (FCS = good)
     rx_good_fcs = log_rx[log_rx['fcs_result'] == log_entry_types['RX_OFDM'].consts['FCS_GOOD']]
 
-    # Extract addr2 field from all good packets
-    rx_addrs_2 = rx_good_fcs['addr2']
-
-    # Build a dictionary using unique MAC addresses as keys
-    rx_counts = dict()
-    for addr in np.unique(rx_addrs_2):
-        # Find indexes of all instances where addresses match
-        #   np.squeeze here flattens the result to a 1-D array
-        addr_idx = np.squeeze(rx_addrs_2 == addr)
-
-        # Count the number of packets (True values in index array) from this address
-        rx_pkts_from_addr  = np.sum(addr_idx)
-
-        # Count the number of bytes from this address
-        rx_bytes_from_addr = np.sum(rx_good_fcs['length'][addr_idx])
-
-        # Add the information about the address to the dictionary
-        rx_counts[addr] = (rx_pkts_from_addr, rx_bytes_from_addr)
+    # Count number of packets and bytes received from each unique address in the 'addr2' field
+    #   group_by returns one element per unique address, sorted by address
+    rx_counts = agg_util.group_by(rx_good_fcs, 'addr2', (('length', 'count', 'num_pkts'),
+                                                         ('length', 'sum',   'num_bytes')))
 
     # Print the results
     print("\nExample 3: Rx Counts (including duplicates):");
@@ -212,13 +186,13 @@ if('RX_OFDM' in log_np.keys()):
         "# Bytes",
         "MAC Addr Type"))
 
-    for k in sorted(rx_counts.keys()):
+    for c in rx_counts:
         # Use the string version of the MAC address as the key for readability
         print("{0:18}\t{1:>7}\t{2:>10}\t{3}".format(
-            wlan_exp_util.mac_addr_to_str(k), 
-            rx_counts[k][0], 
-            rx_counts[k][1], 
-            wlan_exp_util.mac_addr_desc(k)))
+            wlan_exp_util.mac_addr_to_str(c['addr2']), 
+            c['num_pkts'], 
+            c['num_bytes'], 
+            wlan_exp_util.mac_addr_desc(c['addr2'])))
 
 print('')
 
@@ -1,6 +1,6 @@
 """
 This script uses the WLAN Exp Log utilities to parse raw log data and
-plot the throughput vs time using the pandas framework.
+plot the throughput vs time.
 
 Hardware Setup:
     - None.  Parsing log data can be done completely off-line
@@ -14,10 +14,10 @@ License:   Copyright 2014, Mango Communications. All rights reserved.
 import os
 import sys
 import numpy as np
-import pandas as pd
 
 import wlan_exp.log.util as log_util
 import wlan_exp.log.util_hdf as hdf_util
+import wlan_exp.log.util_agg as agg_util
 import wlan_exp.log.util_sample_data as sample_data_util
 
 #-----------------------------------------------------------------------------
@@ -97,7 +97,6 @@ rx_sta = log_np_sta['RX_OFDM']
 print('AP Rx: {0}, AP Tx: {1}'.format(len(rx_ap), len(tx_ap)))
 print('STA Rx: {0}, STA Tx: {1}'.format(len(rx_sta), len(tx_sta)))
 
-#Resample docs: http://stackoverflow.com/questions/17001389/pandas-resample-documentation
 rs_interval = 1 #msec
 rolling_winow = 1000 #samples
 
@@ -106,49 +105,27 @@ rx_ap_idx = (rx_ap['addr2'] == addr_sta) & ((rx_ap['flags'] & 0x1) == 0)
 rx_ap_from_sta = rx_ap[rx_ap_idx]
 
 rx_ap_t = rx_ap_from_sta['timestamp']
-rx_ap_len = rx_ap_from_sta['length']
 
 #Select non-duplicate packets from partner node
 rx_sta_idx = (rx_sta['addr2'] == addr_ap) & ((rx_sta['flags'] & 0x1) == 0)
 rx_sta_from_ap = rx_sta[rx_sta_idx]
 
 rx_sta_t = rx_sta_from_ap['timestamp']
-rx_sta_len = rx_sta_from_ap['length']
 
 
-#Convert to Pandas series
-rx_ap_t_pd = pd.to_datetime(rx_ap_t, unit='us')
-rx_ap_len_pd = pd.Series(rx_ap_len, index=rx_ap_t_pd)
+#Use the same time bins for both flows, from the first to the last reception
+t_start = int(min(np.min(rx_ap_t), np.min(rx_sta_t)))
+t_end   = int(max(np.max(rx_ap_t), np.max(rx_sta_t))) + 1
 
-rx_sta_t_pd = pd.to_datetime(rx_sta_t, unit='us')
-rx_sta_len_pd = pd.Series(rx_sta_len, index=rx_sta_t_pd)
-
-#Resample
-rx_ap_len_rs = rx_ap_len_pd.resample(('%dL' % rs_interval), how='sum').fillna(value=0)
-rx_sta_len_rs = rx_sta_len_pd.resample(('%dL' % rs_interval), how='sum').fillna(value=0)
-
-#Merge the indexes
-t_idx = rx_ap_len_rs.index.union(rx_sta_len_rs.index)
-
-#Reindex both Series to the common index, filling 0 in empty slots
-rx_ap_len_rs = rx_ap_len_rs.reindex(t_idx, fill_value=0)
-rx_sta_len_rs = rx_sta_len_rs.reindex(t_idx, fill_value=0)
-
-#Compute rolling means
-rx_xput_ap_r = pd.rolling_mean(rx_ap_len_rs, window=rolling_winow, min_periods=1)
-rx_xput_sta_r = pd.rolling_mean(rx_sta_len_rs, window=rolling_winow, min_periods=1)
-
-#Set NaN values to 0 (no packets == zero throughput)
-rx_xput_ap_r = rx_xput_ap_r.fillna(value=0)
-rx_xput_sta_r = rx_xput_sta_r.fillna(value=0)
+#Sum the length of the receptions in each interval, then compute the rolling
+# means of the throughputs in Mb/sec
+(t_bins, plt_xput_ap) = agg_util.throughput_vs_time(rx_ap_from_sta, interval=(rs_interval * 1000), window=rolling_winow,
+                                                    start_time=t_start, end_time=t_end)
+(t_bins, plt_xput_sta) = agg_util.throughput_vs_time(rx_sta_from_ap, interval=(rs_interval * 1000), window=rolling_winow,
+                                                     start_time=t_start, end_time=t_end)
 
 #Create x axis values
-t_sec = t_idx.astype('int64') / 1.0E9
-plt_t = np.linspace(0, (max(t_sec) - min(t_sec)), len(t_sec))
-
-#Rescale xputs to bits/sec
-plt_xput_ap = rx_xput_ap_r  * (1.0e-6 * 8.0 * (1.0/(rs_interval * 1e-3)))
-plt_xput_sta = rx_xput_sta_r  * (1.0e-6 * 8.0 * (1.0/(rs_interval * 1e-3)))
+plt_t = (t_bins - t_bins[0]) / 1.0E6
 
 figure(1)
 clf()
@@ -300,9 +300,15 @@ class StatsConfigure(wn_message.Cmd):
 
 
 class StatsGetTxRx(wn_message.BufferCmd):
-    """Command to get the statistics from the node for a given node."""
-    def __init__(self, node=None):
+    """Command to get the statistics from the node for a given node.
+
+    If as_np_array is True, the statistics are returned as a numpy structured
+    array (see WlanExpLogEntryType.deserialize()) instead of a list of 
+    dictionaries.
+    """
+    def __init__(self, node=None, as_np_array=False):
         super(StatsGetTxRx, self).__init__()
+        self.as_np_array = as_np_array
         self.command = _CMD_GRPID_NODE + CMDID_STATS_GET_TXRX
 
         if node is not None:
@@ -320,7 +326,7 @@ class StatsGetTxRx(wn_message.BufferCmd):
         
         index   = 0
         data    = resp.get_bytes()
-        ret_val = entry_types.entry_txrx_stats.deserialize(data[index:])
+        ret_val = entry_types.entry_txrx_stats.deserialize(data[index:], self.as_np_array)
 
         return ret_val
 
@@ -980,9 +986,15 @@ class NodeProcRxAntMode(wn_message.Cmd):
 
 
 class NodeGetStationInfo(wn_message.BufferCmd):
-    """Command to get the station info for a given node."""
-    def __init__(self, node=None):
+    """Command to get the station info for a given node.
+
+    If as_np_array is True, the station infos are returned as a numpy 
+    structured array (see WlanExpLogEntryType.deserialize()) instead of a 
+    list of dictionaries.
+    """
+    def __init__(self, node=None, as_np_array=False):
         super(NodeGetStationInfo, self).__init__()
+        self.as_np_array = as_np_array
         self.command = _CMD_GRPID_NODE + CMDID_GET_STATION_INFO
 
         if node is not None:
@@ -1000,7 +1012,7 @@ class NodeGetStationInfo(wn_message.BufferCmd):
 
         index   = 0
         data    = resp.get_bytes()
-        ret_val = entry_types.entry_station_info.deserialize(data[index:])
+        ret_val = entry_types.entry_station_info.deserialize(data[index:], self.as_np_array)
 
         return ret_val
 
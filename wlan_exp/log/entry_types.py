@@ -42,7 +42,8 @@ To define a custom log entry type::
 
 ----
 """
-from struct import unpack, calcsize, error
+from struct import Struct
+from collections import namedtuple
 import numpy as np
 
 # WLAN Exp Event Log Constants
@@ -74,6 +75,19 @@ ENTRY_TYPE_TXRX_STATS             = 30
 
 log_entry_types          = dict()
 
+
+# Compiled codec of a log entry type definition (see WlanExpLogEntryType.get_codec())
+#     fields_struct   -- Compiled struct.Struct of the fields
+#     np_dt           -- numpy dtype of the fields (ie fields_np_dt)
+#     itemsize        -- Size of the fields in bytes
+#     field_offsets   -- Dictionary of the byte offset of each field
+#     payload_offset  -- Offset of the variable length payload that follows
+#                        the fields (see log_util.overwrite_payloads())
+#     unpack_names    -- Names of the fields unpacked by fields_struct (ie
+#                        fields ignored by struct unpack are removed)
+WlanExpLogEntryCodec     = namedtuple('WlanExpLogEntryCodec', ['fields_struct', 'np_dt', 'itemsize', 'field_offsets', 
+                                                               'payload_offset', 'unpack_names'])
+
 #-----------------------------------------------------------------------------
 # Log Entry Type Base Class
 #-----------------------------------------------------------------------------
@@ -91,6 +105,7 @@ class WlanExpLogEntryType(object):
     fields_np_dt        = None #:numpy dtype object describing format
     fields_fmt_struct   = None #:List of field formats, in struct module format
     _field_offsets       = None
+    _codec              = None
 
     gen_numpy_callbacks = None
 
@@ -132,6 +147,9 @@ class WlanExpLogEntryType(object):
         # Initialize variable that contains field names and byte offsets 
         self._field_offsets       = {} 
 
+        # Initialize the codec of the (empty) field definitions
+        self._update_codec()
+
 
     #-------------------------------------------------------------------------
     # Accessor methods for the WlanExpLogEntryType
@@ -148,6 +166,8 @@ class WlanExpLogEntryType(object):
 
     def get_field_offsets(self):       return self._field_offsets
 
+    def get_codec(self):               return self._codec
+
     def get_entry_type_id(self):       return self.entry_type_id
 
     def append_field_defs(self, field_info):
@@ -179,17 +199,68 @@ class WlanExpLogEntryType(object):
     #-------------------------------------------------------------------------
     # Utility methods for the WlanExpLogEntryType
     #-------------------------------------------------------------------------
-    def generate_numpy_array(self, log_bytes, byte_offsets):
+    def generate_numpy_array(self, log_bytes, byte_offsets, fields=None):
         """Generate a NumPy array from the log_bytes of the given
-        WlanExpLogEntryType instance at the given byte_offsets.
+        WlanExpLogEntryType instance at the given byte_offsets.  The 
+        byte_offsets can be a list or a numpy array (ie a LogIndex value).
+
+        The entries are copied from log_bytes in to the array with a single
+        numpy gather (see gather_np_array()).  If the entries are evenly 
+        spaced in log_bytes, the array is a read-only view of log_bytes and
+        no data is copied.
+
+        If fields is a list of field names, only those fields are read from
+        log_bytes and the array has a packed dtype with just those fields.
+        Field names that are not fields of the entry type are ignored.  
+        Fields added by a gen_numpy callback can be requested if the 
+        callback declares them in its 'output_fields' attribute; the fields
+        in its 'input_fields' attribute are then read as well (and removed
+        after the callback runs).  Callbacks without these attributes only
+        run if every field of the entry type is requested.
+
+        If a callback also declares the formats of its output fields in its
+        'output_formats' attribute, the array is allocated with room for 
+        these fields and the callback can fill them in place instead of 
+        copying the array (see np_array_add_MAC_addr_fields()).
         """
-        index_iter = [log_bytes[o : o + self.fields_np_dt.itemsize] for o in byte_offsets]
-        np_arr = np.fromiter(index_iter, self.fields_np_dt, len(byte_offsets))
+        if fields is None:
+            new_fields = _get_callback_fields(self.gen_numpy_callbacks)
+            np_arr     = gather_np_array(log_bytes, byte_offsets, self.fields_np_dt, new_fields)
 
-        if self.gen_numpy_callbacks:
             for callback in self.gen_numpy_callbacks:
                 np_arr = callback(np_arr)
 
+            return np_arr
+
+        # Determine the fields read from log_bytes and the callbacks to run
+        requested = set(fields)
+        names     = set(n for n in self.fields_np_dt.names if n in requested)
+        callbacks = []
+
+        for callback in self.gen_numpy_callbacks:
+            input_fields  = getattr(callback, 'input_fields', self.fields_np_dt.names)
+            output_fields = getattr(callback, 'output_fields', ())
+
+            if requested.intersection(output_fields):
+                names.update(input_fields)
+
+            if names.issuperset(input_fields):
+                callbacks.append(callback)
+
+        new_fields = _get_callback_fields(callbacks)
+        np_arr     = gather_np_array_fields(log_bytes, byte_offsets, self.fields_np_dt, names, new_fields)
+
+        for callback in callbacks:
+            np_arr = callback(np_arr)
+
+        # Remove any fields that were only read as callback inputs
+        names = [n for n in np_arr.dtype.names if n in requested]
+
+        if (len(names) != len(np_arr.dtype.names)):
+            from numpy.lib import recfunctions
+
+            np_arr = recfunctions.repack_fields(np_arr[names])
+
         return np_arr
 
     def generate_entry_doc(self, fmt='wiki'):
@@ -249,7 +320,7 @@ class WlanExpLogEntryType(object):
         be used for debugging log data parsing and log index generation, not for general creation
         of text log files."""
         
-        entry_size = calcsize(self.fields_fmt_struct)
+        entry_size = self._codec.itemsize
         entry      = self.deserialize(buf[0:entry_size])[0]
                 
         str_out = self.name + ': '
@@ -270,43 +341,48 @@ class WlanExpLogEntryType(object):
         return str_out
 
 
-    def deserialize(self, buf):
+    def deserialize(self, buf, as_np_array=False):
         """Unpacks one or more raw log entries of the same type into a list of dictionaries
 
         Args:
             buf (bytearray): Array of raw log data containing 1 or more log entries
             of the same type.
+            as_np_array (bool): Return a numpy structured array (with dtype 
+            fields_np_dt) instead of a list of dictionaries.
         
         Returns:
             List of dictoinaries. Each dictionary has one value per field in the
-            log entry definition using the field names as keys.
+            log entry definition using the field names as keys.  If as_np_array
+            is True, a numpy structured array with one element per log entry;
+            the array is a view of buf (ie nothing is copied).
 
+        All entries are unpacked with the pre-compiled struct format of the
+        entry type (see get_codec()).
         """
         from collections import OrderedDict
 
-        ret_val    = []
-        buf_size   = len(buf)
-        entry_size = calcsize(self.fields_fmt_struct)
-        index      = 0
-
-        while (index < buf_size):
-            try:
-                dataTuple = unpack(self.fields_fmt_struct, buffer(buf[index:index+entry_size]))
-                all_names = self.get_field_names()
-                all_fmts  = self.get_field_struct_formats()
+        fields_struct = self._codec.fields_struct
+        entry_size    = fields_struct.size
+        buf_size      = len(buf)
+        num_entries   = buf_size // entry_size
 
-                # Filter out names for fields ignored during unpacking
-                names = [n for (n,f) in zip(all_names, all_fmts) if 'x' not in f]
+        if ((num_entries * entry_size) != buf_size):
+            msg  = "Error unpacking {0} buffer with len {1}: ".format(self.name, buf_size)
+            msg += "{0} bytes after the last complete entry".format(buf_size - (num_entries * entry_size))
+            print(msg)
 
-                # Use OrderedDict to preserve user-specified field order
-                ret_val.append(OrderedDict(zip(names, dataTuple)))
+        if as_np_array:
+            return np.frombuffer(buf, dtype=self.fields_np_dt, count=num_entries)
 
-            except error as err:
-                print("Error unpacking {0} buffer with len {1}: {2}".format(self.name, len(buf), err))
+        names = self._codec.unpack_names
 
-            index += entry_size
+        if hasattr(fields_struct, 'iter_unpack'):
+            values = fields_struct.iter_unpack(memoryview(buf)[:(num_entries * entry_size)])
+        else:
+            values = (fields_struct.unpack_from(buf, index) for index in range(0, num_entries * entry_size, entry_size))
 
-        return ret_val
+        # Use OrderedDict to preserve user-specified field order
+        return [OrderedDict(zip(names, v)) for v in values]
 
 
     #-------------------------------------------------------------------------
@@ -344,9 +420,13 @@ class WlanExpLogEntryType(object):
 
         # Update the field offsets 
         self._field_offsets = dict(zip(names, offsets))
+
+        # Update the codec so that users of the field definitions do not
+        #   need to compile the struct format or compute sizes again
+        self._update_codec()
         
         # Check our definitions of struct vs numpy are in sync
-        struct_size = calcsize(self.fields_fmt_struct)
+        struct_size = self._codec.fields_struct.size
         np_size     = self.fields_np_dt.itemsize
         
         if (struct_size != np_size):
@@ -355,6 +435,32 @@ class WlanExpLogEntryType(object):
             print(msg)
         
 
+    def _update_codec(self):
+        """Internal method to compile the codec of the field definitions."""
+        fields_struct = Struct(self.fields_fmt_struct)
+        unpack_names  = [f[0] for f in self._fields if 'x' not in f[1]]
+
+        if self.fields_np_dt is not None:
+            itemsize = self.fields_np_dt.itemsize
+        else:
+            itemsize = fields_struct.size
+
+        self._codec = WlanExpLogEntryCodec(fields_struct, self.fields_np_dt, itemsize,
+                                           self._field_offsets, fields_struct.size, unpack_names)
+
+
+    def __getstate__(self):
+        """The compiled codec cannot be pickled (ie sent to other processes);
+        it is compiled again when the WlanExpLogEntryType is unpickled.
+        """
+        state = self.__dict__.copy()
+        state.pop('_codec', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._update_codec()
+
     def __eq__(self, other):
         """WlanExpLogEntryType are equal if their names are equal."""
         if type(other) is str:
@@ -390,41 +496,283 @@ class WlanExpLogEntryType(object):
 
 def np_array_add_MAC_addr_fields(np_arr_orig):
         # Extend the default np_arr with convenience fields for MAC header addresses
-        # IMPORTANT: np_arr uses the original bytearray as its underlying data
+        # IMPORTANT: np_arr may use the original bytearray as its underlying data
         # We must operate on a copy to avoid clobbering log entries adjacent to the
         #  Tx or Rx entries being extended
+        new_fields = {'names'   : np_array_add_MAC_addr_fields.output_fields,
+                      'formats' : np_array_add_MAC_addr_fields.output_formats}
+
+        if (np_arr_orig.flags.writeable and 
+                set(new_fields['names']).issubset(np_arr_orig.dtype.names)):
+            # The fields were allocated when the entries were gathered (see
+            #   generate_numpy_array()); fill them in place
+            np_arr_out = np_arr_orig
+        else:
+            # Copy each entry in to the output array with a single memcpy:  the
+            #   original fields keep their byte offsets in the new dtype
+            np_arr_out = np.empty((len(np_arr_orig),), dtype=_append_np_dt(np_arr_orig.dtype, new_fields))
 
-        # Create a new numpy dtype with additional fields
-        dt_new = extend_np_dt(np_arr_orig.dtype,
-                {'names': ('addr1', 'addr2', 'addr3', 'mac_seq'),
-                 'formats': ('uint64', 'uint64', 'uint64', 'uint16')})
+            np_arr_recs = np.ndarray((len(np_arr_orig),), dtype=np_arr_orig.dtype, 
+                                     buffer=np_arr_out, strides=(np_arr_out.itemsize,))
+            np_arr_recs[...] = np_arr_orig
 
-        #Initialize the output array (same shape, new dtype)
-        np_arr_out = np.zeros(np_arr_orig.shape, dtype=dt_new)
+        # Compute one address column at a time so only one temporary column exists
+        columns = np_array_MAC_addr_fields(np_arr_orig, lazy=True)
 
-        #Copy data from the base numpy array into the output array
-        for f in np_arr_orig.dtype.names:
-            #TODO: maybe don't copy fields that are ignored in the struct format?
-            # problem is non-TxRx entries would still have these fields in their numpy versions
-            np_arr_out[f] = np_arr_orig[f]
+        for f in new_fields['names']:
+            np_arr_out[f] = columns[f]
+            del columns[f]
 
-        #Helper array of powers of 2
-        # this array arranges bytes such that they match other u64 representations of MAC addresses
-        #  elsewhere in the framework
-        addr_conv_arr = np.uint64(2)**np.array(range(40,-1,-8), dtype='uint64')
+        return np_arr_out
+
+# End def
 
-        #Extract all MAC headers (each header is 24-entry uint8 array)
-        mac_hdrs = np_arr_orig['mac_payload']
+# Fields used / added by np_array_add_MAC_addr_fields (see generate_numpy_array())
+np_array_add_MAC_addr_fields.input_fields   = ('mac_payload',)
+np_array_add_MAC_addr_fields.output_fields  = ('addr1', 'addr2', 'addr3', 'mac_seq')
+np_array_add_MAC_addr_fields.output_formats = ('uint64', 'uint64', 'uint64', 'uint16')
 
-        #Compute values for address-as-int fields using numpy's dot-product routine
-        # MAC header offsets here select the 3 6-byte address fields
-        np_arr_out['addr1'] = np.dot(addr_conv_arr, np.transpose(mac_hdrs[:, 4:10]))
-        np_arr_out['addr2'] = np.dot(addr_conv_arr, np.transpose(mac_hdrs[:,10:16]))
-        np_arr_out['addr3'] = np.dot(addr_conv_arr, np.transpose(mac_hdrs[:,16:22]))
 
-        np_arr_out['mac_seq'] = np.dot(mac_hdrs[:,22:24], [1, 256]) // 16
+def np_array_MAC_addr_fields(np_arr, lazy=False):
+    """Computes the MAC header address fields of a numpy array of Tx or Rx 
+    entries as separate columns, without copying the entries.
+
+    Returns a dictionary with keys 'addr1', 'addr2', 'addr3' (u64 MAC 
+    addresses, first byte is most significant) and 'mac_seq' (u16 sequence
+    number), each a numpy array with one value per entry.  If lazy is True,
+    a LazyColumns dictionary is returned instead and each column is only
+    computed when it is first accessed.
+    """
+    # Each MAC header is a 24-entry uint8 array
+    mac_hdrs = np_arr['mac_payload']
+
+    funcs = {'addr1'   : lambda: _mac_hdr_addr(mac_hdrs,  4),
+             'addr2'   : lambda: _mac_hdr_addr(mac_hdrs, 10),
+             'addr3'   : lambda: _mac_hdr_addr(mac_hdrs, 16),
+             'mac_seq' : lambda: _mac_hdr_seq(mac_hdrs)}
+
+    columns = LazyColumns(funcs)
+
+    if lazy:
+        return columns
+    else:
+        return dict((k, columns[k]) for k in np_array_add_MAC_addr_fields.output_fields)
+
+# End def
+
+
+class LazyColumns(object):
+    """Dictionary-like container of numpy columns that are computed when 
+    they are first accessed.
+
+    funcs is a dictionary of functions (with no arguments) that compute the
+    column of each key.  Computed columns are kept until they are deleted
+    (a deleted column is computed again if it is accessed again).
+    """
+    funcs                    = None
+    _columns                 = None
+
+    def __init__(self, funcs):
+        self.funcs    = funcs
+        self._columns = dict()
+
+    def keys(self):
+        return list(self.funcs.keys())
+
+    def __getitem__(self, key):
+        try:
+            return self._columns[key]
+        except KeyError:
+            column             = self.funcs[key]()
+            self._columns[key] = column
+            return column
+
+    def __delitem__(self, key):
+        if key not in self.funcs:
+            raise KeyError(key)
+
+        self._columns.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self.funcs
+
+    def __iter__(self):
+        return iter(self.funcs)
+
+    def __len__(self):
+        return len(self.funcs)
+
+    def __repr__(self):
+        return "LazyColumns({0}, computed: {1})".format(sorted(self.funcs), sorted(self._columns))
+
+# End class
+
+
+def _mac_hdr_addr(mac_hdrs, start):
+    """Internal method to compute the u64 values of the 6-byte MAC addresses
+    at byte start of the MAC headers (first byte is most significant).  Bytes
+    are shifted in to the column in place, so no temporaries are created.
+    """
+    addrs = np.zeros((len(mac_hdrs),), dtype=np.uint64)
+
+    for i in range(start, start + 6):
+        addrs <<= np.uint64(8)
+        addrs  |= mac_hdrs[:, i]
+
+    return addrs
+
+# End def
 
-        return np_arr_out
+
+def _mac_hdr_seq(mac_hdrs):
+    """Internal method to compute the sequence numbers of the MAC headers 
+    (upper 12 bits of the little-endian u16 sequence control field).
+    """
+    seq = mac_hdrs[:, 23].astype(np.uint16)
+
+    seq <<= np.uint16(8)
+    seq  |= mac_hdrs[:, 22]
+    seq >>= np.uint16(4)
+
+    return seq
+
+# End def
+
+
+# Number of records copied per chunk by gather_np_array()
+_GATHER_CHUNK_SIZE = 2**16
+
+
+def gather_np_array(log_bytes, byte_offsets, np_dt, new_fields=None):
+    """Gathers the records of numpy dtype np_dt at the given byte_offsets of
+    log_bytes in to a numpy array.
+
+    log_bytes is viewed as uint8 and the records are copied directly in to 
+    the output array by fancy indexing a sliding window view of log_bytes,
+    so no Python object is created per record.  If the byte_offsets have a
+    constant stride (of at least the record size), a read-only strided view 
+    of log_bytes is returned instead and nothing is copied.  Since the view
+    shares memory with log_bytes, it is only valid while log_bytes is not 
+    modified.
+
+    If new_fields is a dictionary with keys 'names' and 'formats' (see 
+    extend_np_dt()), the output array has room for these fields after each
+    record.  The new fields are not initialized.  The records are copied in
+    to the output array in chunks, so the gather needs no temporary copy of
+    the records.
+    """
+    if isinstance(log_bytes, np.ndarray):
+        log_bytes = np.ascontiguousarray(log_bytes).reshape(-1).view(np.uint8)
+    else:
+        log_bytes = np.frombuffer(log_bytes, dtype=np.uint8)
+
+    offsets  = np.asarray(byte_offsets, dtype=np.int64).reshape(-1)
+    num_recs = len(offsets)
+    rec_size = np_dt.itemsize
+
+    if new_fields is not None:
+        out_dt = _append_np_dt(np_dt, new_fields)
+    else:
+        out_dt = np_dt
+
+    if (num_recs == 0):
+        return np.zeros((0,), dtype=out_dt)
+
+    if (offsets.min() < 0) or ((offsets.max() + rec_size) > len(log_bytes)):
+        raise IndexError("ERROR: Log entry at offset {0} extends past end of log data".format(offsets.max()))
+
+    # Evenly spaced records are a strided view of the log data
+    stride = int(offsets[1] - offsets[0]) if (num_recs > 1) else rec_size
+
+    if (stride >= rec_size) and np.all(np.diff(offsets) == stride):
+        np_arr = np.ndarray((num_recs,), dtype=np_dt, buffer=log_bytes, offset=int(offsets[0]), strides=(stride,))
+        np_arr.flags.writeable = False
+
+        if new_fields is None:
+            return np_arr
+    else:
+        np_arr = None
+
+    # Element i of the window view is the record starting at byte i of the 
+    #   log data.  Fancy indexing copies each selected record with a single 
+    #   memcpy in to a new, contiguous array.
+    #   NOTE:  np.take() must not be used here; it copies the entire window 
+    #          view in to a contiguous array first.
+    rec_dt   = np.dtype((np.void, rec_size))
+    windows  = np.ndarray((len(log_bytes) - rec_size + 1,), dtype=rec_dt, buffer=log_bytes, strides=(1,))
+
+    if new_fields is None:
+        return windows[offsets].view(np_dt)
+
+    # Copy the records in to the start of each element of the output array
+    out_arr  = np.empty((num_recs,), dtype=out_dt)
+    out_recs = np.ndarray((num_recs,), dtype=rec_dt, buffer=out_arr, strides=(out_dt.itemsize,))
+
+    if np_arr is not None:
+        out_recs[...] = np_arr.view(rec_dt)
+    else:
+        for start in range(0, num_recs, _GATHER_CHUNK_SIZE):
+            end = start + _GATHER_CHUNK_SIZE
+            out_recs[start:end] = windows[offsets[start:end]]
+
+    return out_arr
+
+# End def
+
+
+def gather_np_array_fields(log_bytes, byte_offsets, np_dt, fields, new_fields=None):
+    """Gathers a subset of the fields of the records of numpy dtype np_dt at
+    the given byte_offsets of log_bytes in to a numpy array.
+
+    The returned array has a packed dtype with the requested fields (in the 
+    order of np_dt).  Only the byte ranges of the requested fields are read
+    from log_bytes:  fields that are adjacent in np_dt are gathered together
+    (see gather_np_array()) and copied in to the output array.  If 
+    new_fields is given, the output array has room for these fields after
+    the requested fields (see gather_np_array()).
+    """
+    names  = [n for n in np_dt.names if n in fields]
+    ranges = []
+
+    # Merge the byte ranges of adjacent fields:  [start, end] in the record
+    for n in names:
+        (field_dt, field_offset) = np_dt.fields[n][:2]
+
+        if ranges and (ranges[-1][1] == field_offset):
+            ranges[-1][1] += field_dt.itemsize
+        else:
+            ranges.append([field_offset, field_offset + field_dt.itemsize])
+
+    out_dt   = np.dtype({'names': names, 'formats': [np_dt.fields[n][0] for n in names]})
+    rec_size = out_dt.itemsize
+
+    if new_fields is not None:
+        out_dt = _append_np_dt(out_dt, new_fields)
+
+    offsets  = np.asarray(byte_offsets, dtype=np.int64).reshape(-1)
+    num_recs = len(offsets)
+
+    np_arr    = np.empty((num_recs,), dtype=out_dt)
+
+    if (rec_size == 0):
+        return np_arr
+
+    out_bytes = np_arr.view(np.uint8).reshape(num_recs, out_dt.itemsize)
+
+    # Gather in chunks of records so the temporary copies stay small
+    for chunk_start in range(0, num_recs, _GATHER_CHUNK_SIZE):
+        chunk_end     = min(chunk_start + _GATHER_CHUNK_SIZE, num_recs)
+        chunk_offsets = offsets[chunk_start:chunk_end]
+        out_start     = 0
+
+        for (start, end) in ranges:
+            size = end - start
+            recs = gather_np_array(log_bytes, chunk_offsets + start, np.dtype((np.void, size)))
+
+            out_bytes[chunk_start:chunk_end, out_start:(out_start + size)] = recs.view(np.uint8).reshape(-1, size)
+            out_start += size
+
+    return np_arr
 
 # End def
 
@@ -439,7 +787,7 @@ def extend_np_dt(dt_orig, new_fields=None):
 
     from collections import OrderedDict
 
-    if(type(dt_orig) is not np.dtype):
+    if(not isinstance(dt_orig, np.dtype)):
         raise Exception("ERROR: extend_np_dt requires valid numpy dtype as input")
     else:
         #Use ordered dictionary to preserve original field order (not required, just convenient)
@@ -468,6 +816,54 @@ def extend_np_dt(dt_orig, new_fields=None):
 # End def
 
 
+def _get_callback_fields(callbacks):
+    """Internal method to get the fields added by the gen_numpy callbacks 
+    that declare them (ie have 'output_fields' and 'output_formats' 
+    attributes) as a dictionary with keys 'names' and 'formats'.  Returns 
+    None if no callback declares its fields.
+    """
+    names   = []
+    formats = []
+
+    for callback in callbacks:
+        output_fields  = getattr(callback, 'output_fields', ())
+        output_formats = getattr(callback, 'output_formats', ())
+
+        if output_fields and (len(output_fields) == len(output_formats)):
+            names.extend(output_fields)
+            formats.extend(output_formats)
+
+    if names:
+        return {'names': names, 'formats': formats}
+    else:
+        return None
+
+# End def
+
+
+def _append_np_dt(dt_orig, new_fields):
+    """Internal method to extend a numpy dtype object with additional fields
+    (see extend_np_dt()).  Unlike extend_np_dt(), the existing fields keep 
+    their byte offsets and the new fields are packed after the end of the
+    original dtype, so the original dtype can still interpret the start of
+    each element.
+    """
+    names   = list(dt_orig.names)
+    formats = [dt_orig.fields[f][0] for f in names]
+    offsets = [dt_orig.fields[f][1] for f in names]
+    offset  = dt_orig.itemsize
+
+    for (name, fmt) in zip(new_fields['names'], new_fields['formats']):
+        names.append(name)
+        formats.append(fmt)
+        offsets.append(offset)
+        offset += np.dtype(fmt).itemsize
+
+    return np.dtype({'names':names, 'formats':formats, 'offsets':offsets, 'itemsize':offset})
+
+# End def
+
+
 #-----------------------------------------------------------------------------
 # NULL Log Entry Instance
 #-----------------------------------------------------------------------------
@@ -18,15 +18,40 @@ Naming convention:
                     general, this will be a interpreted / filtered version of
                     a raw_log_index.
 
+  LogIndex       -- A log index (raw or not) whose offsets are stored in
+                    uint32 / uint64 numpy arrays instead of Python lists:
+                      { <key> : numpy.array([<offsets>]) }
+                    All log index utilities accept both lists and numpy 
+                    arrays of offsets.
+
+  timestamp_index -- Index of the entries of a log index by timestamp:
+                      { <key> : (<sorted timestamps>, <offsets>) }
+                    Used to find the entries in a time window without 
+                    decoding the log data (see filter_log_index_by_time()).
+
+  addr_index     -- Index of the entries of a log index by the MAC addresses
+                    in their MAC headers:
+                      { <key> : { 'addr1' : (<addrs>, <starts>, <offsets>), ... } }
+                    (see gen_addr_index() and filter_log_index_by_addr()).
+
   numpy          -- A python package that allows easy and fast manipulation of 
                     large data sets.  You can find more documentaiton on numpy at:
                         http://www.numpy.org/
 ----
 """
 
-__all__ = ['gen_raw_log_index', 
+__all__ = ['LogIndex',
+           'gen_raw_log_index', 
+           'gen_partial_raw_log_index',
+           'recover_raw_log_index',
            'filter_log_index',
-           'log_data_to_np_arrays']
+           'gen_timestamp_index',
+           'filter_log_index_by_time',
+           'gen_addr_index',
+           'filter_log_index_by_addr',
+           'gen_log_summary',
+           'log_data_to_np_arrays',
+           'log_data_to_np_array_batches']
 
 
 #-----------------------------------------------------------------------------
@@ -57,14 +82,23 @@ class LogContainer(object):
     def is_valid(self):                               raise NotImplementedError
 
     def write_log_data(self, log_data, append=True):  raise NotImplementedError
-    def write_log_index(self, log_index=None):        raise NotImplementedError
+    def write_log_index(self, log_index=None, next_hdr_offset=None): raise NotImplementedError
+    def write_timestamp_index(self, timestamp_index=None): raise NotImplementedError
+    def write_addr_index(self, addr_index=None):      raise NotImplementedError
+    def write_log_summary(self, log_summary=None):    raise NotImplementedError
+    def write_np_arrays(self, np_arrays, fields=None): raise NotImplementedError
     def write_attr_dict(self, attr_dict):             raise NotImplementedError
 
     def replace_log_data(self, log_data):             raise NotImplementedError
 
     def get_log_data_size(self):                      raise NotImplementedError
-    def get_log_data(self):                           raise NotImplementedError    
+    def get_log_data(self, mmap=False):               raise NotImplementedError
+    def get_log_data_window(self, start=0, end=None): raise NotImplementedError
     def get_log_index(self, gen_index=True):          raise NotImplementedError
+    def get_timestamp_index(self, gen_index=True):    raise NotImplementedError
+    def get_addr_index(self, gen_index=True):         raise NotImplementedError
+    def get_log_summary(self, gen_summary=True):      raise NotImplementedError
+    def get_np_arrays(self, entry_types=None, fields=None, use_cache=True, save_cache=False): raise NotImplementedError
     def get_attr_dict(self):                          raise NotImplementedError
 
     def trim_log_data(self):                          raise NotImplementedError
@@ -73,10 +107,53 @@ class LogContainer(object):
 
 
 
+#-----------------------------------------------------------------------------
+# Log Index class
+#-----------------------------------------------------------------------------
+class LogIndex(dict):
+    """Log index with numpy arrays of offsets as values.
+
+    A LogIndex is a dictionary that stores the offsets of each key in a 1-D
+    numpy array.  The dtype of each array is uint32 if the largest offset 
+    can be represented in 32 bits, and uint64 otherwise.  Any sequence of 
+    offsets assigned to a LogIndex is converted to an array of this form; 
+    arrays that already have this form are stored without a copy.
+
+    For tens of millions of entries, numpy arrays use a fraction of the 
+    memory of Python lists of int and can be used directly by numpy 
+    operations (ie fancy indexing, np.concatenate, h5py datasets, etc).
+    """
+    def __init__(self, *args, **kwargs):
+        super(LogIndex, self).__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, offsets):
+        super(LogIndex, self).__setitem__(key, _index_array(offsets))
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def setdefault(self, key, offsets=None):
+        if key not in self:
+            self[key] = [] if offsets is None else offsets
+        return self[key]
+
+    def copy(self):
+        return LogIndex(self)
+
+    def num_entries(self):
+        """Total number of entries in the log index."""
+        return sum(len(v) for v in self.values())
+
+# End class()
+
+
+
 #-----------------------------------------------------------------------------
 # WLAN Exp Log Utilities
 #-----------------------------------------------------------------------------
-def gen_raw_log_index(log_data):
+def gen_raw_log_index(log_data, num_procs=1):
     """Parses binary WLAN Exp log data by recording the byte index of each
     entry. The byte indexes are returned in a dictionary with the entry
     type IDs as keys. This method does not unpack or interpret each log
@@ -92,6 +169,35 @@ def gen_raw_log_index(log_data):
         } entry_header;
 
     fmt_log_hdr = 'I H H' #if we were using struct.unpack
+
+    The index is generated by the numpy engine (see _gen_raw_log_index_np())
+    when numpy is available and is returned as a LogIndex.  Otherwise, the 
+    log data is walked one entry at a time in Python (see 
+    _gen_raw_log_index_py()) and the index values are lists.  Both engines 
+    produce the same offsets.
+
+    Attributes:
+        log_data         -- Binary WLAN Exp log data
+        num_procs        -- Number of processes used by the numpy engine to 
+                            index the log data (default is 1).  If None, one
+                            process per CPU is used.  See 
+                            _gen_raw_log_index_parallel() for more information.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return _gen_raw_log_index_py(log_data)
+
+    return _gen_raw_log_index_np(log_data, num_procs)
+
+# End gen_raw_log_index()
+
+
+def _gen_raw_log_index_py(log_data):
+    """Pure Python engine for gen_raw_log_index().
+
+    Walks the log data one entry header at a time.  See gen_raw_log_index()
+    for the description of the entry header.
     """
 
     offset         = 0
@@ -164,7 +270,466 @@ def gen_raw_log_index(log_data):
 
     return log_index
 
-# End gen_log_index_raw()
+# End _gen_raw_log_index_py()
+
+
+def _gen_raw_log_index_np(log_data, num_procs=1):
+    """Numpy engine for gen_raw_log_index().
+
+    Instead of walking the entry headers one at a time, this engine:
+        1) Finds every byte offset in the log data that could be the start of
+           an entry header (ie bytes [2:4] of the header are the delimiter)
+        2) Extracts the entry type and entry size columns for all candidate
+           headers at once
+        3) Follows the entry-length chain starting at offset 0 to separate
+           real entry headers from delimiter values that happen to appear in
+           entry payloads
+
+    The resulting index and errors are identical to _gen_raw_log_index_py(),
+    except that the index is a LogIndex.
+    """
+    (log_index, _) = gen_partial_raw_log_index(log_data, num_procs)
+
+    return log_index
+
+# End _gen_raw_log_index_np()
+
+
+def _gen_raw_log_index_parallel(log_bytes, num_procs):
+    """Find the entry headers of the log data using a pool of processes.
+
+    Attributes:
+        log_bytes        -- uint8 numpy array of the log data
+        num_procs        -- Number of processes in the pool
+
+    Returns:
+        numpy array of the offsets of the entry headers in the entry-length
+        chain starting at offset 0 (see _index_log_chunk())
+
+    The log data is copied once in to shared memory and split in to chunks.
+    Each process indexes a chunk independently:  since the process does not
+    know where the first entry header of its chunk is, it resynchronizes on
+    the first delimiter whose next few headers in the entry-length chain are
+    also valid (see _find_sync_index()).  The chunk indexes are then 
+    stitched together in order:  the header that follows the last entry of
+    a chunk must be the resynchronization point of the next chunk.  This is
+    the same offset calculation done by calc_next_entry_offset() when 
+    indexing log data read in multiple pieces.  If a chunk resynchronized
+    on the wrong header (ie a delimiter in an entry payload), that chunk is
+    re-indexed from the correct header by this process.
+    """
+    import numpy as np
+    import multiprocessing
+
+    log_len    = len(log_bytes)
+    num_chunks = 4 * num_procs
+    chunk_size = max(_PARALLEL_INDEX_MIN_CHUNK, -(-log_len // num_chunks))
+    chunks     = [(s, min(s + chunk_size, log_len)) for s in range(0, log_len, chunk_size)]
+
+    # Copy the log data in to memory shared by all processes
+    shared_log_data = multiprocessing.RawArray('B', log_len)
+    np.frombuffer(shared_log_data, dtype=np.uint8)[:] = log_bytes
+
+    pool = multiprocessing.Pool(num_procs, initializer=_init_index_worker, initargs=(shared_log_data,))
+
+    try:
+        results = pool.map(_index_log_chunk_worker, chunks)
+    finally:
+        pool.close()
+        pool.join()
+
+    # Stitch the chunk indexes together
+    hdr_offsets = [np.zeros((0,), dtype=np.int64)]
+    next_hdr    = 0
+
+    for ((chunk_start, chunk_end), (sync_offset, chunk_hdrs)) in zip(chunks, results):
+        # Skip chunks that are completely covered by the previous entry
+        if (next_hdr >= chunk_end):
+            continue
+
+        # Re-index chunks that did not resynchronize on the entry-length chain
+        if (sync_offset != next_hdr):
+            (_, chunk_hdrs) = _index_log_chunk(log_bytes, chunk_start, chunk_end, sync_offset=next_hdr)
+
+        if (len(chunk_hdrs) == 0):
+            break
+
+        hdr_offsets.append(chunk_hdrs.astype(np.int64))
+        next_hdr = _calc_next_hdr_offset(log_bytes, chunk_hdrs[-1])
+
+        # Stop if the entry-length chain ended inside of the chunk
+        if (next_hdr < chunk_end):
+            break
+
+    return np.concatenate(hdr_offsets)
+
+# End _gen_raw_log_index_parallel()
+
+
+# Offsets of the address fields in an 802.11 MAC header (see gen_addr_index())
+_MAC_HDR_ADDR_OFFSETS = [('addr1', 4), ('addr2', 10), ('addr3', 16)]
+
+# Element of a log summary (see gen_log_summary())
+_LOG_SUMMARY_DT = [('entry_type_id',   'uint16'),
+                   ('num_entries',     'uint64'),
+                   ('num_bytes',       'uint64'),
+                   ('first_timestamp', 'uint64'),
+                   ('last_timestamp',  'uint64')]
+
+# Minimum number of bytes of log data per chunk for parallel indexing
+_PARALLEL_INDEX_MIN_CHUNK = 2**22
+
+# Log data shared with the processes of _gen_raw_log_index_parallel()
+_shared_log_bytes         = None
+
+
+def _init_index_worker(shared_log_data):
+    """Initialize a process of the _gen_raw_log_index_parallel() pool."""
+    import numpy as np
+    global _shared_log_bytes
+
+    _shared_log_bytes = np.frombuffer(shared_log_data, dtype=np.uint8)
+
+
+def _index_log_chunk_worker(chunk):
+    """Index one chunk of the shared log data (see _index_log_chunk())."""
+    (sync_offset, hdr_offsets) = _index_log_chunk(_shared_log_bytes, chunk[0], chunk[1])
+
+    # Return the offsets in the smallest dtype to reduce inter-process traffic
+    return (sync_offset, _index_array(hdr_offsets))
+
+
+# Minimum number of entries per chunk for parallel numpy array generation
+_PARALLEL_NP_MIN_CHUNK    = 2**16
+
+# Output memory shared with the processes of _log_data_to_np_arrays_parallel()
+_shared_out_bytes         = None
+
+
+def _init_np_arrays_worker(shared_log_data, shared_out_data):
+    """Initialize a process of the _log_data_to_np_arrays_parallel() pool.
+
+    shared_log_data is either the shared log data or a tuple (filename, 
+    offset, size) of the file the log data is mapped from.
+    """
+    import numpy as np
+    global _shared_log_bytes, _shared_out_bytes
+
+    if type(shared_log_data) is tuple:
+        (filename, offset, size) = shared_log_data
+        _shared_log_bytes = np.memmap(filename, dtype=np.uint8, mode='r', offset=offset, shape=(size,))
+    else:
+        _shared_log_bytes = np.frombuffer(shared_log_data, dtype=np.uint8)
+
+    _shared_out_bytes = np.frombuffer(shared_out_data, dtype=np.uint8)
+
+
+def _np_arrays_chunk_worker(task):
+    """Generate the numpy array of one chunk of offsets of an entry type in
+    its place in the shared output memory.
+    """
+    import numpy as np
+
+    (entry_type, fields, offsets, out_offset) = task
+
+    np_arr  = entry_type.generate_numpy_array(_shared_log_bytes, offsets, fields)
+    out_arr = np.frombuffer(_shared_out_bytes, dtype=np_arr.dtype, count=len(np_arr), offset=out_offset)
+
+    out_arr[...] = np_arr
+
+
+def gen_partial_raw_log_index(log_data, num_procs=1):
+    """Generate the raw log index of log data that does not necessarily end on
+    a log entry boundary.
+
+    Attributes:
+        log_data         -- Binary WLAN Exp log data, starting with an entry header
+        num_procs        -- Number of processes used to index the log data
+                            (see gen_raw_log_index())
+
+    Returns:
+        Tuple (raw_log_index, next_hdr_offset):
+            raw_log_index    -- LogIndex of the complete entries in log_data
+            next_hdr_offset  -- Offset of the header of the first entry that is 
+                                not in the raw_log_index (ie the entry is 
+                                incomplete or starts after the end of log_data)
+
+    This is used to index log data that is read in multiple pieces (ie from
+    successive calls to log_get_all_new()).  Indexing of the next piece of 
+    log data should start at next_hdr_offset and the offsets of the 
+    resulting raw log index translated by next_hdr_offset (see 
+    merge_log_indexes()).  An entry split across two pieces of log data is
+    then indexed with the second piece.
+
+    This method implements the numpy engine of gen_raw_log_index() (see 
+    _gen_raw_log_index_np()).  The errors raised are identical to 
+    _gen_raw_log_index_py().
+    """
+    import multiprocessing
+
+    hdr_size    = 8
+    log_bytes   = _log_data_as_np(log_data)
+    log_len     = len(log_bytes)
+
+    # Stop here if the log data does not contain a complete entry header
+    if (log_len < hdr_size):
+        return (LogIndex(), 0)
+
+    if num_procs is None:
+        num_procs = multiprocessing.cpu_count()
+
+    # Find the headers of the entry-length chain starting at offset 0
+    if (num_procs > 1) and (log_len >= (num_procs * _PARALLEL_INDEX_MIN_CHUNK)):
+        hdr_offsets = _gen_raw_log_index_parallel(log_bytes, num_procs)
+    else:
+        (_, hdr_offsets) = _index_log_chunk(log_bytes, 0, log_len, sync_offset=0)
+
+    if (len(hdr_offsets) == 0):
+        raise Exception("ERROR: Log file didn't start with valid entry header (offset 0)!")
+
+    # Check how the chain ended:
+    #   - The last entry is incomplete:      Remove it from the index
+    #   - The next entry header incomplete:  Normal end of the log data
+    #   - Otherwise:                         The next entry header is not valid
+    next_hdr_offset = _calc_next_hdr_offset(log_bytes, hdr_offsets[-1])
+
+    if (next_hdr_offset > log_len):
+        next_hdr_offset = int(hdr_offsets[-1])
+        hdr_offsets     = hdr_offsets[:-1]
+    elif ((next_hdr_offset + hdr_size) <= log_len):
+        raise Exception("ERROR: Log file didn't start with valid entry header (offset %d)!" % (next_hdr_offset))
+
+    entry_type_ids = _get_u16_column(log_bytes, hdr_offsets + 4)
+
+    log_index = _group_offsets_by_type(entry_type_ids, hdr_offsets + hdr_size)
+
+    # Remove all NULL entries from the log_index
+    try:
+        del log_index[0]
+    except KeyError:
+        pass
+
+    return (log_index, next_hdr_offset)
+
+# End gen_partial_raw_log_index()
+
+
+def recover_raw_log_index(log_data, sync_depth=4):
+    """Generate the raw log index of damaged log data.
+
+    Attributes:
+        log_data         -- Binary WLAN Exp log data
+        sync_depth       -- Number of entry headers that must be consistent to
+                            resynchronize after a damaged region
+
+    Returns:
+        Tuple (raw_log_index, damaged_ranges):
+            raw_log_index    -- LogIndex of the complete entries in log_data
+            damaged_ranges   -- List of (start, end) byte offsets of the 
+                                regions of log_data that could not be indexed
+
+    Unlike gen_raw_log_index(), which raises an exception at the first 
+    invalid entry header, this method skips damaged regions.  When the 
+    entry-length chain breaks, indexing resumes at the next entry header that 
+    is followed by (sync_depth - 1) valid entry headers.  An incomplete entry
+    at the end of the log data is not considered damaged.  
+
+    NOTE:  An entry whose payload was overwritten is only detected if the 
+    damage breaks the entry-length chain.  Entries recovered between damaged
+    regions should be treated with care.
+    """
+    import numpy as np
+
+    hdr_size       = 8
+    log_bytes      = _log_data_as_np(log_data)
+    log_len        = len(log_bytes)
+    damaged_ranges = []
+
+    if (log_len < hdr_size):
+        return (LogIndex(), damaged_ranges)
+
+    hdr_offsets = _find_entry_header_candidates(log_bytes)
+    next_hdrs   = hdr_offsets + hdr_size + _get_u16_column(log_bytes, hdr_offsets + 6)
+    num_hdrs    = len(hdr_offsets)
+
+    (consistent, next_idx) = _find_consistent_headers(hdr_offsets, next_hdrs, log_len, log_len, sync_depth)
+
+    sync_idxs    = np.flatnonzero(consistent)
+    sync_offsets = hdr_offsets[sync_idxs]
+
+    # Candidates that do not link to the following candidate.  Between breaks
+    #   the chain is a contiguous run of candidates.
+    breaks = np.append(np.flatnonzero(next_idx[:-1] != np.arange(1, num_hdrs)), num_hdrs - 1)
+
+    runs         = []
+    damage_start = 0                 # Start of the region not yet indexed
+    search_start = 0                 # Offset to resynchronize from
+    truncated    = False             # Chain ended with an incomplete entry
+
+    # The log data normally starts with an entry header
+    if (num_hdrs > 0) and (hdr_offsets[0] == 0):
+        idx = 0
+    else:
+        idx = None
+
+    while True:
+        if idx is None:
+            i = np.searchsorted(sync_offsets, search_start)
+
+            if (i == len(sync_offsets)):
+                if not truncated:
+                    damaged_ranges.append((damage_start, log_len))
+                break
+
+            idx = int(sync_idxs[i])
+            damaged_ranges.append((damage_start, int(hdr_offsets[idx])))
+
+        num_runs = len(runs)
+
+        # Follow the chain one run of candidates at a time
+        while True:
+            brk = int(breaks[np.searchsorted(breaks, idx)])
+            runs.append((idx, brk + 1))
+
+            if (next_idx[brk] == num_hdrs):
+                break
+
+            idx = int(next_idx[brk])
+
+        # Check how the chain ended (see gen_partial_raw_log_index())
+        next_hdr_offset = int(next_hdrs[brk])
+        idx             = None
+
+        if (next_hdr_offset > log_len):
+            runs[-1]     = (runs[-1][0], brk)
+
+            if truncated and (sum(end - start for (start, end) in runs[num_runs:]) == 0):
+                # Resynchronized on a delimiter in the payload of an 
+                #   incomplete entry (ie the chain never reached a complete
+                #   entry).  Keep searching from the start of the damage.
+                damaged_ranges.pop()
+                search_start = int(hdr_offsets[brk]) + 1
+                continue
+
+            damage_start = int(hdr_offsets[brk])
+            search_start = damage_start + 1
+            truncated    = True
+        elif ((next_hdr_offset + hdr_size) <= log_len):
+            damage_start = next_hdr_offset
+            search_start = next_hdr_offset
+            truncated    = False
+        else:
+            break
+
+    if runs:
+        hdr_offsets = hdr_offsets[np.concatenate([np.arange(start, end) for (start, end) in runs])]
+    else:
+        hdr_offsets = hdr_offsets[:0]
+
+    entry_type_ids = _get_u16_column(log_bytes, hdr_offsets + 4)
+
+    log_index = _group_offsets_by_type(entry_type_ids, hdr_offsets + hdr_size)
+
+    # Remove all NULL entries from the log_index
+    try:
+        del log_index[0]
+    except KeyError:
+        pass
+
+    return (log_index, damaged_ranges)
+
+# End recover_raw_log_index()
+
+
+def gen_log_summary(log_data, chunk_size=2**26):
+    """Generate a summary of the entries in the log data without generating
+    a log index.
+
+    Attributes:
+        log_data         -- Binary WLAN Exp log data
+        chunk_size       -- Number of bytes of log data scanned at a time.  
+                            This limits the size of the temporary arrays.
+
+    Returns:
+        log_summary      -- numpy structured array with one element per entry
+                            type in the log data, sorted by entry type ID:
+                              'entry_type_id'    -- Entry type ID
+                              'num_entries'      -- Number of entries
+                              'num_bytes'        -- Total size of the entries
+                                                    (including entry headers)
+                              'first_timestamp'  -- Timestamp of the first entry
+                              'last_timestamp'   -- Timestamp of the last entry
+
+    Entries are counted in the same way as gen_raw_log_index() (ie NULL 
+    entries and an incomplete entry at the end of the log data are not 
+    counted) and the same errors are raised.
+    """
+    import numpy as np
+
+    hdr_size   = 8
+    log_bytes  = _log_data_as_np(log_data)
+    log_len    = len(log_bytes)
+
+    num_types  = 2**16
+    counts     = np.zeros((num_types,), dtype=np.uint64)
+    num_bytes  = np.zeros((num_types,), dtype=np.uint64)
+    first_ts   = np.zeros((num_types,), dtype=np.uint64)
+    last_ts    = np.zeros((num_types,), dtype=np.uint64)
+    seen       = np.zeros((num_types,), dtype=bool)
+
+    next_hdr_offset = 0
+
+    while ((next_hdr_offset + hdr_size) <= log_len):
+        chunk_end = min(next_hdr_offset + chunk_size, log_len)
+
+        (_, hdr_offsets) = _index_log_chunk(log_bytes, next_hdr_offset, chunk_end, sync_offset=next_hdr_offset)
+
+        if (len(hdr_offsets) == 0):
+            raise Exception("ERROR: Log file didn't start with valid entry header (offset %d)!" % (next_hdr_offset))
+
+        entry_type_ids  = _get_u16_column(log_bytes, hdr_offsets + 4)
+        entry_sizes     = _get_u16_column(log_bytes, hdr_offsets + 6).astype(np.int64) + hdr_size
+        next_hdr_offset = int(hdr_offsets[-1] + entry_sizes[-1])
+
+        # Remove the last entry if it is incomplete
+        if (next_hdr_offset > log_len):
+            hdr_offsets    = hdr_offsets[:-1]
+            entry_type_ids = entry_type_ids[:-1]
+            entry_sizes    = entry_sizes[:-1]
+
+        # Every entry type except NULL starts with a uint64 timestamp
+        has_ts          = (entry_type_ids != 0) & (entry_sizes >= (hdr_size + 8))
+        timestamps      = np.zeros((len(hdr_offsets),), dtype=np.uint64)
+        timestamps[has_ts] = _get_le_column(log_bytes, hdr_offsets[has_ts] + hdr_size, np.uint64)
+
+        counts    += np.bincount(entry_type_ids, minlength=num_types).astype(np.uint64)
+        num_bytes += np.bincount(entry_type_ids, weights=entry_sizes, minlength=num_types).astype(np.uint64)
+
+        # First / last entry of each type in the chunk
+        (type_ids, first_idx) = np.unique(entry_type_ids, return_index=True)
+        (_, last_idx)         = np.unique(entry_type_ids[::-1], return_index=True)
+        last_idx              = len(entry_type_ids) - 1 - last_idx
+
+        new_types             = ~seen[type_ids]
+        first_ts[type_ids[new_types]] = timestamps[first_idx[new_types]]
+        last_ts[type_ids]     = timestamps[last_idx]
+        seen[type_ids]        = True
+
+    # Remove NULL entries from the summary
+    counts[0]   = 0
+    type_ids    = np.flatnonzero(counts)
+
+    log_summary = np.zeros((len(type_ids),), dtype=_LOG_SUMMARY_DT)
+
+    log_summary['entry_type_id']   = type_ids
+    log_summary['num_entries']     = counts[type_ids]
+    log_summary['num_bytes']       = num_bytes[type_ids]
+    log_summary['first_timestamp'] = first_ts[type_ids]
+    log_summary['last_timestamp']  = last_ts[type_ids]
+
+    return log_summary
+
+# End gen_log_summary()
 
 
 def filter_log_index(log_index, include_only=None, exclude=None, merge=None):
@@ -250,6 +815,11 @@ def filter_log_index(log_index, include_only=None, exclude=None, merge=None):
     dictionary.  It is then up to the consumer to check if the number of
     entries for a given 'name' is zero (ie the list is empty).
 
+    If log_index is a LogIndex (or all of its values are numpy arrays), the
+    output is a LogIndex (ie all offsets, including merged offsets, are 
+    numpy arrays) and merged offsets are a k-way merge of the sorted offset
+    arrays (see _merge_offsets()).  Otherwise, the output values are lists.
+
     Combined behavior:
 
         x = filter_log_index(log_index, include_only=['M'], merge={'M': ['A','C']}
@@ -265,7 +835,8 @@ def filter_log_index(log_index, include_only=None, exclude=None, merge=None):
     """
     from .entry_types import log_entry_types
 
-    ret_log_index = {}
+    use_np        = _is_array_log_index(log_index)
+    index_type    = LogIndex if use_np else dict
 
     if (include_only is not None) and (type(include_only) is not list):
         raise TypeError("Parameter 'include' must be a list.\n")
@@ -278,7 +849,7 @@ def filter_log_index(log_index, include_only=None, exclude=None, merge=None):
 
     # Start by creating a new dictionary with the same values as the log_index input
     #  but using the WlanExpLogEntryType instances as keys
-    ret_log_index = {log_entry_types[k] : log_index[k] for k in log_index.keys()}
+    ret_log_index = index_type({log_entry_types[k] : log_index[k] for k in log_index.keys()})
 
     # Filter the log_index
     try:
@@ -286,10 +857,10 @@ def filter_log_index(log_index, include_only=None, exclude=None, merge=None):
         if merge is not None:
             # For each new merged index output
             for k in merge.keys():
-                new_index = []
+                new_offsets = []
                 for v in merge[k]:
                     try:
-                        new_index += ret_log_index[v]
+                        new_offsets.append(ret_log_index[v])
                     except KeyError:
                         msg  = "WARNING:  {0} does ".format(v)
                         msg += "not exist in log index.  Ignoring for merge.\n"
@@ -297,17 +868,17 @@ def filter_log_index(log_index, include_only=None, exclude=None, merge=None):
 
                 # Add the new merged index lists to the output dictionary
                 # Use the type instance corresponding to the user-supplied string as the key
-                ret_log_index[log_entry_types[k]] = sorted(new_index)
+                ret_log_index[log_entry_types[k]] = _merge_offsets(new_offsets, use_np)
 
         # Filter the resulting log index by 'include' / 'exclude' lists
         if include_only is not None:
-            new_log_index = {}
+            new_log_index = index_type()
 
+            # Entry types hash by name, so the registry entry of each name 
+            #   finds its offsets with one dictionary lookup
             for entry_name in include_only:
-                new_log_index[log_entry_types[entry_name]] = []
-                for k in ret_log_index.keys():
-                    if k == entry_name:
-                        new_log_index[k] = ret_log_index[k]
+                entry_type                = log_entry_types[entry_name]
+                new_log_index[entry_type] = ret_log_index.get(entry_type, [])
 
             ret_log_index = new_log_index
         else:
@@ -330,20 +901,414 @@ def filter_log_index(log_index, include_only=None, exclude=None, merge=None):
 # End filter_log_index()
 
 
-def log_data_to_np_arrays(log_data, log_index):
-    """Generate numpy structured arrays using log_data and a log_index."""
+def log_data_to_np_arrays(log_data, log_index, fields=None, num_procs=1):
+    """Generate numpy structured arrays using log_data and a log_index.
+
+    Attributes:
+        log_data     -- Binary WLAN Exp log data
+        log_index    -- Filtered log index (see filter_log_index())
+        fields       -- Fields to include in the numpy arrays.  Either a list
+                        of field names used for every entry type or a 
+                        dictionary of lists of field names keyed by entry
+                        type name.  Entry types not in the dictionary include
+                        all fields.  By default, all fields are included.
+        num_procs    -- Number of processes used to generate the numpy 
+                        arrays (default is 1).  If None, one process per CPU
+                        is used.  See _log_data_to_np_arrays_parallel() for 
+                        more information.
+
+    Only the requested fields are read from the log data (see 
+    WlanExpLogEntryType.generate_numpy_array()), so the time and memory
+    needed scale with the size of the requested fields.  For example:
+        log_data_to_np_arrays(log_data, log_index, fields={'RX_OFDM': ['timestamp', 'length', 'addr2']})
+    does not copy the 'chan_est' or 'mac_payload' fields of RX_OFDM entries.
+    """
+    import multiprocessing
+
+    if num_procs is None:
+        num_procs = multiprocessing.cpu_count()
+
+    if (num_procs > 1):
+        return _log_data_to_np_arrays_parallel(log_data, log_index, fields, num_procs)
+
     entries_nd = dict()
 
     for k in log_index.keys():
         # Build a structured array with one element for each byte range enumerated above
         # Store each array in a dictionary indexed by the log entry type
-        entries_nd[k] = k.generate_numpy_array(log_data, log_index[k])
+        entries_nd[k] = k.generate_numpy_array(log_data, log_index[k], _get_entry_type_fields(fields, k))
 
     return entries_nd
 
 # End log_data_to_np_arrays()
 
 
+def _get_entry_type_fields(fields, entry_type):
+    """Internal method to get the fields of an entry type to include in its 
+    numpy array (see log_data_to_np_arrays()).
+    """
+    if type(fields) is dict:
+        return fields.get(entry_type)
+    else:
+        return fields
+
+# End def
+
+
+def _log_data_to_np_arrays_parallel(log_data, log_index, fields, num_procs):
+    """Generate the numpy arrays of log_data_to_np_arrays() using a pool of
+    processes.
+
+    Attributes:
+        log_data         -- Binary WLAN Exp log data
+        log_index        -- Filtered log index (see filter_log_index())
+        fields           -- Fields to include in the numpy arrays (see 
+                            log_data_to_np_arrays())
+        num_procs        -- Number of processes in the pool
+
+    Returns:
+        Dictionary of numpy structured arrays keyed by entry type (same as 
+        log_data_to_np_arrays())
+
+    The offsets of each entry type are split in to chunks of at least 
+    _PARALLEL_NP_MIN_CHUNK entries and each process generates the numpy 
+    array of one chunk at a time.  The processes read the log data from 
+    memory shared by all processes.  If the log data is a numpy memmap of a 
+    file (eg from HDF5LogContainer.get_log_data(mmap=True)), each process 
+    maps the same file instead, so the log data is not copied.
+
+    The output arrays are allocated in shared memory before the processes
+    start and each process writes its chunk directly in to its place in the
+    output array, so the chunks are not copied again (or sent between 
+    processes) to assemble the output arrays.
+    """
+    import mmap
+    import numpy as np
+    import multiprocessing
+
+    entries_nd = dict()
+    tasks      = []
+    out_size   = 0
+
+    # Allocate the space of each output array
+    #   The dtype of each output array is the dtype of the array of its 
+    #   first entry.  Arrays are aligned to 8 bytes in the shared memory.
+    for k in log_index.keys():
+        offsets  = _index_array(log_index[k])
+        k_fields = _get_entry_type_fields(fields, k)
+        np_dt    = k.generate_numpy_array(log_data, offsets[:1], k_fields).dtype
+
+        entries_nd[k] = (out_size, len(offsets), np_dt)
+
+        chunk_size = max(_PARALLEL_NP_MIN_CHUNK, -(-len(offsets) // (4 * num_procs)))
+
+        for start in range(0, len(offsets), chunk_size):
+            chunk_offsets = offsets[start:(start + chunk_size)]
+            tasks.append((k, k_fields, chunk_offsets, out_size + (start * np_dt.itemsize)))
+
+        out_size += -(-(len(offsets) * np_dt.itemsize) // 8) * 8
+
+    shared_out_data = multiprocessing.RawArray('B', max(out_size, 1))
+
+    # Share the log data with the processes
+    if isinstance(log_data, np.memmap) and (log_data.filename is not None) and isinstance(log_data.base, mmap.mmap):
+        shared_log_data = (log_data.filename, log_data.offset, len(log_data))
+    else:
+        log_bytes       = _log_data_as_np(log_data)
+        shared_log_data = multiprocessing.RawArray('B', len(log_bytes))
+        np.frombuffer(shared_log_data, dtype=np.uint8)[:] = log_bytes
+
+    pool = multiprocessing.Pool(num_procs, initializer=_init_np_arrays_worker, initargs=(shared_log_data, shared_out_data))
+
+    try:
+        pool.map(_np_arrays_chunk_worker, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+    # The output arrays are views of the shared memory
+    for (k, (out_offset, num_entries, np_dt)) in entries_nd.items():
+        entries_nd[k] = np.frombuffer(shared_out_data, dtype=np_dt, count=num_entries, offset=out_offset)
+
+    return entries_nd
+
+# End _log_data_to_np_arrays_parallel()
+
+
+
+def log_data_to_np_array_batches(log_data, entry_types=None, fields=None, batch_size=2**16, window_size=2**26):
+    """Generate numpy structured arrays of fixed-size batches of entries by
+    reading the log data one window at a time.
+
+    Attributes:
+        log_data     -- Binary WLAN Exp log data or a LogContainer of the log
+                        data (eg an HDF5LogContainer)
+        entry_types  -- List of WlanExpLogEntryTypes (or their names) to 
+                        include.  By default, all entry types are included.
+        fields       -- Fields to include in the numpy arrays (see 
+                        log_data_to_np_arrays())
+        batch_size   -- Number of entries in each batch
+        window_size  -- Number of bytes of log data read at a time
+
+    Yields:
+        Tuples (entry_type, np_arr):
+            entry_type   -- WlanExpLogEntryType of the entries in the batch
+            np_arr       -- numpy structured array of the next batch_size 
+                            entries of entry_type (in log order).  The last
+                            batch of each entry type can be smaller.
+
+    Only one window of the log data and less than batch_size entries of each
+    entry type are kept in memory, so logs larger than memory can be 
+    processed in batches.  Each window ends at the last complete entry in 
+    the window; an entry that straddles the end of a window is read with the
+    next window (see gen_partial_raw_log_index()).  An incomplete entry at
+    the end of the log data is ignored and the errors raised for invalid log
+    data are the same as gen_raw_log_index().  For example, to count the RX
+    entries of each rate:
+
+        counts = numpy.zeros((9,), dtype=numpy.uint64)
+
+        for (_, rx) in log_data_to_np_array_batches(log_container, ['RX_OFDM'], ['rate']):
+            counts += numpy.bincount(rx['rate'], minlength=9).astype(numpy.uint64)
+    """
+    import numpy as np
+
+    hdr_size    = 8
+
+    # Every entry (max 2^16 - 1 bytes + header) must fit in a window
+    window_size = max(window_size, 2**17)
+
+    if isinstance(log_data, LogContainer):
+        log_size   = log_data.get_log_data_size()
+        get_window = log_data.get_log_data_window
+    else:
+        log_bytes  = _log_data_as_np(log_data)
+        log_size   = len(log_bytes)
+        get_window = (lambda start, end: log_bytes[start:end])
+
+    # Entries of each entry type not yet yielded:  [list of arrays, number of entries]
+    pending = dict()
+    start   = 0
+
+    while ((start + hdr_size) <= log_size):
+        window = get_window(start, min(start + window_size, log_size))
+
+        (raw_log_index, next_hdr_offset) = gen_partial_raw_log_index(window)
+
+        # Only an incomplete entry at the end of the log data is left
+        if (next_hdr_offset == 0):
+            break
+
+        log_index = filter_log_index(raw_log_index, include_only=entry_types)
+        np_arrays = log_data_to_np_arrays(window, log_index, fields)
+
+        for (k, np_arr) in np_arrays.items():
+            if (len(np_arr) == 0):
+                continue
+
+            # Read-only arrays are views of the window
+            if not np_arr.flags.writeable:
+                np_arr = np_arr.copy()
+
+            (arrays, num_entries) = pending.get(k, ([], 0))
+            arrays.append(np_arr)
+            num_entries += len(np_arr)
+
+            if (num_entries >= batch_size):
+                np_arr      = np.concatenate(arrays) if (len(arrays) > 1) else arrays[0]
+                num_batched = num_entries - (num_entries % batch_size)
+
+                for i in range(0, num_batched, batch_size):
+                    yield (k, np_arr[i:(i + batch_size)])
+
+                arrays      = [np_arr[num_batched:].copy()] if (num_batched < num_entries) else []
+                num_entries = num_entries - num_batched
+
+            pending[k] = (arrays, num_entries)
+
+        start += next_hdr_offset
+
+    # Yield the remaining entries of each entry type
+    for (k, (arrays, num_entries)) in pending.items():
+        if (num_entries > 0):
+            yield (k, np.concatenate(arrays) if (len(arrays) > 1) else arrays[0])
+
+# End log_data_to_np_array_batches()
+
+
+
+def gen_timestamp_index(log_data, log_index, offset=0):
+    """Generate the timestamp index of the entries in a log index.
+
+    Attributes:
+        log_data         -- Binary WLAN Exp log data
+        log_index        -- Log index (raw or filtered) of the log data
+        offset           -- Offset of log_data in the log data indexed by 
+                            log_index.  This allows the timestamps to be read
+                            from a window of the log data (ie only the 
+                            entries in the window can be in log_index).
+
+    Returns:
+        timestamp_index  -- Dictionary with the keys of log_index:
+                              { <key> : (<timestamps>, <offsets>) }
+                            where <timestamps> is a sorted uint64 numpy array
+                            and <offsets> is a numpy array of the offset of 
+                            the entry with each timestamp.
+
+    Every log entry type starts with a uint64 'timestamp' field, so the 
+    timestamps are read directly from the log data without decoding the 
+    entries.  Entries with equal timestamps remain in log order.
+    """
+    import numpy as np
+
+    log_bytes       = _log_data_as_np(log_data)
+    timestamp_index = {}
+
+    for k, v in log_index.items():
+        offsets    = _index_array(v)
+        timestamps = _get_le_column(log_bytes, offsets.astype(np.int64) - offset, np.uint64)
+
+        timestamp_index[k] = _sort_by_timestamp(timestamps, offsets)
+
+    return timestamp_index
+
+# End gen_timestamp_index()
+
+
+def filter_log_index_by_time(timestamp_index, start=None, end=None):
+    """Generate the log index of the entries in a time window.
+
+    Attributes:
+        timestamp_index  -- Timestamp index (see gen_timestamp_index())
+        start            -- First timestamp of the window (microseconds); 
+                            None for the start of the log data
+        end              -- End of the window (microseconds, exclusive);
+                            None for the end of the log data
+
+    Returns:
+        LogIndex with the keys of timestamp_index and the offsets of the 
+        entries with start <= timestamp < end, in log order.
+
+    The window of each key is found by binary search of the sorted 
+    timestamps, so only the matching offsets are copied.
+    """
+    import numpy as np
+
+    log_index = LogIndex()
+
+    for k, (timestamps, offsets) in timestamp_index.items():
+        if start is None:
+            first = 0
+        else:
+            first = np.searchsorted(timestamps, np.uint64(start), side='left')
+
+        if end is None:
+            last  = len(timestamps)
+        else:
+            last  = np.searchsorted(timestamps, np.uint64(end), side='left')
+
+        log_index[k] = np.sort(offsets[first:last])
+
+    return log_index
+
+# End filter_log_index_by_time()
+
+
+def gen_addr_index(log_data, log_index, offset=0):
+    """Generate the MAC address index of the entries in a log index.
+
+    Attributes:
+        log_data         -- Binary WLAN Exp log data
+        log_index        -- Log index (raw or filtered) of the log data
+        offset           -- Offset of log_data in the log data indexed by 
+                            log_index (see gen_timestamp_index())
+
+    Returns:
+        addr_index       -- Dictionary with the keys of log_index whose entry
+                            types record a MAC header (ie TX, TX_LOW, RX_OFDM
+                            and RX_DSSS):
+                              { <key> : { 'addr1' : (<addrs>, <starts>, <offsets>),
+                                          'addr2' : ( ... ),
+                                          'addr3' : ( ... ) } }
+                            <addrs> is a sorted uint64 numpy array of the 
+                            distinct addresses in the MAC header field.  The
+                            offsets of the entries with address <addrs>[i]
+                            are <offsets>[<starts>[i]:<starts>[i+1]], in log
+                            order.
+
+    Addresses are read directly from the MAC header in the 'mac_payload' 
+    field of each entry, in the same u64 representation as the 'addr1', 
+    'addr2' and 'addr3' fields added by np_array_add_MAC_addr_fields().
+    The number of entries per address is np.diff(<starts>).
+    """
+    import numpy as np
+    from .entry_types import WlanExpLogEntryType, log_entry_types, np_array_add_MAC_addr_fields
+
+    log_bytes  = _log_data_as_np(log_data)
+    addr_index = {}
+
+    for k, v in log_index.items():
+        if isinstance(k, WlanExpLogEntryType):
+            entry_type = k
+        else:
+            try:
+                entry_type = log_entry_types[k]
+            except KeyError:
+                continue
+
+        if np_array_add_MAC_addr_fields not in entry_type.gen_numpy_callbacks:
+            continue
+
+        mac_hdrs = _index_array(v).astype(np.int64) - offset + entry_type.get_field_offsets()['mac_payload']
+
+        addr_index[k] = {}
+
+        for (addr_field, addr_offset) in _MAC_HDR_ADDR_OFFSETS:
+            addrs = _get_mac_addr_column(log_bytes, mac_hdrs + addr_offset)
+            addr_index[k][addr_field] = _group_offsets_by_addr(addrs, _index_array(v))
+
+    return addr_index
+
+# End gen_addr_index()
+
+
+def filter_log_index_by_addr(addr_index, addr, addr_field):
+    """Generate the log index of the entries with a MAC address.
+
+    Attributes:
+        addr_index       -- MAC address index (see gen_addr_index())
+        addr             -- MAC address (u64) or list of MAC addresses
+        addr_field       -- MAC header field of the address:  'addr1', 
+                            'addr2' or 'addr3'
+
+    Returns:
+        LogIndex with the keys of addr_index and the offsets of the entries 
+        with any of the addresses in addr_field, in log order.
+
+    Each address is found by binary search, so only the offsets of the 
+    matching entries are copied.
+    """
+    import numpy as np
+
+    addrs     = np.unique(np.asarray(addr, dtype=np.uint64).reshape(-1))
+    log_index = LogIndex()
+
+    for k, v in addr_index.items():
+        (key_addrs, starts, offsets) = v[addr_field]
+
+        idx          = np.searchsorted(key_addrs, addrs)
+        found        = (idx < len(key_addrs))
+        found[found] = (key_addrs[idx[found]] == addrs[found])
+
+        matches      = [offsets[starts[i]:starts[i + 1]] for i in idx[found]]
+
+        log_index[k] = np.sort(np.concatenate([offsets[:0]] + matches))
+
+    return log_index
+
+# End filter_log_index_by_addr()
+
+
 
 #-----------------------------------------------------------------------------
 # WLAN Exp Log Misc Utilities
@@ -364,17 +1329,31 @@ def merge_log_indexes(dest_index, src_index, offset):
     the src_index, the following translation will occur:
     
       <Offset in merged log index> = <Offset in src_index> + offset
-    
+
+    If dest_index is a LogIndex, the offsets are translated and merged using
+    numpy arrays.
     """
     return_val = dest_index
-    
-    for key in src_index.keys():
-        new_offsets = [x + offset for x in src_index[key]]
 
-        try:
-            return_val[key].append(new_offsets)
-        except KeyError:
-            return_val[key] = new_offsets
+    if isinstance(dest_index, LogIndex):
+        import numpy as np
+
+        for key in src_index.keys():
+            # Translate in int64 so offsets past 2^32 do not overflow
+            new_offsets = np.asarray(src_index[key], dtype=np.int64) + offset
+
+            try:
+                return_val[key] = np.concatenate((return_val[key], new_offsets))
+            except KeyError:
+                return_val[key] = new_offsets
+    else:
+        for key in src_index.keys():
+            new_offsets = [x + offset for x in src_index[key]]
+
+            try:
+                return_val[key].extend(new_offsets)
+            except KeyError:
+                return_val[key] = new_offsets
     
     return return_val
 
@@ -401,8 +1380,7 @@ def calc_next_entry_offset(log_data, raw_log_index):
     # See documentation above on header format
     hdr_size             = 8
 
-    max_entry_offset_key = max(raw_log_index, key=raw_log_index.get)
-    max_entry_offset     = raw_log_index[max_entry_offset_key][-1]
+    max_entry_offset     = max(int(v[-1]) for v in raw_log_index.values() if len(v))
     
     hdr_b = log_data[max_entry_offset - hdr_size : max_entry_offset]
     
@@ -431,7 +1409,8 @@ def overwrite_entries_with_null_entry(log_data, byte_offsets):
         if( (bytearray(hdr_b[2:4]) != b'\xed\xac') ):
             raise Exception("ERROR: Offset not a valid entry header (offset {0})!".format(offset))
 
-        hdr_b[4:6] = bytearray([0] * 2)
+        # Set the entry type to NULL in the log data (hdr_b is a copy for bytearrays)
+        log_data[offset - 4 : offset - 2] = bytearray([0] * 2)
         entry_size = (hdr_b[6] + (hdr_b[7] * 256))
 
         # Write over the log entry with zeros
@@ -450,8 +1429,8 @@ def overwrite_payloads(log_data, byte_offsets, payload_offsets=None):
         payload_offsets -- Dictionary of { entry_type_id : <payload offset> }
 
     By default, if payload_offsets is not specified, the method will iterate through all
-    the entry types and calculate the defined size of the entry (ie it will use calcsize
-    on the struct format of the entry).  Sometimes, this is not the desired behavior
+    the entry types and use the defined size of the entry (ie the size of the struct
+    format of the entry; see WlanExpLogEntryType.get_codec()).  Sometimes, this is not the desired behavior
     and calling code woudl want to specify a different amount of the payload to keep.  
     For example, for data transmissions / receptions, it might be desired to also keep 
     the SNAP headers and potentially the IP headers.  In this case, the calling code 
@@ -466,19 +1445,17 @@ def overwrite_payloads(log_data, byte_offsets, payload_offsets=None):
     from the entry header, we can determine how many payload bytes are after the defined 
     fields and zero them out.    
     """
-    import struct
-    from entry_types import log_entry_types
+    from .entry_types import log_entry_types
 
     # See documentation above on header format
     hdr_size         = 8
 
 
     if payload_offsets is None:
-        payload_offsets  = {}
-    
         # Create temp data structure:  { entry_type_id : <payload offset>}
-        for entry_type_id, entry_type in log_entry_types.items():
-            payload_offsets[entry_type_id] = struct.calcsize(entry_type.fields_fmt_struct)
+        #   The payload offset of each entry type is cached in its codec
+        payload_offsets  = dict((entry_type_id, entry_type.get_codec().payload_offset)
+                                    for entry_type_id, entry_type in log_entry_types.items())
 
 
     for offset in byte_offsets:
@@ -495,7 +1472,7 @@ def overwrite_payloads(log_data, byte_offsets, payload_offsets=None):
 
             # Write over the log entry payload with zeros
             if entry_size > len_offset:
-                log_data[offset + len_offset : offset + entry_size] = bytearray([0] * (entry_size - len_offset))
+                log_data[offset + len_offset : offset + entry_size] = bytearray(entry_size - len_offset)
 
         except KeyError:
             print("WARNING:  Unknown entry type id {0} at offset {1}".format(entry_type_id, offset))
@@ -504,6 +1481,481 @@ def overwrite_payloads(log_data, byte_offsets, payload_offsets=None):
 
 
 
+#-----------------------------------------------------------------------------
+# WLAN Exp Log Index Internal Utilities
+#-----------------------------------------------------------------------------
+def _log_data_as_np(log_data):
+    """Internal method to get a read-only uint8 numpy view of the log data.
+
+    The log data can be any object supporting the buffer protocol (str, 
+    bytes, bytearray, memoryview, numpy array, etc).  The log data is not 
+    copied.
+    """
+    import numpy as np
+
+    if isinstance(log_data, np.ndarray):
+        return log_data.reshape(-1).view(np.uint8)
+
+    return np.frombuffer(log_data, dtype=np.uint8)
+
+# End _log_data_as_np()
+
+
+def _find_entry_header_candidates(log_bytes, start=0, end=None, chunk_size=2**24):
+    """Internal method to find all byte offsets of possible entry headers.
+
+    Returns a sorted numpy array of every offset in [start, end) where bytes
+    [2:4] of a complete entry header would match the delimiter.  Since the 
+    delimiter can also appear in entry payloads, not all candidates are valid
+    entry headers.  The log data is processed in chunks to limit the size of
+    the temporary arrays.
+    """
+    import numpy as np
+
+    # See documentation above on header format
+    hdr_size   = 8
+    num_hdrs   = len(log_bytes) - hdr_size + 1
+    candidates = [np.zeros((0,), dtype=np.int64)]
+
+    if end is not None:
+        num_hdrs = min(num_hdrs, end)
+
+    for chunk_start in range(start, num_hdrs, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, num_hdrs)
+
+        # Delimiter is little-endian 0xACED in bytes [2:4] of the header
+        offsets = np.flatnonzero(log_bytes[chunk_start + 2 : chunk_end + 2] == 0xED) + chunk_start
+        offsets = offsets[log_bytes[offsets + 3] == 0xAC]
+
+        candidates.append(offsets.astype(np.int64))
+
+    return np.concatenate(candidates)
+
+# End _find_entry_header_candidates()
+
+
+def _get_u16_column(log_bytes, byte_offsets):
+    """Internal method to read little-endian u16 values at the byte offsets."""
+    import numpy as np
+
+    ret_val  = log_bytes[byte_offsets].astype(np.int64)
+    ret_val |= log_bytes[byte_offsets + 1].astype(np.int64) << 8
+
+    return ret_val
+
+# End _get_u16_column()
+
+
+def _get_le_column(log_bytes, byte_offsets, dtype):
+    """Internal method to read values of the given little-endian numpy dtype 
+    at the byte offsets.
+    """
+    import numpy as np
+
+    dtype   = np.dtype(dtype)
+    indexes = np.asarray(byte_offsets, dtype=np.int64)[:, np.newaxis] + np.arange(dtype.itemsize)
+
+    return log_bytes[indexes].view(dtype).reshape(-1)
+
+# End _get_le_column()
+
+
+def _calc_next_hdr_offset(log_bytes, hdr_offset):
+    """Internal method to calculate the offset of the entry header following
+    the entry whose header is at hdr_offset.
+    """
+    hdr_offset = int(hdr_offset)
+
+    return hdr_offset + 8 + int(log_bytes[hdr_offset + 6]) + (int(log_bytes[hdr_offset + 7]) * 256)
+
+# End _calc_next_hdr_offset()
+
+
+def _link_entry_headers(hdr_offsets, next_hdrs):
+    """Internal method to link each candidate header to the candidate header
+    that follows it in the entry-length chain.
+
+    Returns a numpy array with the index in to hdr_offsets of the next 
+    candidate header.  Candidates whose next header is not a candidate are
+    linked to len(hdr_offsets).
+    """
+    import numpy as np
+
+    num_hdrs = len(hdr_offsets)
+    next_idx = np.searchsorted(hdr_offsets, next_hdrs)
+
+    linked            = (next_idx < num_hdrs)
+    linked[linked]    = (hdr_offsets[next_idx[linked]] == next_hdrs[linked])
+    next_idx[~linked] = num_hdrs
+
+    return next_idx
+
+# End _link_entry_headers()
+
+
+def _follow_entry_chain(hdr_offsets, next_hdrs):
+    """Internal method to follow the entry-length chain through candidate headers.
+
+    Attributes:
+        hdr_offsets -- Sorted numpy array of candidate header offsets
+        next_hdrs   -- Offset of the next header implied by each candidate
+
+    Returns:
+        Index (slice or integer array) into hdr_offsets of the candidates 
+        that are reached by following the chain from hdr_offsets[0].  The
+        last candidate in the chain does not link to another candidate.
+
+    NOTE:  In the common case every candidate links to the next candidate
+    (ie the delimiter never appears in an entry payload) and this method 
+    returns after one pass over the arrays.  Otherwise, the chain is
+    followed by pointer doubling so that the number of numpy passes is
+    logarithmic in the number of entries.
+    """
+    import numpy as np
+
+    num_hdrs = len(hdr_offsets)
+    next_idx = _link_entry_headers(hdr_offsets, next_hdrs)
+
+    if np.array_equal(next_idx[:-1], np.arange(1, num_hdrs)):
+        return slice(None)
+
+    # Pointer doubling:  at the start of each iteration, on_chain contains
+    #   the first 2^k entries of the chain and jump links each candidate to 
+    #   the candidate 2^k entries further down the chain.
+    next_idx    = np.append(next_idx, num_hdrs)
+    on_chain    = np.zeros((num_hdrs + 1,), dtype=bool)
+    on_chain[0] = True
+    jump        = next_idx
+
+    while (jump[0] != num_hdrs):
+        on_chain[jump[np.flatnonzero(on_chain)]] = True
+        jump = jump[jump]
+
+    return np.flatnonzero(on_chain[:num_hdrs])
+
+# End _follow_entry_chain()
+
+
+def _find_consistent_headers(hdr_offsets, next_hdrs, search_end, log_len, sync_depth):
+    """Internal method to find the candidate headers that are consistent with
+    the entry-length chain.
+
+    A candidate header is consistent if it and the (sync_depth - 1) headers
+    that follow it in the entry-length chain are all candidate headers.
+    Headers past search_end (ie candidates have not been searched) or past
+    the end of the log data are considered to be consistent.
+
+    Returns:
+        Tuple (consistent, next_idx):
+            consistent   -- Boolean numpy array, True for consistent candidates
+            next_idx     -- Links between candidates (see _link_entry_headers())
+    """
+    import numpy as np
+
+    num_hdrs   = len(hdr_offsets)
+    next_idx   = _link_entry_headers(hdr_offsets, next_hdrs)
+
+    valid      = (next_idx < num_hdrs) | (next_hdrs >= search_end) | ((next_hdrs + 8) > log_len)
+
+    # Sink index (num_hdrs) is valid and links to itself
+    valid      = np.append(valid, True)
+    hops       = np.append(next_idx, num_hdrs)
+
+    consistent = valid[:num_hdrs].copy()
+    hop        = hops[:num_hdrs]
+
+    for _ in range(sync_depth - 1):
+        hop         = hops[hop]
+        consistent &= valid[hop]
+
+    return (consistent, next_idx)
+
+# End _find_consistent_headers()
+
+
+def _find_sync_index(hdr_offsets, next_hdrs, sync_end, search_end, log_len, sync_depth):
+    """Internal method to find the first candidate header in 
+    [hdr_offsets[0], sync_end) that is consistent with the entry-length chain
+    (see _find_consistent_headers()).
+
+    Returns:
+        Index in to hdr_offsets of the first consistent candidate or None
+    """
+    import numpy as np
+
+    (consistent, _) = _find_consistent_headers(hdr_offsets, next_hdrs, search_end, log_len, sync_depth)
+
+    num_sync   = np.searchsorted(hdr_offsets, sync_end)
+    sync_idx   = np.flatnonzero(consistent[:num_sync])
+
+    if (len(sync_idx) == 0):
+        return None
+
+    return int(sync_idx[0])
+
+# End _find_sync_index()
+
+
+def _index_log_chunk(log_bytes, chunk_start, chunk_end, sync_offset=None, sync_depth=4):
+    """Internal method to find the entry headers that start in a chunk of the
+    log data.
+
+    Attributes:
+        log_bytes        -- uint8 numpy array of the log data
+        chunk_start      -- Offset of the start of the chunk
+        chunk_end        -- Offset of the end of the chunk (exclusive)
+        sync_offset      -- Offset of the first entry header in the chunk.  If
+                            None, the first entry header is found by 
+                            resynchronizing on the delimiter (see 
+                            _find_sync_index())
+        sync_depth       -- Number of entry headers that must be consistent to
+                            resynchronize
+
+    Returns:
+        Tuple (sync_offset, hdr_offsets):
+            sync_offset  -- Offset of the first entry header of the chain (None
+                            if no consistent entry header was found)
+            hdr_offsets  -- numpy array of the header offsets in the 
+                            entry-length chain starting at sync_offset that 
+                            are in the chunk.  Empty if there is no entry 
+                            header at the requested sync_offset.
+    """
+    import numpy as np
+
+    # See documentation above on header format
+    hdr_size  = 8
+    log_len   = len(log_bytes)
+
+    if sync_offset is None:
+        # Search far enough past the chunk to check the consistency of the 
+        #   entry headers at the end of the chunk (ie max entry size)
+        search_start = chunk_start
+        search_end   = min(chunk_end + (sync_depth * (hdr_size + 0xFFFF)), log_len)
+    else:
+        search_start = sync_offset
+        search_end   = chunk_end
+
+    hdr_offsets = _find_entry_header_candidates(log_bytes, search_start, search_end)
+    next_hdrs   = hdr_offsets + hdr_size + _get_u16_column(log_bytes, hdr_offsets + 6)
+
+    if sync_offset is None:
+        sync_idx = _find_sync_index(hdr_offsets, next_hdrs, chunk_end, search_end, log_len, sync_depth)
+
+        if sync_idx is None:
+            return (None, np.zeros((0,), dtype=np.int64))
+
+        sync_offset = int(hdr_offsets[sync_idx])
+    else:
+        if (len(hdr_offsets) == 0) or (hdr_offsets[0] != sync_offset):
+            return (sync_offset, np.zeros((0,), dtype=np.int64))
+
+        sync_idx = 0
+
+    # Follow the chain through the candidates in the chunk
+    num_hdrs    = np.searchsorted(hdr_offsets, chunk_end)
+    hdr_offsets = hdr_offsets[sync_idx:num_hdrs]
+    next_hdrs   = next_hdrs[sync_idx:num_hdrs]
+
+    return (sync_offset, hdr_offsets[_follow_entry_chain(hdr_offsets, next_hdrs)])
+
+# End _follow_entry_chain()
+
+
+def _index_array(offsets):
+    """Internal method to convert a sequence of offsets to a log index array.
+
+    Returns a 1-D uint32 numpy array, or a uint64 numpy array if the largest
+    offset cannot be represented with 32 bits.  Arrays that are already 
+    uint32 / uint64 are returned without a copy.
+    """
+    import numpy as np
+
+    offsets = np.asarray(offsets)
+
+    if offsets.dtype in (np.uint32, np.uint64):
+        return offsets.reshape(-1)
+
+    offsets = offsets.reshape(-1)
+
+    if (len(offsets) > 0) and (offsets.max() >= 2**32):
+        return offsets.astype(np.uint64)
+    else:
+        return offsets.astype(np.uint32)
+
+# End _index_array()
+
+
+def _is_array_log_index(log_index):
+    """Internal method to check if the offsets of a log index are numpy 
+    arrays (ie log_index is a LogIndex or a dictionary of numpy arrays).
+    """
+    if isinstance(log_index, LogIndex):
+        return True
+
+    try:
+        import numpy as np
+    except ImportError:
+        return False
+
+    return (len(log_index) > 0) and all(isinstance(v, np.ndarray) for v in log_index.values())
+
+# End _is_array_log_index()
+
+
+def _merge_offsets(offsets_list, use_np):
+    """Internal method to merge sequences of offsets in to a sorted sequence.
+
+    Attributes:
+        offsets_list -- List of sequences of offsets to merge
+        use_np       -- Return a numpy log index array (True) or a list (False)
+    """
+    if use_np:
+        import numpy as np
+
+        offsets_list = [_index_array(o) for o in offsets_list]
+        offsets_list = [o for o in offsets_list if (len(o) > 0)]
+
+        if not offsets_list:
+            return _index_array([])
+
+        if (len(offsets_list) == 1):
+            return offsets_list[0].copy()
+
+        # The offsets of each key of a log index are already sorted, so the
+        #   concatenated offsets are k sorted runs.  A stable sort (timsort)
+        #   finds the runs and merges them in O(n log k) instead of sorting
+        #   all n offsets.
+        return np.sort(np.concatenate(offsets_list), kind='stable')
+    else:
+        new_index = []
+
+        for offsets in offsets_list:
+            new_index += list(offsets)
+
+        return sorted(new_index)
+
+# End _merge_offsets()
+
+
+def _group_offsets_by_type(entry_type_ids, offsets):
+    """Internal method to build a raw LogIndex from entry type ID and offset columns."""
+    import numpy as np
+
+    # Stable sort keeps the offsets of each entry type in log order
+    order          = np.argsort(entry_type_ids.astype(np.uint16), kind='stable')
+    entry_type_ids = entry_type_ids[order]
+    offsets        = offsets[order]
+
+    (type_ids, starts) = np.unique(entry_type_ids, return_index=True)
+
+    return LogIndex({int(k) : v for (k, v) in zip(type_ids, np.split(offsets, starts[1:]))})
+
+# End _group_offsets_by_type()
+
+
+def _sort_by_timestamp(timestamps, offsets):
+    """Internal method to sort timestamp and offset columns by timestamp.
+
+    Timestamps of an entry type are normally already in log order, in which
+    case the columns are returned without sorting.
+    """
+    import numpy as np
+
+    if np.any(timestamps[1:] < timestamps[:-1]):
+        order      = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        offsets    = offsets[order]
+
+    return (timestamps, offsets)
+
+# End _sort_by_timestamp()
+
+
+def _merge_timestamp_indexes(dest_index, src_index):
+    """Internal method to merge timestamp indexes.  The entries of 
+    src_index must follow the entries of dest_index in the log data.
+    """
+    import numpy as np
+
+    for k, (timestamps, offsets) in src_index.items():
+        try:
+            (dest_timestamps, dest_offsets) = dest_index[k]
+        except KeyError:
+            dest_index[k] = (timestamps, offsets)
+            continue
+
+        timestamps = np.concatenate((dest_timestamps, timestamps))
+        offsets    = np.concatenate((dest_offsets, offsets))
+
+        dest_index[k] = _sort_by_timestamp(timestamps, offsets)
+
+    return dest_index
+
+# End _merge_timestamp_indexes()
+
+
+def _get_mac_addr_column(log_bytes, byte_offsets):
+    """Internal method to read the 6-byte MAC addresses at the byte offsets
+    as u64 values (first byte is most significant).
+    """
+    import numpy as np
+
+    addr_bytes = log_bytes[np.asarray(byte_offsets, dtype=np.int64)[:, np.newaxis] + np.arange(6)]
+    addrs      = np.zeros((len(addr_bytes),), dtype=np.uint64)
+
+    for i in range(6):
+        addrs = (addrs << np.uint64(8)) | addr_bytes[:, i]
+
+    return addrs
+
+# End _get_mac_addr_column()
+
+
+def _group_offsets_by_addr(addrs, offsets):
+    """Internal method to build the (<addrs>, <starts>, <offsets>) arrays of 
+    a MAC address index from address and offset columns in log order.
+    """
+    import numpy as np
+
+    # Stable sort keeps the offsets of each address in log order
+    order   = np.argsort(addrs, kind='stable')
+    addrs   = addrs[order]
+    offsets = offsets[order]
+
+    (uniq_addrs, starts) = np.unique(addrs, return_index=True)
+
+    return (uniq_addrs, np.append(starts, len(addrs)).astype(np.int64), offsets)
+
+# End _group_offsets_by_addr()
+
+
+def _merge_addr_indexes(dest_index, src_index):
+    """Internal method to merge MAC address indexes.  The entries of 
+    src_index must follow the entries of dest_index in the log data.
+    """
+    import numpy as np
+
+    for k, fields in src_index.items():
+        if k not in dest_index:
+            dest_index[k] = fields
+            continue
+
+        for addr_field, (addrs, starts, offsets) in fields.items():
+            (dest_addrs, dest_starts, dest_offsets) = dest_index[k][addr_field]
+
+            # Expand both indexes to (address, offset) columns in log order
+            all_addrs   = np.concatenate((np.repeat(dest_addrs, np.diff(dest_starts)), np.repeat(addrs, np.diff(starts))))
+            all_offsets = np.concatenate((dest_offsets, offsets))
+            order       = np.argsort(all_offsets, kind='stable')
+
+            dest_index[k][addr_field] = _group_offsets_by_addr(all_addrs[order], all_offsets[order])
+
+    return dest_index
+
+# End _merge_addr_indexes()
+
+
+
 #-----------------------------------------------------------------------------
 # WLAN Exp Log Printing Utilities
 #-----------------------------------------------------------------------------
@@ -526,12 +1978,44 @@ def print_log_index_summary(log_index, title=None):
 # End log_index_print_summary()
 
 
+def print_log_summary(log_summary, title=None):
+    """Prints a log summary (see gen_log_summary())."""
+    from .entry_types import log_entry_types
+
+    total_len   = 0
+    total_bytes = 0
+
+    if title is None:
+        print('Log Summary:\n')
+    else:
+        print(title)
+
+    for s in log_summary:
+        try:
+            name = log_entry_types[int(s['entry_type_id'])].name
+        except KeyError:
+            name = int(s['entry_type_id'])
+
+        msg  = '{0:>10,} of Type {1:<16} '.format(int(s['num_entries']), name)
+        msg += '{0:>14,} bytes   '.format(int(s['num_bytes']))
+        msg += 'timestamps {0} to {1}'.format(int(s['first_timestamp']), int(s['last_timestamp']))
+        print(msg)
+
+        total_len   += int(s['num_entries'])
+        total_bytes += int(s['num_bytes'])
+
+    print('--------------------------')
+    print('{0:>10,} total entries ({1:,} bytes)\n'.format(total_len, total_bytes))
+
+# End print_log_summary()
+
+
 def _print_log_entries(log_bytes, log_index, entries_slice=None):
     """Work in progress - built for debugging address issues, some variant of this will be useful
     for creating text version of raw log w/out requiring numpy"""
 
     from itertools import chain
-    from entry_types import log_entry_types
+    from .entry_types import log_entry_types
     hdr_size = 8
 
     if(entries_slice is not None) and (type(entries_slice) is slice):
@@ -620,9 +2104,13 @@ def calc_tx_time(rate, payload_length):
     """Calculates the duration of an 802.11 transmission given its rate and payload length.
     This method accounts only for PHY overhead (preamble, SIGNAL field, etc.). It does *not* 
     account for MAC overhead. The payload_length argument must include any MAC fields
-    (typically a 24-byte MAC header plus 4 byte FCS).
+    (typically a 24-byte MAC header) but not the 4 byte FCS, which is added here.
+
+    The rate and payload_length arguments can also be numpy arrays, in which case
+    a numpy array of durations is returned (0 for invalid rate indexes).
     """
     import math    
+    import numpy as np
     from wlan_exp.util import wlan_rates
     
     #Times in microseconds
@@ -630,6 +2118,24 @@ def calc_tx_time(rate, payload_length):
     T_SIG = 4
     T_SYM = 4
     T_EXT = 6
+
+    if (np.ndim(rate) > 0) or (np.ndim(payload_length) > 0):
+        rate           = np.asarray(rate).astype(np.int64)
+        payload_length = np.asarray(payload_length).astype(np.float64)
+
+        #Bytes per symbol by rate index (0 for invalid indexes)
+        bytes_per_sym_lut = np.zeros(len(wlan_rates) + 1)
+
+        for idx, r in enumerate(wlan_rates):
+            bytes_per_sym_lut[idx + 1] = (r['NDBPS']/8.0)
+
+        valid         = (rate >= 1) & (rate <= len(wlan_rates))
+        bytes_per_sym = bytes_per_sym_lut[np.where(valid, rate, 0)]
+
+        #6 = LEN_SERVICE (2) + LEN_FCS (4)
+        num_syms = np.ceil((6.0 + payload_length) / np.where(valid, bytes_per_sym, 1.0)).astype(np.int64)
+
+        return np.where(valid, T_PREAMBLE + T_SIG + T_SYM*num_syms + T_EXT, 0)
  
     try:
         r = wlan_rates[rate-1]
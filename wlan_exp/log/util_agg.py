@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+------------------------------------------------------------------------------
+WLAN Experiment Log Aggregation
+------------------------------------------------------------------------------
+Authors:   Chris Hunter (chunter [at] mangocomm.com)
+           Patrick Murphy (murphpo [at] mangocomm.com)
+           Erik Welsh (welsh [at] mangocomm.com)
+License:   Copyright 2014, Mango Communications. All rights reserved.
+           Distributed under the WARP license (http://warpproject.org/license)
+------------------------------------------------------------------------------
+
+This module provides group-by aggregation of the numpy structured arrays of
+WLAN Exp log entries (see log_util.log_data_to_np_arrays()).
+
+Per-station statistics are usually computed by looping over the unique
+values of an address field and selecting the matching entries with a mask,
+which scans the whole array once per station.  group_by() instead numbers
+the groups once (like numpy.unique(return_inverse=True)), and computes each
+aggregate for every group with a single numpy reduction:
+
+    tx_stats = group_by(log_np['TX'], ('addr1',),
+                        (('length',       'count', 'num_pkts'),
+                         ('length',       'sum',   'tot_len'),
+                         ('time_to_done', 'mean',  'avg_time'),
+                         ('time_to_done', 'p95',   'p95_time')))
+
+    for s in tx_stats:
+        print(s['addr1'], s['num_pkts'], s['tot_len'], s['avg_time'])
+
+Aggregation functions:
+
+  'count'        -- Number of entries in the group
+
+  'sum'          -- Sum of the field (int64 / uint64 for integer fields)
+
+  'mean'         -- Mean of the field
+
+  'min', 'max'   -- Minimum / maximum of the field
+
+  'p<q>'         -- q-th percentile of the field (eg 'p50', 'p99.9'), with
+                    the same linear interpolation as numpy.percentile()
+
+Throughput vs time is computed by binning the bytes of the entries by their
+timestamps with throughput_vs_time():
+
+    (t, xput) = throughput_vs_time(rx, interval=1000, window=100)
+
+    plot((t - t[0]) / 1e6, xput)             # Mb/sec, 100 msec rolling mean
+
+Naming convention:
+
+  np_arr         -- A numpy structured array of log entries of one entry
+                    type (see wlan_exp.log.util).
+
+"""
+
+__all__ = ['group_by',
+           'throughput_vs_time']
+
+
+# Aggregation functions (percentiles are given as 'p<q>')
+_AGG_FUNCS = ['count', 'sum', 'mean', 'min', 'max']
+
+
+#-----------------------------------------------------------------------------
+# Aggregation Methods
+#-----------------------------------------------------------------------------
+def group_by(np_arr, group_fields, aggs):
+    """Compute aggregate statistics of the entries in each group.
+
+    Attributes:
+        np_arr           -- numpy structured array of log entries
+        group_fields     -- Field name or list of field names whose values
+                            define the groups (eg ('addr1',) or
+                            ('addr2', 'rate'))
+        aggs             -- List of (field, func, output name) tuples (see
+                            module docstring for the aggregation functions)
+
+    Returns:
+        numpy structured array with one element per distinct combination of
+        values of the group_fields (sorted by those values).  Each element
+        has the group_fields and one field per aggregation.
+
+    Each entry is first assigned the number of its group; every aggregation
+    is then a single reduction over all entries (eg numpy.bincount()), so the
+    time does not depend on the number of groups.
+    """
+    import numpy as np
+
+    if type(group_fields) is str:
+        group_fields = [group_fields]
+
+    group_fields = list(group_fields)
+    aggs         = [(field, _check_agg_func(func), name) for (field, func, name) in aggs]
+
+    (group_keys, group_ids) = _get_groups(np_arr, group_fields)
+
+    num_groups   = len(group_keys[0])
+
+    # Output array: group-by fields followed by one field per aggregation
+    out_dt       = [(f, np_arr.dtype[f]) for f in group_fields]
+    out_dt      += [(name, _get_agg_dtype(np_arr.dtype[field], func)) for (field, func, name) in aggs]
+
+    ret_val      = np.empty(num_groups, dtype=out_dt)
+
+    if (num_groups == 0):
+        return ret_val
+
+    for (f, keys) in zip(group_fields, group_keys):
+        ret_val[f] = keys
+
+    counts       = np.bincount(group_ids, minlength=num_groups)
+
+    for (field, func, name) in aggs:
+        col    = np_arr[field]
+        agg_dt = ret_val.dtype[name]
+
+        if (col.ndim != 1):
+            raise ValueError("Aggregated fields must be scalar fields ({0} has shape {1})".format(field, col.shape[1:]))
+
+        if (func == 'count'):
+            ret_val[name] = counts
+
+        elif (func in ['sum', 'mean']):
+            # ufunc.at() is only fast if the values have the dtype of the output
+            total = np.zeros(num_groups, dtype=agg_dt)
+            np.add.at(total, group_ids, col.astype(agg_dt))
+
+            if (func == 'mean'):
+                total /= counts
+
+            ret_val[name] = total
+
+        elif (func in ['min', 'max']):
+            # ufunc.at() is only fast if the values are contiguous
+            col     = np.ascontiguousarray(col)
+
+            # Initialize each group with one of its own values
+            extreme = np.empty(num_groups, dtype=agg_dt)
+            extreme[group_ids] = col
+
+            if (func == 'min'):
+                np.minimum.at(extreme, group_ids, col)
+            else:
+                np.maximum.at(extreme, group_ids, col)
+
+            ret_val[name] = extreme
+
+        else:
+            ret_val[name] = _group_percentile(col, group_ids, counts, float(func[1:]))
+
+    return ret_val
+
+# End def
+
+
+def throughput_vs_time(np_arr, interval=1000, window=1, addr_field=None,
+                       start_time=None, end_time=None, as_mbps=True):
+    """Compute the throughput of log entries vs time.
+
+    Attributes:
+        np_arr           -- numpy structured array of log entries with
+                            'timestamp' and 'length' fields (eg RX_OFDM, TX)
+        interval         -- Length of each time bin (in microseconds)
+        window           -- Number of bins of the rolling mean of the
+                            throughput (default: 1, ie no rolling mean)
+        addr_field       -- Address field (eg 'addr2') to compute a separate
+                            throughput per address
+        start_time       -- Timestamp of the start of the first bin (default:
+                            the first timestamp in np_arr)
+        end_time         -- Timestamp of the end of the last bin (default:
+                            after the last timestamp in np_arr)
+        as_mbps          -- Scale the throughput to Mb/sec (True) or return
+                            the number of bytes per bin (False)
+
+    Returns:
+        Tuple (bin_times, xput) where bin_times are the timestamps of the
+        start of each bin and xput is the throughput of each bin.  If
+        addr_field is given, xput is a dictionary with one throughput array
+        per distinct address.
+
+    The first (window - 1) bins of the rolling mean are the mean of the bins
+    so far.  Entries outside [start_time, end_time) are ignored.
+    """
+    import numpy as np
+
+    timestamps = np_arr['timestamp']
+    lengths    = np_arr['length']
+
+    # Entries are only outside the bins if the bins are given
+    select     = (start_time is not None) or (end_time is not None)
+
+    if start_time is None:
+        start_time = int(timestamps.min()) if len(timestamps) else 0
+
+    if end_time is None:
+        end_time   = int(timestamps.max()) + 1 if len(timestamps) else start_time
+
+    num_bins   = max(0, (int(end_time) - int(start_time) + interval - 1) // interval)
+    bin_times  = start_time + interval * np.arange(num_bins, dtype=np.uint64)
+
+    if select:
+        in_bins    = (timestamps >= start_time) & (timestamps < end_time)
+
+        np_arr     = np_arr[in_bins]
+        timestamps = timestamps[in_bins]
+        lengths    = lengths[in_bins]
+
+    bin_ids    = ((timestamps - np.uint64(start_time)) // np.uint64(interval)).astype(np.intp)
+
+    if addr_field is None:
+        (addrs, addr_ids) = ([None], 0)
+    else:
+        (addrs, addr_ids) = _factorize(np_arr[addr_field])
+
+    # Bytes per (address, bin) with one bincount over the combined bin numbers
+    num_bytes  = np.bincount(addr_ids * num_bins + bin_ids, weights=lengths, minlength=len(addrs) * num_bins)
+    num_bytes  = num_bytes.reshape((len(addrs), num_bins))
+
+    if (window > 1):
+        # Rolling sums are differences of the cumulative sums
+        cum_bytes = np.zeros((len(addrs), num_bins + 1))
+        np.cumsum(num_bytes, axis=1, out=cum_bytes[:, 1:])
+
+        ends      = np.arange(1, num_bins + 1)
+        starts    = np.maximum(ends - window, 0)
+
+        num_bytes = (cum_bytes[:, ends] - cum_bytes[:, starts]) / (ends - starts)
+
+    if as_mbps:
+        # Bytes per microsecond interval to bits per microsecond (ie Mb/sec)
+        num_bytes = num_bytes * (8.0 / interval)
+
+    if addr_field is None:
+        return (bin_times, num_bytes[0])
+    else:
+        return (bin_times, dict(zip(addrs.tolist(), num_bytes)))
+
+# End def
+
+
+
+#-----------------------------------------------------------------------------
+# Internal Aggregation Methods
+#-----------------------------------------------------------------------------
+def _check_agg_func(func):
+    """Internal method to check the name of an aggregation function."""
+    if func in _AGG_FUNCS:
+        return func
+
+    if (type(func) is str) and func.startswith('p'):
+        try:
+            q = float(func[1:])
+        except ValueError:
+            q = -1
+
+        if (0 <= q <= 100):
+            return func
+
+    raise ValueError("Unknown aggregation '{0}'; must be one of {1} or 'p<percentile>'".format(func, _AGG_FUNCS))
+
+# End def
+
+
+def _get_agg_dtype(field_dt, func):
+    """Internal method to get the numpy dtype of an aggregation of a field."""
+    import numpy as np
+
+    if (func == 'count'):
+        return np.int64
+    elif (func in ['min', 'max']):
+        return field_dt
+    elif (func == 'sum'):
+        if (field_dt.kind == 'u'):
+            return np.uint64
+        elif (field_dt.kind in ['i', 'b']):
+            return np.int64
+
+    return np.float64
+
+# End def
+
+
+def _get_groups(np_arr, group_fields):
+    """Internal method to assign each entry the number of its group.
+
+    Groups are numbered in sorted order of the values of the group-by fields.
+    Multiple group-by fields are combined one at a time:  the group numbers of
+    the fields so far and the value numbers of the next field are combined in
+    to one integer, which is numbered again.
+
+    Returns:
+        Tuple (group_keys, group_ids) where group_keys is a list with an array
+        of the values of each group-by field per group, and group_ids is an
+        array with the group number of each entry.
+    """
+    import numpy as np
+
+    group_keys = None
+    group_ids  = None
+
+    for f in group_fields:
+        col = np_arr[f]
+
+        if (col.ndim != 1):
+            raise ValueError("Group-by fields must be scalar fields ({0} has shape {1})".format(f, col.shape[1:]))
+
+        (uniq, ids) = _factorize(col)
+
+        if group_ids is None:
+            (group_keys, group_ids) = ([uniq], ids)
+        else:
+            (pairs, group_ids) = _factorize(group_ids.astype(np.int64) * len(uniq) + ids)
+
+            group_keys = [k[pairs // len(uniq)] for k in group_keys] + [uniq[pairs % len(uniq)]]
+
+    return (group_keys, group_ids)
+
+# End def
+
+
+def _factorize(col):
+    """Internal method to number the distinct values of an array.
+
+    Returns:
+        Tuple (uniq, ids) where uniq is the sorted distinct values and ids is
+        the index in to uniq of each value of col (ie uniq[ids] == col).
+
+    The distinct values are found by sorting a copy of col.  Integer values
+    are then numbered with a lookup table indexed by the low bits of their
+    difference from the smallest value, if those bits are distinct for every
+    value (eg rates, channels, or the MAC addresses of the nodes in an
+    experiment).  Other values are numbered with a binary search.
+    """
+    import numpy as np
+
+    if (len(col) == 0):
+        return (col[:0].copy(), np.zeros((0,), dtype=np.intp))
+
+    sorted_col = np.sort(col)
+
+    is_first     = np.empty(len(sorted_col), dtype=bool)
+    is_first[0]  = True
+    np.not_equal(sorted_col[1:], sorted_col[:-1], out=is_first[1:])
+
+    uniq = sorted_col[is_first]
+
+    del sorted_col, is_first
+
+    if (col.dtype.kind in ['i', 'u']):
+        # Differences are computed modulo 2**64 so signed values can be used
+        first = uniq[:1].astype(np.uint64)[0]
+        diff  = uniq.astype(np.uint64) - first
+
+        for bits in [16, 20, 24]:
+            mask     = np.uint64(2**bits - 1)
+            low_bits = diff & mask
+
+            if (len(np.unique(low_bits)) == len(uniq)):
+                table           = np.empty(2**bits, dtype=np.intp)
+                table[low_bits] = np.arange(len(uniq))
+
+                low_bits  = col.astype(np.uint64)
+                low_bits -= first
+                low_bits &= mask
+
+                return (uniq, table[low_bits])
+
+    return (uniq, np.searchsorted(uniq, col))
+
+# End def
+
+
+def _group_percentile(col, group_ids, counts, q):
+    """Internal method to compute the q-th percentile of a field per group.
+
+    The values are sorted by (group, value), so the values of each group are
+    contiguous and sorted; the percentile of a group is then interpolated
+    between two of its sorted values.  Integer values of up to 32 bits are
+    packed with their group number in to one uint64, which is much faster to
+    sort than the indexes of a two key sort (ie numpy.lexsort()).
+    """
+    import numpy as np
+
+    if (col.dtype.kind in ['i', 'u']) and (col.dtype.itemsize <= 4):
+        col_min  = int(col.min())
+
+        keys     = group_ids.astype(np.uint64)
+        keys   <<= np.uint64(32)
+        keys    |= (col.astype(np.int64) - col_min).astype(np.uint64)
+        keys.sort()
+
+        keys    &= np.uint64(0xFFFFFFFF)
+        values   = keys.astype(np.float64) + col_min
+    else:
+        values   = col[np.lexsort((col, group_ids))].astype(np.float64)
+
+    starts = np.cumsum(counts) - counts
+
+    pos    = (q / 100.0) * (counts - 1)
+    lo     = np.floor(pos).astype(np.intp)
+    hi     = np.minimum(lo + 1, counts - 1)
+
+    v_lo   = values[starts + lo]
+    v_hi   = values[starts + hi]
+
+    return v_lo + (v_hi - v_lo) * (pos - lo)
+
+# End def
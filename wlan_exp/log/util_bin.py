@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+"""
+------------------------------------------------------------------------------
+WLAN Experiment Log Binary File Utilities
+------------------------------------------------------------------------------
+Authors:   Chris Hunter (chunter [at] mangocomm.com)
+           Patrick Murphy (murphpo [at] mangocomm.com)
+           Erik Welsh (welsh [at] mangocomm.com)
+License:   Copyright 2014, Mango Communications. All rights reserved.
+           Distributed under the WARP license (http://warpproject.org/license)
+------------------------------------------------------------------------------
+
+This module provides utility functions to handle WLAN Exp log data stored in
+raw binary files (ie the bytearray from log_get_all_new() written directly to
+disk).
+
+Generating the raw log index of a large log file can take a significant
+amount of time.  Therefore, the raw log index of a binary log file is cached
+in an index file next to the log file.  The index file is a numpy .npz
+archive with the following arrays:
+
+wlan_exp_log_index_file:
+   <filename>.index.npz
+       |- 'log_data_size'         (1,)      uint64  (number of bytes indexed)
+       |- 'log_data_crc'          (1,)      uint32  (CRC-32 of the bytes indexed)
+       |- 'next_hdr_offset'       (1,)      uint64  (optional; offset in the log data where indexing resumes)
+       |- 'log_index/<int>'       (N1,)     uint32/uint64
+       |- 'log_index/<int>'       (N2,)     uint32/uint64
+       |- ...
+
+The index file is only used if the size and CRC-32 match the log data in
+the log file.  If log data has been appended to the log file since the index
+file was written, only the appended log data is indexed and the index file
+is updated.  Otherwise, the log data is re-indexed.
+
+Naming convention:
+
+  log_data       -- The binary data from a WLAN Exp node's log.
+
+  raw_log_index  -- This is an index that has not been interpreted / filtered
+                    and corresponds 1-to-1 with what is in given log_data.
+                    The defining characteristic of a raw_log_index is that
+                    the dictionary keys are all integers (entry type IDs):
+                      { <int> : [<offsets>] }
+
+  LogIndex       -- A log index whose offsets are numpy arrays (see
+                    wlan_exp.log.util).  Log indexes read from an index file
+                    are LogIndex instances.
+
+Functions (see below for more information):
+    log_data_to_bin()        -- Write log_data to a binary log file
+
+    bin_to_log_data()        -- Extract the log_data from a binary log file
+    bin_to_log_index()       -- Get the log_index of a binary log file
+
+"""
+
+__all__ = ['BinLogContainer',
+           'log_data_to_bin',
+           'bin_to_log_data',
+           'bin_to_log_index']
+
+
+from . import util as log_util
+
+
+#-----------------------------------------------------------------------------
+# Binary Log Container Class
+#-----------------------------------------------------------------------------
+class BinLogContainer(log_util.LogContainer):
+    """Class to define a binary log file container.
+
+    Attributes (inherited from LogContainer):
+        file_handle          -- Name of the binary log file
+
+    Attributes:
+        index_filename       -- Name of the index file of the log file
+                                (default: <file_handle>.index.npz)
+        save_index           -- Write the index file when get_log_index()
+                                generates the raw log index
+    """
+    index_filename           = None
+    save_index               = None
+
+
+    def __init__(self, filename, index_filename=None, save_index=True):
+        super(BinLogContainer, self).__init__(filename)
+
+        self.save_index = save_index
+
+        if index_filename is None:
+            self.index_filename = filename + '.index.npz'
+        else:
+            self.index_filename = index_filename
+
+
+    def is_valid(self):
+        """Check that the binary log file exists."""
+        import os
+
+        return os.path.isfile(self.file_handle)
+
+
+    def write_log_data(self, log_data, append=True):
+        """Write the log data to the log file.
+
+        Attributes:
+            log_data         -- Binary WLAN Exp log data
+            append           -- Append to (True) or Overwrite (False) the current log data
+        """
+        import os
+
+        if (len(log_data) == 0):
+            raise AttributeError("Did not provide any log data.")
+
+        if append:
+            mode = 'ab'
+        else:
+            mode = 'wb'
+
+            # Any existing index file does not describe the new log data
+            if os.path.isfile(self.index_filename):
+                os.remove(self.index_filename)
+
+        with open(self.file_handle, mode) as fh:
+            fh.write(log_data)
+
+
+    def write_log_index(self, log_index=None, next_hdr_offset=None):
+        """Write the log index to the index file.
+
+        If log_index is provided then that log index will replace any index
+        file of the log file.  Otherwise, the raw log index will be generated
+        (see get_log_index()) and written to the index file.
+
+        Attributes:
+            log_index        -- Raw log index of the log data in the log file
+            next_hdr_offset  -- Offset in the log data of the first entry
+                                header not in log_index (see
+                                log_util.gen_partial_raw_log_index()).  If
+                                not provided with the log_index, the log
+                                file will be re-indexed once log data is 
+                                appended to it.
+        """
+        if log_index is None:
+            self._get_raw_log_index(save_index=True)
+        else:
+            self._write_index_file(log_index, next_hdr_offset)
+
+
+    def write_attr_dict(self, attr_dict):
+        """Binary log files do not have attributes."""
+        raise NotImplementedError
+
+
+    def get_log_data_size(self):
+        """Get the current size of the log data in the log file."""
+        import os
+
+        return os.path.getsize(self.file_handle)
+
+
+    def get_log_data(self, mmap=False):
+        """Get the log data from the log file.
+
+        Attributes:
+            mmap       -- Return a read-only numpy memmap of the log file
+                          instead of reading the log data in to memory
+
+        Returns:
+            bytearray of the log data or uint8 numpy memmap (if mmap=True)
+        """
+        import numpy as np
+
+        if mmap:
+            if (self.get_log_data_size() == 0):
+                return np.zeros((0,), dtype=np.uint8)
+
+            return np.memmap(self.file_handle, dtype=np.uint8, mode='r')
+
+        with open(self.file_handle, 'rb') as fh:
+            log_data = bytearray(fh.read())
+
+        return log_data
+
+
+    def get_log_data_window(self, start=0, end=None):
+        """Get a window of the log data from the log file.
+
+        Attributes:
+            start      -- Offset of the first byte of the window
+            end        -- Offset of the end of the window (exclusive); None
+                          for the end of the log data
+
+        Returns:
+            uint8 numpy array of the log data in [start, end)
+        """
+        import numpy as np
+
+        log_data_size = self.get_log_data_size()
+
+        if end is None:
+            end = log_data_size
+        else:
+            end = min(end, log_data_size)
+
+        if (start >= end):
+            return np.zeros((0,), dtype=np.uint8)
+
+        return np.memmap(self.file_handle, dtype=np.uint8, mode='r', offset=start, shape=(end - start,))
+
+
+    def get_log_index(self, gen_index=True):
+        """Get the raw log index of the log file.
+
+        The raw log index is read from the index file if it matches the log
+        data; any log data appended to the log file since the index file was
+        written is indexed.  Otherwise, if gen_index=True, the raw log index 
+        is generated.  If save_index=True, the index file is updated with any
+        new entries.
+
+        Attributes:
+            gen_index  -- Generate the raw log index if the index file does
+                          not exist or does not match the log data
+
+        Returns:
+            LogIndex with the uint32 / uint64 offset arrays of the log file
+        """
+        (log_index, _) = self._get_raw_log_index(gen_index)
+
+        if not log_index:
+            msg  = "Unable to get log index of {0}.".format(self.file_handle)
+            raise AttributeError(msg)
+
+        return log_index
+
+
+    def get_attr_dict(self):
+        """Binary log files do not have attributes."""
+        return {}
+
+
+    def trim_log_data(self):
+        """Trim the log data so that it has ends on a entry boundary."""
+        raise NotImplementedError
+
+
+    #-------------------------------------------------------------------------
+    # Internal methods for the container
+    #-------------------------------------------------------------------------
+    def _get_raw_log_index(self, gen_index=True, save_index=None):
+        """Internal method to get the raw log index of the log file, using the
+        index file when possible.  The index file is updated if save_index 
+        (default: self.save_index) is True and any log data was indexed.
+
+        Returns:
+            Tuple (raw_log_index, next_hdr_offset); (None, None) if there is
+            no valid index file and gen_index=False.
+        """
+        log_data_size = self.get_log_data_size()
+
+        (log_index, next_hdr_offset, index_size) = self._read_index_file()
+
+        # Without next_hdr_offset, appended log data cannot be indexed separately
+        if (log_index is not None) and (index_size != log_data_size) and (next_hdr_offset is None):
+            log_index = None
+
+        if log_index is not None:
+            if (index_size == log_data_size):
+                return (log_index, next_hdr_offset)
+
+            # Index the log data appended since the index file was written
+            log_data = self.get_log_data_window(next_hdr_offset, log_data_size)
+            (new_log_index, new_hdr_offset) = log_util.gen_partial_raw_log_index(log_data)
+
+            log_util.merge_log_indexes(log_index, new_log_index, next_hdr_offset)
+            next_hdr_offset += new_hdr_offset
+        elif gen_index:
+            log_data = self.get_log_data_window(0, log_data_size)
+            (log_index, next_hdr_offset) = log_util.gen_partial_raw_log_index(log_data)
+        else:
+            return (None, None)
+
+        if save_index is None:
+            save_index = self.save_index
+
+        if save_index:
+            self._write_index_file(log_index, next_hdr_offset, log_data_size)
+
+        return (log_index, next_hdr_offset)
+
+
+    def _read_index_file(self):
+        """Internal method to read the index file.
+
+        Returns:
+            Tuple (raw_log_index, next_hdr_offset, log_data_size);
+            (None, None, None) if the index file does not exist or does not
+            match the log data in the log file.
+        """
+        import numpy as np
+
+        try:
+            with np.load(self.index_filename) as index_file:
+                log_data_size   = int(index_file['log_data_size'][0])
+                log_data_crc    = int(index_file['log_data_crc'][0])
+
+                # Any change to the indexed log data invalidates the index file
+                if ((log_data_size > self.get_log_data_size()) or
+                        (log_data_crc != self._calc_log_data_crc(log_data_size))):
+                    return (None, None, None)
+
+                if 'next_hdr_offset' in index_file.files:
+                    next_hdr_offset = int(index_file['next_hdr_offset'][0])
+                else:
+                    next_hdr_offset = None
+
+                log_index = log_util.LogIndex()
+
+                for k in index_file.files:
+                    if k.startswith('log_index/'):
+                        key = k[len('log_index/'):]
+                        try:
+                            log_index[int(key)] = index_file[k]
+                        except ValueError:
+                            log_index[key]      = index_file[k]
+        except (IOError, OSError, KeyError, ValueError):
+            return (None, None, None)
+
+        return (log_index, next_hdr_offset, log_data_size)
+
+
+    def _write_index_file(self, log_index, next_hdr_offset, log_data_size=None):
+        """Internal method to write the index file.
+
+        Attributes:
+            log_index        -- Raw log index to write
+            next_hdr_offset  -- Offset where indexing resumes (or None)
+            log_data_size    -- Number of bytes of the log file described by
+                                the log index (default: size of the log file)
+
+        The index file is written to a temporary file that then replaces the
+        index file so that an interrupted write does not leave a corrupted
+        index file.  A warning is printed if the index file cannot be written.
+        """
+        import os
+        import numpy as np
+
+        if log_data_size is None:
+            log_data_size = self.get_log_data_size()
+
+        arrays = {'log_data_size'   : np.array([log_data_size], dtype=np.uint64),
+                  'log_data_crc'    : np.array([self._calc_log_data_crc(log_data_size)], dtype=np.uint32)}
+
+        if next_hdr_offset is not None:
+            arrays['next_hdr_offset'] = np.array([next_hdr_offset], dtype=np.uint64)
+
+        for k, v in log_index.items():
+            arrays['log_index/{0}'.format(k)] = log_util._index_array(v)
+
+        tmp_filename = self.index_filename + '.tmp'
+
+        try:
+            with open(tmp_filename, 'wb') as fh:
+                np.savez(fh, **arrays)
+
+            if hasattr(os, 'replace'):
+                os.replace(tmp_filename, self.index_filename)
+            else:
+                # Python 2:  os.rename() does not overwrite an existing file on Windows
+                try:
+                    os.rename(tmp_filename, self.index_filename)
+                except OSError:
+                    os.remove(self.index_filename)
+                    os.rename(tmp_filename, self.index_filename)
+        except (IOError, OSError) as err:
+            print("WARNING: Unable to write index file {0}:\n    {1}".format(self.index_filename, err))
+
+
+    def _calc_log_data_crc(self, size, chunk_size=2**24):
+        """Internal method to calculate the CRC-32 of the first size bytes of
+        the log data in the log file.
+        """
+        import zlib
+
+        crc = 0
+
+        with open(self.file_handle, 'rb') as fh:
+            while (size > 0):
+                data  = fh.read(min(size, chunk_size))
+
+                if not data:
+                    break
+
+                crc   = zlib.crc32(data, crc)
+                size -= len(data)
+
+        return crc & 0xFFFFFFFF
+
+# End class()
+
+
+
+
+#-----------------------------------------------------------------------------
+# WLAN Exp Log Binary File Utilities
+#-----------------------------------------------------------------------------
+def log_data_to_bin(log_data, filename, gen_index=True, append=False):
+    """Write log_data to a binary log file and, optionally, its index file.
+
+    Attributes:
+        log_data   -- Binary WLAN Exp log data
+        filename   -- Name of the binary log file
+        gen_index  -- Generate the raw log index of the log file and store it
+                      in the index file
+        append     -- Append to (True) or Overwrite (False) the log file
+    """
+    container = BinLogContainer(filename)
+
+    container.write_log_data(log_data, append)
+
+    if gen_index:
+        container.write_log_index()
+
+# End log_data_to_bin()
+
+
+
+def bin_to_log_data(filename, mmap=False):
+    """Extract the log_data from a binary log file.
+
+    Attributes:
+        filename   -- Name of the binary log file
+        mmap       -- Return a read-only numpy memmap of the log file instead
+                      of reading it in to memory
+
+    Returns:
+        log_data from the binary log file
+    """
+    container = BinLogContainer(filename)
+
+    return container.get_log_data(mmap)
+
+# End bin_to_log_data()
+
+
+
+def bin_to_log_index(filename, gen_index=True, save_index=True):
+    """Get the raw log index of a binary log file.
+
+    The raw log index is read from the index file of the log file if the
+    index file matches the log data.  Otherwise, the raw log index is 
+    generated from the log data and, if save_index=True, stored in the index
+    file so that the next call does not need to index the log data again.
+
+    Attributes:
+        filename   -- Name of the binary log file
+        gen_index  -- Generate the raw log index if there is no valid index
+                      file
+        save_index -- Write the index file if the raw log index was generated
+
+    Returns:
+        LogIndex of the log data in the binary log file
+    """
+    container = BinLogContainer(filename, save_index=save_index)
+
+    return container.get_log_index(gen_index)
+
+# End bin_to_log_index()
@@ -36,11 +36,45 @@ wlan_exp_log_data_container (equivalent to a HDF5 group):
        |      |- 'log_data'             (1,)      voidN  (where N is the size of the data)
        |- Groups (created if gen_index==True):
               |- 'raw_log_index'
+                     |- Attributes:
+                     |      |- 'next_hdr_offset'  (1,)  uint64  (offset in 'log_data' where indexing resumes)
                      |- Datasets: 
                         (dtype depends if largest offset in raw_log_index is < 2^32)
                             |- <int>    (N1,)     uint32/uint64
                             |- <int>    (N2,)     uint32/uint64
                             |- ...
+              |- 'timestamp_index'  (created by write_timestamp_index())
+                     |- Groups:
+                            |- <int>
+                            |      |- 'timestamp'  (N1,)  uint64        (sorted)
+                            |      |- 'offset'     (N1,)  uint32/uint64 (offset of each timestamp)
+                            |- ...
+              |- 'addr_index'  (created by write_addr_index())
+                     |- Groups:
+                            |- <int>
+                            |      |- 'addr1'
+                            |      |     |- 'addr'    (M1,)  uint64        (sorted MAC addresses)
+                            |      |     |- 'start'   (M1+1,) int64        (start of each address in 'offset')
+                            |      |     |- 'offset'  (N1,)  uint32/uint64 (offsets grouped by address)
+                            |      |- 'addr2'  ...
+                            |      |- 'addr3'  ...
+                            |- ...
+              |- 'log_summary'  (created by write_log_summary())
+                     |- Datasets:
+                            |- 'summary'  (M,)  compound (see log_util.gen_log_summary())
+                                   |- Attributes:
+                                          |- 'log_data_size'  uint64  (size of 'log_data' described by 'summary')
+              |- 'np_array_cache'  (created by write_np_arrays())
+                     |- Groups:
+                            |- <entry type name>
+                            |      |- Datasets:
+                            |             |- <fields>  (N1,)  compound (numpy array of the entry type;
+                            |                    |               <fields> is 'ALL' or the comma-separated
+                            |                    |               sorted field names)
+                            |                    |- Attributes:
+                            |                           |- 'fingerprint'    str     (entry type definition)
+                            |                           |- 'log_data_size'  uint64  (size of 'log_data')
+                            |- ...
 
 Naming convention:
 
@@ -56,6 +90,10 @@ Naming convention:
                     general, this will be a interpreted / filtered version of
                     a raw_log_index.
 
+  LogIndex       -- A log index whose offsets are numpy arrays (see 
+                    wlan_exp.log.util).  Log indexes read from an HDF5 file
+                    are LogIndex instances.
+
   hdf5           -- A data container format that we use to store log_data, 
                     raw_log_index, and other user defined attributes.  You can 
                     find more documentation on HDF / HDF5 at:
@@ -76,6 +114,8 @@ Functions (see below for more information):
 
     hdf5_to_log_data()       -- Extract the log_data from an HDF5 file
     hdf5_to_log_index()      -- Extract the log_index from an HDF5 file
+    hdf5_to_log_summary()    -- Get the log summary (entry counts) of an HDF5 file
+    hdf5_to_np_arrays()      -- Get the (cached) numpy arrays of the entries of an HDF5 file
     hdf5_to_attr_dict()      -- Extract the attribute dictionary from an HDF5 file
     
 """
@@ -87,6 +127,9 @@ __all__ = ['np_arrays_to_hdf5',
            'log_data_to_hdf5',
            'hdf5_to_log_data',
            'hdf5_to_log_index',
+           'hdf5_to_log_summary',
+           'hdf5_to_np_arrays',
+           'hdf5_to_np_array_batches',
            'hdf5_to_attr_dict']
 
 
@@ -105,18 +148,24 @@ class HDF5LogContainer(log_util.LogContainer):
     Attributes:
         hdf5_group_name      -- Name of the HDF5 group of the log container
         compression          -- HDF5 compression setting on the log container
+        contiguous           -- Store the log data as a contiguous, uncompressed
+                                dataset so it can be memory-mapped (see 
+                                get_log_data()).  Contiguous log data cannot
+                                be appended to once written.
     
     NOTE:  When an HDF5LogContainer is created, the underlying HDF5 file will
     not be modified unless one of the write_* methods are called.
     """
     hdf5_group_name          = None
     compression              = None
+    contiguous               = None
 
 
-    def __init__(self, filename, name=None, compression=None):
+    def __init__(self, filename, name=None, compression=None, contiguous=False):
         super(HDF5LogContainer, self).__init__(filename)
 
         self.compression = compression
+        self.contiguous  = contiguous
 
         if name is None:
             self.hdf5_group_name = "/"
@@ -190,35 +239,63 @@ class HDF5LogContainer(log_util.LogContainer):
         # Get the log_data from the group data set
         ds = group_handle['log_data']
 
+        # Numpy arrays cached in the log container do not describe the new log data
+        try:
+            del group_handle["np_array_cache"]
+        except KeyError:
+            pass
+
         # Set length of current data
         if append:        
             curr_length = ds.shape[0]
         else:
             curr_length = 0
+
+            # Any existing log indexes and log summary do not describe the new log data
+            for index_name in ["log_index", "timestamp_index", "addr_index", "log_summary"]:
+                try:
+                    del group_handle[index_name]
+                except KeyError:
+                    pass
         
         # Get total length of data
         length = curr_length + log_data_length
 
-        # Create empyt numpy container
-        np_data = np.empty((log_data_length,), np_dt)
+        # Create numpy container that uses the existing buffer object passed in by user
+        np_data = np.frombuffer(log_data, dtype=np_dt)
+
+        if self.contiguous:
+            # Contiguous datasets have a fixed size; they can only be replaced
+            if (curr_length != 0):
+                raise AttributeError("Cannot append to contiguous log data in {0}.".format(self.file_handle))
 
-        # Redirect numpy array data pointer to the existing buffer object passed in by user
-        np_data.data = log_data
+            del group_handle['log_data']
+            group_handle.create_dataset("log_data", data=np_data)
+            return
 
         ds.resize((length,))
         ds[curr_length:length,] = np_data
 
 
-    def write_log_index(self, log_index=None):
+    def write_log_index(self, log_index=None, next_hdr_offset=None):
         """Write the log index to the log container.
 
-        If the log index currently exists in the HDF5 file, that log index 
-        will be replaced with this new log index.  If log_index is provided
-        then that log index will be written to the log container.  Otherwise,
-        a raw log index will be generated and added to the log container.
+        If log_index is provided then that log index will replace any log 
+        index currently in the HDF5 file.  Otherwise, a raw log index will 
+        be generated and added to the log container:  if the log container 
+        already has a raw log index, only the log data appended since that
+        index was written is indexed and the new offsets are appended to the
+        existing log index datasets.
         
         Attributes:
-            log_index        -- Log index generated from WLAN Exp log data
+            log_index        -- Log index generated from WLAN Exp log data; 
+                                values can be lists or numpy arrays
+            next_hdr_offset  -- Offset in the log data of the first entry 
+                                header not in log_index (see 
+                                log_util.gen_partial_raw_log_index()).  If 
+                                not provided with the log_index, the next 
+                                write_log_index() will re-index all the 
+                                log data.
         """
         import numpy as np
 
@@ -228,36 +305,205 @@ class HDF5LogContainer(log_util.LogContainer):
         index_name   = "log_index"
         group_handle = self._get_valid_group_handle()
         
-        if log_index is None:        
-            log_index = self._create_raw_log_index()
+        if log_index is None:
+            # Resume indexing where the current log index ended
+            try:
+                index_grp       = group_handle[index_name]
+                next_hdr_offset = int(index_grp.attrs['next_hdr_offset'])
+            except KeyError:
+                index_grp       = None
+                next_hdr_offset = 0
+
+            (log_index, next_hdr_offset) = self._create_raw_log_index(next_hdr_offset)
 
             if log_index is None:
                 raise AttributeError("Unable to create raw log index for group: {0}\n".format(group_handle))
 
-        # Delete any existing 'log_index' in the group
-        try:
-            del group_handle[index_name]
-        except:
-            pass
+            if index_grp is not None:
+                self._append_log_index(index_grp, log_index, next_hdr_offset)
+                return
+
+        # Delete any existing 'log_index' (and the secondary indexes derived
+        #   from it) in the group
+        for name in [index_name, "timestamp_index", "addr_index", "np_array_cache"]:
+            try:
+                del group_handle[name]
+            except:
+                pass
 
         # Write the log index to the group        
         try:
             index_grp = group_handle.create_group(index_name)
     
             for k, v in log_index.items():
-                # Check if highest-valued entry index can be represented as uint32 or requires uint64
-                if (v[-1] < 2**32):
-                    dtype = np.uint32
-                else:
-                    dtype = np.uint64
+                # Offsets are stored as uint32 if the highest-valued entry index can be 
+                #   represented as uint32; uint64 otherwise (LogIndex arrays already are)
+                offsets = log_util._index_array(v)
         
                 # Group names must be strings - keys here are known to be integers (entry_type_id values)
-                index_grp.create_dataset(str(k), data=np.array(v, dtype=dtype), maxshape=(None,), compression=self.compression)
+                index_grp.create_dataset(str(k), data=offsets, maxshape=(None,), compression=self.compression)
+
+            if next_hdr_offset is not None:
+                index_grp.attrs['next_hdr_offset'] = np.uint64(next_hdr_offset)
         except Exception as err:
             print("ERROR:\n    {0}\n".format(err))
             raise AttributeError("Unable to add log_index to log container: {0}\n".format(group_handle))
 
 
+    def write_timestamp_index(self, timestamp_index=None):
+        """Write the timestamp index to the log container.
+
+        If timestamp_index is provided then that timestamp index will replace
+        any timestamp index currently in the HDF5 file.  Otherwise, the 
+        timestamp index of the raw log index is generated (see 
+        get_timestamp_index()) and written to the log container.
+
+        Attributes:
+            timestamp_index  -- Timestamp index of the raw log index of the 
+                                log container (see 
+                                log_util.gen_timestamp_index())
+        """
+        if not self._file_writeable():
+            raise AttributeError("File {0} is not writeable.".format(self.file_handle))
+
+        index_name   = "timestamp_index"
+        group_handle = self._get_valid_group_handle()
+
+        if timestamp_index is None:
+            timestamp_index = self.get_timestamp_index()
+
+        try:
+            del group_handle[index_name]
+        except KeyError:
+            pass
+
+        try:
+            index_grp = group_handle.create_group(index_name)
+
+            for k, (timestamps, offsets) in timestamp_index.items():
+                key_grp = index_grp.create_group(str(k))
+                key_grp.create_dataset("timestamp", data=timestamps, compression=self.compression)
+                key_grp.create_dataset("offset", data=log_util._index_array(offsets), compression=self.compression)
+        except Exception as err:
+            print("ERROR:\n    {0}\n".format(err))
+            raise AttributeError("Unable to add timestamp_index to log container: {0}\n".format(group_handle))
+
+
+    def write_addr_index(self, addr_index=None):
+        """Write the MAC address index to the log container.
+
+        If addr_index is provided then that MAC address index will replace
+        any MAC address index currently in the HDF5 file.  Otherwise, the 
+        MAC address index of the raw log index is generated (see 
+        get_addr_index()) and written to the log container.
+
+        Attributes:
+            addr_index       -- MAC address index of the raw log index of the
+                                log container (see log_util.gen_addr_index())
+        """
+        if not self._file_writeable():
+            raise AttributeError("File {0} is not writeable.".format(self.file_handle))
+
+        index_name   = "addr_index"
+        group_handle = self._get_valid_group_handle()
+
+        if addr_index is None:
+            addr_index = self.get_addr_index()
+
+        try:
+            del group_handle[index_name]
+        except KeyError:
+            pass
+
+        try:
+            index_grp = group_handle.create_group(index_name)
+
+            for k, fields in addr_index.items():
+                key_grp = index_grp.create_group(str(k))
+
+                for addr_field, (addrs, starts, offsets) in fields.items():
+                    field_grp = key_grp.create_group(addr_field)
+                    field_grp.create_dataset("addr", data=addrs, compression=self.compression)
+                    field_grp.create_dataset("start", data=starts, compression=self.compression)
+                    field_grp.create_dataset("offset", data=log_util._index_array(offsets), compression=self.compression)
+        except Exception as err:
+            print("ERROR:\n    {0}\n".format(err))
+            raise AttributeError("Unable to add addr_index to log container: {0}\n".format(group_handle))
+
+
+    def write_log_summary(self, log_summary=None):
+        """Write the log summary to the 'log_summary' group of the log container.
+
+        Attributes:
+            log_summary      -- Log summary of the log data in the log 
+                                container (see log_util.gen_log_summary()).
+                                If not provided, the log summary is generated
+                                from the log data in the log container.
+        """
+        import numpy as np
+
+        if not self._file_writeable():
+            raise AttributeError("File {0} is not writeable.".format(self.file_handle))
+
+        group_handle = self._get_valid_group_handle()
+
+        if log_summary is None:
+            log_summary = log_util.gen_log_summary(self.get_log_data_window())
+
+        try:
+            if "log_summary" in group_handle:
+                del group_handle["log_summary"]
+
+            summary_grp = group_handle.create_group("log_summary")
+
+            ds = summary_grp.create_dataset("summary", data=log_summary)
+            ds.attrs['log_data_size'] = np.uint64(self.get_log_data_size())
+        except Exception as err:
+            print("ERROR:\n    {0}\n".format(err))
+            raise AttributeError("Unable to add log_summary to log container: {0}\n".format(group_handle))
+
+
+    def write_np_arrays(self, np_arrays, fields=None):
+        """Write numpy arrays of the entries in the log container to the numpy
+        array cache of the log container (see get_np_arrays()).
+
+        Attributes:
+            np_arrays        -- Dictionary of numpy arrays keyed by entry type
+                                (see log_util.log_data_to_np_arrays()).  Each
+                                array must have all entries of its entry type
+                                in the raw log index of the log container.
+            fields           -- Fields included in the numpy arrays (see 
+                                log_util.log_data_to_np_arrays())
+        """
+        import numpy as np
+        from .entry_types import log_entry_types
+
+        if not self._file_writeable():
+            raise AttributeError("File {0} is not writeable.".format(self.file_handle))
+
+        group_handle  = self._get_valid_group_handle()
+        log_data_size = np.uint64(self.get_log_data_size())
+
+        try:
+            cache_grp = group_handle.require_group("np_array_cache")
+
+            for k, v in np_arrays.items():
+                entry_type = log_entry_types[k]
+                type_grp   = cache_grp.require_group(str(entry_type))
+                ds_name    = _get_np_array_cache_name(log_util._get_entry_type_fields(fields, entry_type))
+
+                if ds_name in type_grp:
+                    del type_grp[ds_name]
+
+                ds = type_grp.create_dataset(ds_name, data=v, compression=self.compression)
+
+                ds.attrs['fingerprint']   = _get_entry_type_fingerprint(entry_type)
+                ds.attrs['log_data_size'] = log_data_size
+        except Exception as err:
+            print("ERROR:\n    {0}\n".format(err))
+            raise AttributeError("Unable to add np_array_cache to log container: {0}\n".format(group_handle))
+
+
     def write_attr_dict(self, attr_dict):
         """Add the given attribute dictionary to the opened log container.
 
@@ -305,24 +551,76 @@ class HDF5LogContainer(log_util.LogContainer):
         return ds.shape[0]
 
 
-    def get_log_data(self):
-        """Get the log data from the log container."""
+    def get_log_data(self, mmap=False):
+        """Get the log data from the log container.
+
+        Attributes:
+            mmap       -- Return a read-only numpy memmap of the log data in 
+                          the file instead of reading the log data in to 
+                          memory.  This requires contiguous, uncompressed log
+                          data (see the 'contiguous' attribute).  Otherwise, 
+                          a warning is printed and the log data is read.
+
+        Returns:
+            bytearray of the log data or uint8 numpy memmap (if mmap=True)
+        """
         import numpy as np
 
         group_handle = self._get_valid_group_handle()
         
         # Get the log_data from the group data set
         ds           = group_handle['log_data']
-        log_data_np  = np.empty(shape=ds.shape, dtype=ds.dtype)
-    
-        # Use the h5py library's HDF5 -> numpy hooks to preserve the log_data size and void type
-        ds.read_direct(log_data_np)
-    
-        # Point to the numpy array's underlying buffer to find the raw log_data to return
-        log_data = bytes(log_data_np.data)
+
+        if mmap:
+            offset = ds.id.get_offset()
+
+            if (ds.chunks is None) and (ds.compression is None) and (offset is not None):
+                return np.memmap(self.file_handle.filename, dtype=np.uint8, mode='r', offset=offset, shape=(ds.shape[0],))
+
+            msg  = "WARNING: Log data in group {0} of {1} ".format(self.hdf5_group_name, self.file_handle)
+            msg += "is not contiguous.  Reading log data in to memory."
+            print(msg)
+
+        log_data     = bytearray(ds.shape[0])
+
+        # Use the h5py library's HDF5 -> numpy hooks to read the log_data directly
+        #   in to the buffer that is returned
+        if (ds.shape[0] > 0):
+            ds.read_direct(np.frombuffer(log_data, dtype=ds.dtype))
     
         return log_data
 
+
+    def get_log_data_window(self, start=0, end=None):
+        """Get a window of the log data from the log container.
+
+        Only the requested bytes are read from the file, so this can be used
+        for log data that is chunked and compressed as well as contiguous log
+        data.
+
+        Attributes:
+            start      -- Offset of the first byte of the window
+            end        -- Offset of the end of the window (exclusive); None 
+                          for the end of the log data
+
+        Returns:
+            uint8 numpy array of the log data in [start, end)
+        """
+        import numpy as np
+
+        group_handle = self._get_valid_group_handle()
+        ds           = group_handle['log_data']
+
+        if end is None:
+            end = ds.shape[0]
+        else:
+            end = min(end, ds.shape[0])
+
+        if (start >= end):
+            return np.zeros((0,), dtype=np.uint8)
+
+        return ds[start:end].view(np.uint8)
+
     
     def get_log_index(self, gen_index=True):
         """Get the raw log index from the log container.
@@ -330,9 +628,12 @@ class HDF5LogContainer(log_util.LogContainer):
         Attributes:
             gen_index  -- Generate the raw log index if the log index does not 
                           exist in the log container.
+
+        Returns:
+            LogIndex with the uint32 / uint64 offset arrays of the log container
         """
         error        = False
-        log_index    = {}        
+        log_index    = log_util.LogIndex()
         group_handle = self._get_valid_group_handle()
             
         # Get the raw_log_index group from the specified group
@@ -341,18 +642,25 @@ class HDF5LogContainer(log_util.LogContainer):
             
             for k, v in index_group.items():
                 #Re-construct the raw_log_index dictionary, using integers
-                # (really entry_type IDs) as the keys and Python lists as values
-                # the [:] slice here is important - flattening the returned numpy array before
-                #  listifying is *way* faster (>10x) than just v.toList()
-            
+                # (really entry_type IDs) as the keys and the numpy arrays of 
+                # the datasets as values
+                # the [:] slice here reads the whole dataset in to a numpy array
                 try:
-                    log_index[int(k)] = v[:].tolist()
+                    log_index[int(k)] = v[:]
                 except ValueError:
-                    log_index[k]      = v[:].tolist()                    
-    
-                #Alternative to [:].toList() above - adds safetly in assuring dictionary value is
-                # Python list of ints, an requirement of downstream methods
-                #raw_log_index[int(k)] = map(int, v[:]) #fastish    
+                    log_index[k]      = v[:]
+
+            # Index any log data appended since the log index was written
+            try:
+                next_hdr_offset = int(index_group.attrs['next_hdr_offset'])
+            except KeyError:
+                next_hdr_offset = None
+
+            if next_hdr_offset is not None:
+                (new_log_index, _) = self._create_raw_log_index(next_hdr_offset)
+
+                if new_log_index:
+                    log_util.merge_log_indexes(log_index, new_log_index, 0)
         except:
             error = True
         
@@ -360,7 +668,7 @@ class HDF5LogContainer(log_util.LogContainer):
         #   gen_index=True, then generate the raw_log_index from the log_data
         #   in the file
         if error and gen_index:
-            log_index = self._create_raw_log_index()
+            (log_index, _) = self._create_raw_log_index()
 
         # If the log index is empty or None, then raise an exception        
         if not log_index:
@@ -371,6 +679,220 @@ class HDF5LogContainer(log_util.LogContainer):
         return log_index
 
    
+    def get_timestamp_index(self, gen_index=True):
+        """Get the timestamp index of the raw log index from the log container.
+
+        Entries of the raw log index that are not in the timestamp index in
+        the HDF5 file (ie log data was appended since the timestamp index was
+        written) are added to the returned timestamp index.  Only the window
+        of the log data containing those entries is read.
+
+        Attributes:
+            gen_index  -- Generate the timestamp index if it does not exist
+                          in the log container
+
+        Returns:
+            Timestamp index (see log_util.gen_timestamp_index())
+        """
+        import numpy as np
+
+        timestamp_index = {}
+        group_handle    = self._get_valid_group_handle()
+
+        try:
+            index_grp = group_handle["timestamp_index"]
+        except KeyError:
+            index_grp = None
+
+            if not gen_index:
+                msg  = "Unable to get timestamp index from "
+                msg += "group {0} of {1}.".format(self.hdf5_group_name, self.file_handle)
+                raise AttributeError(msg)
+
+        if index_grp is not None:
+            for k, v in index_grp.items():
+                try:
+                    key = int(k)
+                except ValueError:
+                    key = k
+
+                timestamp_index[key] = (v["timestamp"][:], v["offset"][:])
+
+        num_indexed = dict((k, len(v[1])) for (k, v) in timestamp_index.items())
+
+        (new_index, log_data, start) = self._get_unindexed_entries(num_indexed, gen_index, np.dtype(np.uint64).itemsize)
+
+        if new_index:
+            log_util._merge_timestamp_indexes(timestamp_index, log_util.gen_timestamp_index(log_data, new_index, start))
+
+        return timestamp_index
+
+
+    def get_addr_index(self, gen_index=True):
+        """Get the MAC address index of the raw log index from the log container.
+
+        As with get_timestamp_index(), entries of the raw log index that are 
+        not in the MAC address index in the HDF5 file are added to the 
+        returned MAC address index.
+
+        Attributes:
+            gen_index  -- Generate the MAC address index if it does not exist
+                          in the log container
+
+        Returns:
+            MAC address index (see log_util.gen_addr_index())
+        """
+        from .entry_types import log_entry_types, np_array_add_MAC_addr_fields
+
+        addr_index   = {}
+        group_handle = self._get_valid_group_handle()
+
+        try:
+            index_grp = group_handle["addr_index"]
+        except KeyError:
+            index_grp = None
+
+            if not gen_index:
+                msg  = "Unable to get addr index from "
+                msg += "group {0} of {1}.".format(self.hdf5_group_name, self.file_handle)
+                raise AttributeError(msg)
+
+        if index_grp is not None:
+            for k, key_grp in index_grp.items():
+                try:
+                    key = int(k)
+                except ValueError:
+                    key = k
+
+                addr_index[key] = {}
+
+                for addr_field, v in key_grp.items():
+                    addr_index[key][addr_field] = (v["addr"][:], v["start"][:], v["offset"][:])
+
+        # Number of entries of each key in the MAC address index
+        num_indexed = {}
+
+        for k, fields in addr_index.items():
+            for (_, _, offsets) in fields.values():
+                num_indexed[k] = len(offsets)
+
+        # Only entry types that record a MAC header (ie TX, TX_LOW, RX_OFDM and RX_DSSS) are indexed
+        mac_types  = [t for t in set(log_entry_types.values()) if np_array_add_MAC_addr_fields in t.gen_numpy_callbacks]
+
+        # Entries must be read through the end of the MAC header
+        entry_size = max(t.get_codec().itemsize for t in mac_types)
+
+        (new_index, log_data, start) = self._get_unindexed_entries(num_indexed, gen_index, entry_size, mac_types)
+
+        if new_index:
+            log_util._merge_addr_indexes(addr_index, log_util.gen_addr_index(log_data, new_index, start))
+
+        return addr_index
+
+
+    def get_log_summary(self, gen_summary=True):
+        """Get the log summary from the log container.
+
+        The log summary stored in the log container (see write_log_summary()) is used 
+        if it describes all of the log data.  Otherwise, the log summary is
+        generated from the log data and, if the HDF5 file is writeable, 
+        stored so that the next call does not need to read the log data.
+
+        Attributes:
+            gen_summary -- Generate the log summary if there is no valid log
+                           summary in the log container
+
+        Returns:
+            Log summary (see log_util.gen_log_summary())
+        """
+        group_handle = self._get_valid_group_handle()
+
+        try:
+            ds = group_handle["log_summary"]["summary"]
+
+            if (int(ds.attrs['log_data_size']) == self.get_log_data_size()):
+                return ds[:]
+        except KeyError:
+            pass
+
+        if not gen_summary:
+            msg  = "Unable to get log summary from "
+            msg += "group {0} of {1}.".format(self.hdf5_group_name, self.file_handle)
+            raise AttributeError(msg)
+
+        log_summary = log_util.gen_log_summary(self.get_log_data_window())
+
+        if self._file_writeable():
+            self.write_log_summary(log_summary)
+
+        return log_summary
+
+
+    def get_np_arrays(self, entry_types=None, fields=None, use_cache=True, save_cache=False):
+        """Get the numpy arrays of the entries in the log container.
+
+        The numpy array of an entry type is read from the numpy array cache 
+        of the log container if it was written for the same entry type 
+        definition, fields and log data (see write_np_arrays()).  Otherwise,
+        the numpy array is generated from the log data.  If save_cache is 
+        True and the HDF5 file is writeable, generated numpy arrays are 
+        stored in the cache so that the next call is a dataset read.  The 
+        cache is removed when log data is written to the log container.
+
+        Attributes:
+            entry_types      -- List of entry types (or their names) to 
+                                include.  By default, all entry types in the
+                                raw log index are included.
+            fields           -- Fields to include in the numpy arrays (see 
+                                log_util.log_data_to_np_arrays())
+            use_cache        -- Read valid numpy arrays from the cache
+            save_cache       -- Store generated numpy arrays in the cache
+
+        Returns:
+            Dictionary of numpy arrays keyed by entry type with all entries of
+            each entry type (see log_util.log_data_to_np_arrays())
+        """
+        log_index = log_util.filter_log_index(self.get_log_index(), include_only=entry_types)
+        np_arrays = dict()
+
+        if use_cache:
+            log_data_size = self.get_log_data_size()
+
+            try:
+                cache_grp = self._get_valid_group_handle()["np_array_cache"]
+            except KeyError:
+                cache_grp = None
+
+            for k in log_index.keys():
+                ds_name = _get_np_array_cache_name(log_util._get_entry_type_fields(fields, k))
+
+                try:
+                    ds = cache_grp[str(k)][ds_name]
+
+                    if ((int(ds.attrs['log_data_size']) == log_data_size) and
+                            (ds.attrs['fingerprint'] == _get_entry_type_fingerprint(k))):
+                        np_arrays[k] = ds[...]
+                except (KeyError, TypeError):
+                    pass
+
+        # Generate the numpy arrays that are not in the cache
+        new_index = log_util.LogIndex()
+
+        for k in log_index.keys():
+            if k not in np_arrays:
+                new_index[k] = log_index[k]
+
+        if new_index:
+            new_arrays = log_util.log_data_to_np_arrays(self.get_log_data(), new_index, fields)
+
+            if save_cache and self._file_writeable():
+                self.write_np_arrays(new_arrays, fields)
+
+            np_arrays.update(new_arrays)
+
+        return np_arrays
+
+
     def get_attr_dict(self):
         """Get the attribute dictionary from the log container."""
         import numpy as np
@@ -439,6 +961,51 @@ class HDF5LogContainer(log_util.LogContainer):
         return None
 
 
+    def _get_unindexed_entries(self, num_indexed, gen_index, entry_size, entry_types=None):
+        """Internal method to get the entries of the raw log index that are 
+        not in a secondary index (ie timestamp or MAC address index) of the
+        raw log index.
+
+        The raw log index is in log order and only grows, so these are the 
+        offsets of each key past the number of entries already indexed.
+
+        Attributes:
+            num_indexed      -- Dictionary of the number of entries of each 
+                                key in the secondary index
+            gen_index        -- Generate the raw log index if necessary
+            entry_size       -- Number of bytes of each entry needed to 
+                                generate the secondary index
+            entry_types      -- List of WlanExpLogEntryType of the keys in
+                                the secondary index (default: all keys)
+
+        Returns:
+            Tuple (new_index, log_data, start):
+                new_index    -- LogIndex of the entries not indexed
+                log_data     -- Window of the log data with the new entries
+                start        -- Offset of the window in the log data
+        """
+        from .entry_types import log_entry_types
+
+        log_index = self.get_log_index(gen_index)
+        new_index = log_util.LogIndex()
+
+        for k, v in log_index.items():
+            # Keys of other entry types are never in the secondary index
+            if (entry_types is not None) and (log_entry_types.get(k) not in entry_types):
+                continue
+
+            if (len(v) > num_indexed.get(k, 0)):
+                new_index[k] = v[num_indexed.get(k, 0):]
+
+        if not new_index:
+            return (new_index, None, 0)
+
+        start = min(int(v[0]) for v in new_index.values())
+        end   = max(int(v[-1]) for v in new_index.values()) + entry_size
+
+        return (new_index, self.get_log_data_window(start, end), start)
+
+
     def _create_container(self, group):
         """Internal method to create a valid log data container."""
         import numpy as np
@@ -456,15 +1023,59 @@ class HDF5LogContainer(log_util.LogContainer):
         group.create_dataset("log_data", data=np_data, maxshape=(None,), compression=self.compression)
 
 
-    def _create_raw_log_index(self):
-        """Internal method to create a raw log index pulling data from the HDF5 file."""
+    def _create_raw_log_index(self, start=0):
+        """Internal method to create a raw log index pulling data from the HDF5 file.
+
+        Attributes:
+            start            -- Offset of the entry header in the log data 
+                                where indexing starts
+
+        Returns:
+            Tuple (raw_log_index, next_hdr_offset) with offsets relative to
+            the start of the log data; (None, None) if there was an error.
+        """
         try:
-            log_data       = self.get_log_data()
-            raw_log_index  = log_util.gen_raw_log_index(log_data)
+            log_data = self.get_log_data_window(start)
+            (raw_log_index, next_hdr_offset) = log_util.gen_partial_raw_log_index(log_data)
+
+            if start:
+                raw_log_index    = log_util.merge_log_indexes(log_util.LogIndex(), raw_log_index, start)
+                next_hdr_offset += start
         except:
-            raw_log_index = None
+            raw_log_index   = None
+            next_hdr_offset = None
         
-        return raw_log_index
+        return (raw_log_index, next_hdr_offset)
+
+
+    def _append_log_index(self, index_grp, log_index, next_hdr_offset):
+        """Internal method to append a raw log index to the log index datasets."""
+        import numpy as np
+
+        try:
+            for k, v in log_index.items():
+                offsets = log_util._index_array(v)
+
+                if str(k) not in index_grp:
+                    index_grp.create_dataset(str(k), data=offsets, maxshape=(None,), compression=self.compression)
+                    continue
+
+                ds = index_grp[str(k)]
+
+                # Re-create uint32 datasets whose new offsets require uint64
+                if (ds.dtype == np.uint32) and (offsets.dtype == np.uint64):
+                    old_offsets = ds[:]
+                    del index_grp[str(k)]
+                    ds = index_grp.create_dataset(str(k), data=old_offsets.astype(np.uint64), maxshape=(None,), compression=self.compression)
+
+                curr_length = ds.shape[0]
+                ds.resize((curr_length + len(offsets),))
+                ds[curr_length:] = offsets
+
+            index_grp.attrs['next_hdr_offset'] = np.uint64(next_hdr_offset)
+        except Exception as err:
+            print("ERROR:\n    {0}\n".format(err))
+            raise AttributeError("Unable to append to log_index of log container: {0}\n".format(index_grp))
 
 
     def _file_writeable(self):
@@ -537,7 +1148,23 @@ def hdf5_close_file(file_handle):
 
 
 
-def log_data_to_hdf5(log_data, filename, attr_dict=None, gen_index=True, overwrite=False, compression=None):
+def _hdf5_open_existing_file(filename):
+    """Internal method to open an existing HDF5 file in read/write mode.
+
+    Unlike hdf5_open_file(filename, append=True), the file is never created,
+    so a missing file raises an exception like hdf5_open_file(filename, 
+    readonly=True).
+    """
+    import h5py
+
+    # Open a HDF5 File Object in 'r+' (Read/Write, file must exist) mode
+    return h5py.File(filename, mode='r+')
+
+# End def
+
+
+
+def log_data_to_hdf5(log_data, filename, attr_dict=None, gen_index=True, overwrite=False, compression=None, contiguous=False):
     """Create an HDF5 file that contains the log_data, a raw_log_index, and any
     user attributes.
 
@@ -554,6 +1181,9 @@ def log_data_to_hdf5(log_data, filename, attr_dict=None, gen_index=True, overwri
         gen_index  -- Generate the 'raw_log_index' from the log_data and store it in the 
                       file.
         overwrite  -- If true method will overwrite existing file with filename
+        compression -- HDF5 compression setting for the log data
+        contiguous -- Store the log data contiguously and uncompressed so that
+                      it can be memory-mapped (see hdf5_to_log_data())
     """
     # Need to not print warnings if overwrite is True
     print_warnings = not overwrite
@@ -565,7 +1195,7 @@ def log_data_to_hdf5(log_data, filename, attr_dict=None, gen_index=True, overwri
     real_filename = file_handle.filename
 
     # Create an HDF5 Log Container
-    container     = HDF5LogContainer(file_handle)
+    container     = HDF5LogContainer(file_handle, compression=compression, contiguous=contiguous)
 
     # Add the log data    
     container.write_log_data(log_data)
@@ -575,8 +1205,8 @@ def log_data_to_hdf5(log_data, filename, attr_dict=None, gen_index=True, overwri
     #          in memory, we do not need to use the default write_log_index which
     #          pulls the log data out of the HDF5 file to create the raw log index.
     if gen_index:
-        raw_log_index = log_util.gen_raw_log_index(log_data)
-        container.write_log_index(raw_log_index)
+        (raw_log_index, next_hdr_offset) = log_util.gen_partial_raw_log_index(log_data)
+        container.write_log_index(raw_log_index, next_hdr_offset)
     
     # Add the attribute dictionary to the group
     if attr_dict is not None:
@@ -595,12 +1225,15 @@ def log_data_to_hdf5(log_data, filename, attr_dict=None, gen_index=True, overwri
 
 
 
-def hdf5_to_log_data(filename=None, group_name=None):
+def hdf5_to_log_data(filename=None, group_name=None, mmap=False):
     """Extract the log_data from an HDF5 Log Container
 
     Attributes:
         filename   -- Name of HDF5 file to open as a h5py File object
         group_name -- Name of Group within the HDF5 file object
+        mmap       -- Return a read-only numpy memmap of contiguous log data
+                      instead of reading it in to memory (see 
+                      HDF5LogContainer.get_log_data())
     
     Returns:
         log_data from HDF5 file
@@ -613,8 +1246,8 @@ def hdf5_to_log_data(filename=None, group_name=None):
     # Create an HDF5 Log Container
     container   = HDF5LogContainer(file_handle, group_name)
 
-    # Extract the attribute dictionary
-    log_data    = container.get_log_data()
+    # Extract the log data
+    log_data    = container.get_log_data(mmap)
 
     # Close the file 
     hdf5_close_file(file_handle)
@@ -658,6 +1291,124 @@ def hdf5_to_log_index(filename=None, group_name=None, gen_index=True):
 
 
 
+def hdf5_to_log_summary(filename=None, group_name=None, save_summary=True):
+    """Get the log summary of an HDF5 Log Container.
+
+    Attributes:
+        filename     -- Name of HDF5 file to open as a h5py File object
+        group_name   -- Name of Group within the HDF5 file object
+        save_summary -- Store a generated log summary in the HDF5 file so 
+                        that it does not need to be generated again (only
+                        if the file exists and is writeable)
+
+    Returns:
+        Log summary of the log data in the HDF5 file (see 
+        log_util.gen_log_summary())
+    """
+    log_summary = None
+
+    file_handle = None
+
+    # Open the file; if it cannot be written, the log summary is not stored
+    if save_summary:
+        try:
+            file_handle = _hdf5_open_existing_file(filename)
+        except (IOError, OSError):
+            file_handle = None
+
+    if file_handle is None:
+        file_handle = hdf5_open_file(filename, readonly=True)
+
+    # Create an HDF5 Log Container
+    container   = HDF5LogContainer(file_handle, group_name)
+
+    # Extract the log summary
+    log_summary = container.get_log_summary()
+
+    # Close the file
+    hdf5_close_file(file_handle)
+
+    return log_summary
+
+# End hdf5_to_log_summary()
+
+
+
+def hdf5_to_np_arrays(filename=None, group_name=None, entry_types=None, fields=None, save_arrays=False):
+    """Get the numpy arrays of the entries of an HDF5 Log Container.
+
+    Attributes:
+        filename     -- Name of HDF5 file to open as a h5py File object
+        group_name   -- Name of Group within the HDF5 file object
+        entry_types  -- List of entry type names to include (default: all)
+        fields       -- Fields to include in the numpy arrays
+        save_arrays  -- Store generated numpy arrays in the HDF5 file so that
+                        they do not need to be generated again (the file
+                        must exist and be writeable)
+
+    Returns:
+        Dictionary of numpy arrays keyed by entry type (see 
+        HDF5LogContainer.get_np_arrays())
+    """
+    np_arrays   = None
+
+    # Open the file
+    if save_arrays:
+        file_handle = _hdf5_open_existing_file(filename)
+    else:
+        file_handle = hdf5_open_file(filename, readonly=True)
+
+    # Create an HDF5 Log Container
+    container   = HDF5LogContainer(file_handle, group_name)
+
+    # Extract the numpy arrays
+    np_arrays   = container.get_np_arrays(entry_types, fields, save_cache=save_arrays)
+
+    # Close the file
+    hdf5_close_file(file_handle)
+
+    return np_arrays
+
+# End hdf5_to_np_arrays()
+
+
+
+def hdf5_to_np_array_batches(filename=None, group_name=None, entry_types=None, fields=None, 
+                             batch_size=2**16, window_size=2**26):
+    """Generate numpy structured arrays of fixed-size batches of the entries 
+    of an HDF5 Log Container without reading the log data in to memory.
+
+    Attributes:
+        filename     -- Name of HDF5 file to open as a h5py File object
+        group_name   -- Name of Group within the HDF5 file object
+        entry_types  -- List of entry type names to include (default: all)
+        fields       -- Fields to include in the numpy arrays
+        batch_size   -- Number of entries in each batch
+        window_size  -- Number of bytes of log data read from the file at a
+                        time
+
+    Yields:
+        Tuples (entry_type, np_arr) (see log_util.log_data_to_np_array_batches())
+
+    The file is open until the generator is exhausted or closed.
+    """
+    # Open the file
+    file_handle = hdf5_open_file(filename, readonly=True)
+
+    try:
+        # Create an HDF5 Log Container
+        container = HDF5LogContainer(file_handle, group_name)
+
+        for batch in log_util.log_data_to_np_array_batches(container, entry_types, fields, batch_size, window_size):
+            yield batch
+    finally:
+        # Close the file
+        hdf5_close_file(file_handle)
+
+# End hdf5_to_np_array_batches()
+
+
+
 def hdf5_to_attr_dict(filename=None, group_name=None):
     """Extract the attribute dictionary from an HDF5 Log Container.
 
@@ -806,6 +1557,35 @@ def np_arrays_to_hdf5(filename, np_log_dict, attr_dict=None, compression=None):
 #-----------------------------------------------------------------------------
 # Internal HDF5 file Utilities
 #-----------------------------------------------------------------------------
+def _get_np_array_cache_name(fields):
+    """Internal method to get the name of the numpy array cache dataset of 
+    the given fields.
+    """
+    if fields is None:
+        return "ALL"
+    else:
+        return ",".join(sorted(set(fields)))
+
+# End def
+
+
+def _get_entry_type_fingerprint(entry_type):
+    """Internal method to get the fingerprint of an entry type definition.
+
+    The fingerprint changes if the fields of the entry type or the fields 
+    added by its gen_numpy callbacks change, so numpy arrays cached for a
+    different definition of the entry type are not used.
+    """
+    import hashlib
+
+    callbacks = [(c.__name__, getattr(c, 'output_fields', None), getattr(c, 'output_formats', None))
+                     for c in entry_type.gen_numpy_callbacks]
+    defn      = (entry_type.name, entry_type.entry_type_id, entry_type.fields_np_dt.descr, callbacks)
+
+    return hashlib.sha1(repr(defn).encode('utf-8')).hexdigest()
+
+# End def
+
 
 
 
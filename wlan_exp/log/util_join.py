@@ -0,0 +1,588 @@
+# -*- coding: utf-8 -*-
+"""
+------------------------------------------------------------------------------
+WLAN Experiment Log Joins
+------------------------------------------------------------------------------
+Authors:   Chris Hunter (chunter [at] mangocomm.com)
+           Patrick Murphy (murphpo [at] mangocomm.com)
+           Erik Welsh (welsh [at] mangocomm.com)
+License:   Copyright 2014, Mango Communications. All rights reserved.
+           Distributed under the WARP license (http://warpproject.org/license)
+------------------------------------------------------------------------------
+
+This module provides joins of the numpy structured arrays of related WLAN Exp
+log entries (see log_util.log_data_to_np_arrays()).
+
+Every MPDU created in CPU High is logged as one TX entry.  Every PHY
+transmission of that MPDU by CPU Low (ie the first transmission and every
+re-transmission) is logged as one TX_LOW entry with the same uniq_seq.  A
+TxJoin matches each TX entry with its TX_LOW entries by sorting the TX_LOW
+entries by uniq_seq once:
+
+    join     = TxJoin(log_np['TX'], log_np['TX_LOW'])
+
+    mpdus    = join.mpdus()                  # One record per TX entry
+    rates    = join.attempts_matrix('rate')  # Rate of each Tx attempt
+    cw       = join.attempts('cw')           # cw of each Tx attempt
+
+The join indexes are computed on first use and kept by the TxJoin, so
+repeated queries of the same join do not sort the entries again.
+
+A TxRxMatch matches the PHY transmissions in one node's log (TX_LOW) with the
+receptions of the same frames in another node's log (RX_OFDM or RX_DSSS) by
+transmitter address, MAC sequence number and time.  The timestamps of the two
+logs are aligned with the offset between the nodes' microsecond timers,
+computed from the TIME_INFO entries written to both logs by
+wlan_exp.util.broadcast_cmd_write_time_to_logs():
+
+    offset   = calc_clock_offset(ap_np['TIME_INFO'], sta_np['TIME_INFO'])
+    match    = TxRxMatch(ap_np['TX_LOW'], sta_np['RX_OFDM'], offset)
+
+    frames   = match.frames()                # One record per TX_LOW entry
+    loss     = 1.0 - frames['received'].mean()
+
+Naming convention:
+
+  tx             -- numpy structured array of TX entries
+
+  tx_low         -- numpy structured array of TX_LOW entries
+
+  attempt        -- One PHY transmission (ie one TX_LOW entry) of an MPDU
+
+  rx             -- numpy structured array of RX_OFDM or RX_DSSS entries
+
+  clock_offset   -- Microsecond timer of the receiving node minus the
+                    microsecond timer of the transmitting node
+
+"""
+
+__all__ = ['TxJoin',
+           'TxRxMatch',
+           'calc_clock_offset']
+
+
+from . import util as log_util
+
+
+# Number of bits of the 802.11 MAC header sequence number
+_MAC_SEQ_BITS       = 12
+
+# TIME_INFO new_time value if the timer was not changed
+_TIME_NOT_CHANGED   = 0xFFFFFFFFFFFFFFFF
+
+
+#-----------------------------------------------------------------------------
+# Log Join Classes
+#-----------------------------------------------------------------------------
+class TxJoin(object):
+    """Class to define the join of TX entries with their TX_LOW entries.
+
+    Attributes:
+        tx                   -- numpy structured array of TX entries
+        tx_low               -- numpy structured array of TX_LOW entries
+
+    The MPDUs of the join are the TX entries (in the order of tx).  The
+    attempts of each MPDU are its TX_LOW entries in log order.  TX_LOW
+    entries without a TX entry (eg if the TX entries were not logged) are not
+    part of the join.  The uniq_seq of each TX entry must be unique in tx.
+    """
+    tx                       = None
+    tx_low                   = None
+
+    _attempt_idx             = None
+    _attempt_starts          = None
+    _num_attempts            = None
+    _mpdus                   = None
+
+
+    def __init__(self, tx, tx_low):
+        self.tx     = tx
+        self.tx_low = tx_low
+
+
+    def num_attempts(self):
+        """Number of TX_LOW entries of each TX entry."""
+        self._gen_join_index()
+        return self._num_attempts
+
+
+    def attempt_starts(self):
+        """Index in to the attempt arrays (see attempts()) of the first
+        attempt of each TX entry.
+        """
+        self._gen_join_index()
+        return self._attempt_starts
+
+
+    def attempt_indexes(self):
+        """Indexes in to tx_low of the attempts of all TX entries, grouped by
+        TX entry (in the order of tx) and in log order for each TX entry.
+        """
+        self._gen_join_index()
+        return self._attempt_idx
+
+
+    def attempts(self, field):
+        """Get a field of the attempts of all TX entries.
+
+        Attributes:
+            field            -- Name of the TX_LOW field (eg 'rate', 'cw',
+                                'num_slots')
+
+        Returns:
+            numpy array with one value per attempt, grouped by TX entry.  The
+            attempts of TX entry i are [attempt_starts()[i]:][:num_attempts()[i]].
+        """
+        return self.tx_low[field][self.attempt_indexes()]
+
+
+    def attempts_matrix(self, field, max_attempts=None, fill_value=0):
+        """Get a field of the attempts of all TX entries as a 2-D array.
+
+        Attributes:
+            field            -- Name of the TX_LOW field
+            max_attempts     -- Number of columns (default: the largest number
+                                of attempts of any TX entry); later attempts
+                                are not included
+            fill_value       -- Value of the columns after the last attempt of
+                                a TX entry
+
+        Returns:
+            numpy array of shape (len(tx), max_attempts) where element [i, j]
+            is the field of attempt j of TX entry i.
+        """
+        import numpy as np
+
+        num_attempts = self.num_attempts()
+
+        if max_attempts is None:
+            max_attempts = int(num_attempts.max()) if len(num_attempts) else 0
+
+        values    = self.attempts(field)
+        (mpdu, n) = self._get_attempt_numbers()
+
+        ret_val   = np.full((len(num_attempts), max_attempts), fill_value, dtype=values.dtype)
+
+        if (len(n) > 0) and (n.max() >= max_attempts):
+            keep   = (n < max_attempts)
+            values = values[keep]
+            mpdu   = mpdu[keep]
+            n      = n[keep]
+
+        ret_val[mpdu, n] = values
+
+        return ret_val
+
+
+    def mpdus(self):
+        """Get one record per TX entry with the results of all of its attempts.
+
+        Returns:
+            numpy structured array with one element per TX entry with fields:
+                tx_index         -- Index in to tx
+                timestamp        -- timestamp of the TX entry
+                uniq_seq         -- uniq_seq of the TX entry
+                num_attempts     -- Number of TX_LOW entries
+                first_rate       -- Rate of the first attempt (0 if none)
+                final_rate       -- Rate of the last attempt (0 if none)
+                total_slots      -- Sum of num_slots of all attempts
+                total_tx_time    -- Sum of the PHY transmission time (us) of
+                                    all attempts (see log_util.calc_tx_time())
+                result           -- result of the TX entry
+        """
+        import numpy as np
+
+        if self._mpdus is not None:
+            return self._mpdus
+
+        num_attempts = self.num_attempts()
+        starts       = self.attempt_starts()
+        has_attempts = (num_attempts > 0)
+        mpdu_dt      = [('tx_index',      np.int64),
+                        ('timestamp',     np.uint64),
+                        ('uniq_seq',      np.uint64),
+                        ('num_attempts',  np.uint32),
+                        ('first_rate',    np.uint8),
+                        ('final_rate',    np.uint8),
+                        ('total_slots',   np.uint64),
+                        ('total_tx_time', np.uint64),
+                        ('result',        np.uint8)]
+
+        ret_val = np.zeros(len(num_attempts), dtype=mpdu_dt)
+
+        ret_val['tx_index']     = np.arange(len(num_attempts))
+        ret_val['timestamp']    = self.tx['timestamp']
+        ret_val['uniq_seq']     = self.tx['uniq_seq']
+        ret_val['num_attempts'] = num_attempts
+        ret_val['result']       = self.tx['result']
+
+        if (len(self.attempt_indexes()) > 0):
+            rates   = self.attempts('rate')
+            lengths = self.attempts('length')
+            first   = starts[has_attempts]
+            last    = first + num_attempts[has_attempts] - 1
+
+            ret_val['first_rate'][has_attempts] = rates[first]
+            ret_val['final_rate'][has_attempts] = rates[last]
+
+            # Sums per TX entry are differences of the cumulative sums at the attempt starts
+            ret_val['total_slots']   = _sum_per_mpdu(self.attempts('num_slots'), starts, num_attempts)
+            # TX_LOW length includes the FCS, which log_util.calc_tx_time() adds itself
+            tx_times = log_util.calc_tx_time(rates, lengths.astype(np.int64) - 4)
+
+            ret_val['total_tx_time'] = _sum_per_mpdu(tx_times, starts, num_attempts)
+
+        self._mpdus = ret_val
+
+        return ret_val
+
+
+    def clear_cache(self):
+        """Remove the join indexes (eg if tx or tx_low were modified)."""
+        self._attempt_idx    = None
+        self._attempt_starts = None
+        self._num_attempts   = None
+        self._mpdus          = None
+
+
+    def __len__(self):
+        return len(self.tx)
+
+    def __repr__(self):
+        return "TxJoin({0:,} TX entries, {1:,} TX_LOW entries)".format(len(self.tx), len(self.tx_low))
+
+
+    #-------------------------------------------------------------------------
+    # Internal methods for the join
+    #-------------------------------------------------------------------------
+    def _gen_join_index(self):
+        """Internal method to compute the join indexes.
+
+        The TX_LOW entries are sorted by uniq_seq (with a stable sort, so the
+        attempts of each MPDU stay in log order).  TX_LOW entries are logged
+        in uniq_seq order except for re-transmissions of different MPDUs that
+        overlap in time, so the sort is usually a check that the entries are
+        already sorted.  The TX entries are then matched to the runs of
+        TX_LOW entries with the same uniq_seq by a binary search.
+        """
+        import numpy as np
+
+        if self._attempt_idx is not None:
+            return
+
+        tx_seq  = np.ascontiguousarray(self.tx['uniq_seq'])
+        low_seq = np.ascontiguousarray(self.tx_low['uniq_seq'])
+
+        if np.all(low_seq[1:] >= low_seq[:-1]):
+            low_order = None
+        else:
+            low_order = np.argsort(low_seq, kind='stable')
+            low_seq   = low_seq[low_order]
+
+        # Runs of TX_LOW entries with the same uniq_seq
+        is_first     = np.ones(len(low_seq), dtype=bool)
+        np.not_equal(low_seq[1:], low_seq[:-1], out=is_first[1:])
+
+        run_starts   = np.flatnonzero(is_first)
+        run_lengths  = np.diff(np.append(run_starts, len(low_seq)))
+        run_seqs     = low_seq[run_starts]
+
+        del is_first, low_seq
+
+        # Match each TX entry to its run
+        if (len(run_seqs) > 0):
+            run_idx      = np.minimum(np.searchsorted(run_seqs, tx_seq), len(run_seqs) - 1)
+            matched      = (run_seqs[run_idx] == tx_seq)
+            num_attempts = np.where(matched, run_lengths[run_idx], 0)
+        else:
+            run_idx      = np.zeros(len(tx_seq), dtype=np.intp)
+            matched      = np.zeros(len(tx_seq), dtype=bool)
+            num_attempts = np.zeros(len(tx_seq), dtype=np.intp)
+
+        starts       = np.cumsum(num_attempts) - num_attempts
+
+        # Index of each attempt in to the sorted TX_LOW entries:
+        #   start of the run of its TX entry + number of the attempt in the run
+        total        = int(num_attempts.sum())
+        first_idx    = np.repeat(run_starts[run_idx[matched]] - starts[matched], num_attempts[matched])
+        attempt_idx  = first_idx + np.arange(total)
+
+        if low_order is not None:
+            attempt_idx = low_order[attempt_idx]
+
+        self._attempt_idx    = attempt_idx
+        self._attempt_starts = starts
+        self._num_attempts   = num_attempts
+
+
+    def _get_attempt_numbers(self):
+        """Internal method to get the index of the TX entry and the number of
+        the attempt (ie 0 for the first attempt) of each attempt.
+        """
+        import numpy as np
+
+        num_attempts = self.num_attempts()
+        mpdu         = np.repeat(np.arange(len(num_attempts)), num_attempts)
+        n            = np.arange(len(mpdu)) - self.attempt_starts()[mpdu]
+
+        return (mpdu, n)
+
+# End class()
+
+
+
+class TxRxMatch(object):
+    """Class to define the match of the transmissions of one node with the
+    receptions of another node.
+
+    Attributes:
+        tx_low               -- numpy structured array of TX_LOW entries of
+                                the transmitting node
+        rx                   -- numpy structured array of RX_OFDM or RX_DSSS
+                                entries of the receiving node
+        clock_offset         -- Offset of the receiving node's timer (us; see
+                                calc_clock_offset())
+        max_time_diff        -- Maximum difference (us) of the aligned
+                                timestamps of a TX_LOW entry and its reception
+
+    A reception matches a transmission if both have the same transmitter
+    address (addr2) and MAC sequence number (mac_seq), and their aligned
+    timestamps differ by at most max_time_diff.  Re-transmissions of a frame
+    have the same address and sequence number, so each reception is matched
+    to the transmission with the nearest aligned timestamp, and each
+    transmission to at most one (its nearest) reception.  To count only
+    successful receptions, rx should only include entries with good FCS.
+    """
+    tx_low                   = None
+    rx                       = None
+    clock_offset             = None
+    max_time_diff            = None
+
+    _rx_idx                  = None
+
+
+    def __init__(self, tx_low, rx, clock_offset=0, max_time_diff=1000):
+        self.tx_low        = tx_low
+        self.rx            = rx
+        self.clock_offset  = int(clock_offset)
+        self.max_time_diff = int(max_time_diff)
+
+
+    def rx_indexes(self):
+        """Index in to rx of the reception of each TX_LOW entry (-1 if the
+        transmission was not received).
+        """
+        if self._rx_idx is None:
+            self._rx_idx = self._gen_match_index()
+
+        return self._rx_idx
+
+
+    def frames(self):
+        """Get one record per TX_LOW entry with its reception.
+
+        Returns:
+            numpy structured array with one element per TX_LOW entry with
+            fields:
+                tx_low_index     -- Index in to tx_low
+                timestamp        -- timestamp of the TX_LOW entry
+                rx_index         -- Index in to rx (-1 if not received)
+                received         -- True if the transmission was received
+                delay            -- Aligned timestamp of the reception minus
+                                    timestamp of the transmission (us)
+                power            -- Rx power (dBm) of the reception
+        """
+        import numpy as np
+
+        rx_idx   = self.rx_indexes()
+        received = (rx_idx >= 0)
+
+        frame_dt = [('tx_low_index', np.int64),
+                    ('timestamp',    np.uint64),
+                    ('rx_index',     np.int64),
+                    ('received',     np.bool_),
+                    ('delay',        np.int64),
+                    ('power',        np.int8)]
+
+        ret_val  = np.zeros(len(rx_idx), dtype=frame_dt)
+
+        ret_val['tx_low_index'] = np.arange(len(rx_idx))
+        ret_val['timestamp']    = self.tx_low['timestamp']
+        ret_val['rx_index']     = rx_idx
+        ret_val['received']     = received
+
+        rx_idx   = rx_idx[received]
+
+        ret_val['delay'][received] = (self.rx['timestamp'][rx_idx].astype(np.int64) - self.clock_offset -
+                                      self.tx_low['timestamp'][received].astype(np.int64))
+        ret_val['power'][received] = self.rx['power'][rx_idx]
+
+        return ret_val
+
+
+    def clear_cache(self):
+        """Remove the match indexes (eg if tx_low or rx were modified)."""
+        self._rx_idx = None
+
+
+    def __len__(self):
+        return len(self.tx_low)
+
+    def __repr__(self):
+        msg  = "TxRxMatch({0:,} TX_LOW entries, {1:,} Rx entries, ".format(len(self.tx_low), len(self.rx))
+        msg += "clock_offset={0} us)".format(self.clock_offset)
+        return msg
+
+
+    #-------------------------------------------------------------------------
+    # Internal methods for the match
+    #-------------------------------------------------------------------------
+    def _gen_match_index(self):
+        """Internal method to compute the index of the reception of each
+        TX_LOW entry.
+
+        The (address, sequence number) key of each entry is numbered, and
+        the key number and aligned timestamp are packed in to one uint64, so
+        that sorting the packed TX_LOW values sorts them by key and then by
+        time.  The nearest transmission with the same key of each reception
+        is then one of the two neighbors found by a binary search of its
+        packed value.
+        """
+        import numpy as np
+        from .util_agg import _factorize
+
+        rx_idx  = np.full(len(self.tx_low), -1, dtype=np.int64)
+
+        if (len(self.tx_low) == 0) or (len(self.rx) == 0):
+            return rx_idx
+
+        (keys, tx_ids) = _factorize(_get_tx_key(self.tx_low))
+        rx_keys        = _get_tx_key(self.rx)
+
+        # Number the keys of the receptions; receptions of other keys cannot match
+        rx_ids  = np.minimum(np.searchsorted(keys, rx_keys), len(keys) - 1)
+        rx_sel  = np.flatnonzero(keys[rx_ids] == rx_keys)
+        rx_ids  = rx_ids[rx_sel]
+
+        tx_time = self.tx_low['timestamp'].astype(np.int64)
+        rx_time = self.rx['timestamp'][rx_sel].astype(np.int64) - self.clock_offset
+
+        if (len(rx_sel) == 0):
+            return rx_idx
+
+        # Pack (key number, time) in to one uint64
+        t_min     = min(int(tx_time.min()), int(rx_time.min()))
+        t_max     = max(int(tx_time.max()), int(rx_time.max()))
+        time_bits = (t_max - t_min).bit_length()
+
+        if ((time_bits + (len(keys) - 1).bit_length()) > 64):
+            raise ValueError("Log timestamps span too much time to be matched ({0} us)".format(t_max - t_min))
+
+        tx_packed  = (tx_ids.astype(np.uint64) << np.uint64(time_bits)) | (tx_time - t_min).astype(np.uint64)
+        rx_packed  = (rx_ids.astype(np.uint64) << np.uint64(time_bits)) | (rx_time - t_min).astype(np.uint64)
+
+        tx_order   = np.argsort(tx_packed)
+        tx_packed  = tx_packed[tx_order]
+
+        rx_time   -= t_min
+        time_mask  = np.uint64(2**time_bits - 1)
+
+        # Candidate transmissions: the last one before and the first one after each reception
+        pos        = np.searchsorted(tx_packed, rx_packed)
+
+        best_tx    = np.full(len(rx_packed), -1, dtype=np.int64)
+        best_diff  = np.full(len(rx_packed), self.max_time_diff + 1, dtype=np.int64)
+
+        for cand in [pos - 1, pos]:
+            valid = (cand >= 0) & (cand < len(tx_packed))
+            cand  = np.where(valid, cand, 0)
+
+            # Same key (ie same upper bits) and nearer than the previous candidate
+            valid &= ((tx_packed[cand] >> np.uint64(time_bits)) == rx_ids.astype(np.uint64))
+
+            diff   = np.abs((tx_packed[cand] & time_mask).astype(np.int64) - rx_time)
+            better = valid & (diff < best_diff)
+
+            best_tx[better]   = cand[better]
+            best_diff[better] = diff[better]
+
+        rx_match   = np.flatnonzero(best_tx >= 0)
+        tx_match   = tx_order[best_tx[rx_match]]
+        diff       = best_diff[rx_match]
+
+        # Keep the nearest reception of each transmission
+        order      = np.lexsort((diff, tx_match))
+        tx_match   = tx_match[order]
+        rx_match   = rx_match[order]
+
+        is_first     = np.ones(len(tx_match), dtype=bool)
+        np.not_equal(tx_match[1:], tx_match[:-1], out=is_first[1:])
+
+        rx_idx[tx_match[is_first]] = rx_sel[rx_match[is_first]]
+
+        return rx_idx
+
+# End class()
+
+
+
+#-----------------------------------------------------------------------------
+# Join Utilities
+#-----------------------------------------------------------------------------
+def calc_clock_offset(time_info_tx, time_info_rx):
+    """Calculate the offset between the microsecond timers of two nodes.
+
+    Attributes:
+        time_info_tx     -- numpy structured array of TIME_INFO entries of
+                            the transmitting node
+        time_info_rx     -- numpy structured array of TIME_INFO entries of
+                            the receiving node
+
+    Returns:
+        Median over the TIME_INFO entries with the same time_id in both logs
+        of the timer value of the receiving node minus the timer value of the
+        transmitting node (us).  The timer value of an entry that changed the
+        timer is the new timer value.
+    """
+    import numpy as np
+
+    def timer_values(time_info):
+        new_time = time_info['new_time']
+        return np.where(new_time != _TIME_NOT_CHANGED, new_time, time_info['timestamp']).astype(np.int64)
+
+    (common_ids, tx_idx, rx_idx) = np.intersect1d(time_info_tx['time_id'], time_info_rx['time_id'], return_indices=True)
+
+    if (len(common_ids) == 0):
+        raise ValueError("No TIME_INFO entries with the same time_id in both logs")
+
+    offsets = timer_values(time_info_rx)[rx_idx] - timer_values(time_info_tx)[tx_idx]
+
+    return int(np.median(offsets))
+
+# End def
+
+
+def _get_tx_key(np_arr):
+    """Internal method to pack the transmitter address (addr2) and the MAC
+    sequence number (mac_seq) of each entry in to one uint64.
+    """
+    import numpy as np
+
+    keys   = np_arr['addr2'].astype(np.uint64) << np.uint64(_MAC_SEQ_BITS)
+    keys  |= np_arr['mac_seq'].astype(np.uint64)
+
+    return keys
+
+# End def
+
+
+def _sum_per_mpdu(values, starts, num_attempts):
+    """Internal method to sum the values of the attempts of each TX entry."""
+    import numpy as np
+
+    cum_values = np.zeros(len(values) + 1, dtype=np.uint64)
+    np.cumsum(values, out=cum_values[1:], dtype=np.uint64)
+
+    return cum_values[starts + num_attempts] - cum_values[starts]
+
+# End def
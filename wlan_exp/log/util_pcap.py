@@ -24,9 +24,9 @@ Naming convention:
   log_data       -- The binary data from a WLAN Exp node's log.
   
   log_pcap_index -- This is an index that will be used for PCAP generation.
-                    Based on the selected event types, this index is a list
-                    of tuples of event type ids and offsets:
-                      [ (<int>, <offset>) ]
+                    Based on the selected event types, this index is a 
+                    numpy array with one row of field offsets per packet:
+                      [[<timestamp offset>, <length offset>, <payload offset>]]
 
   pcap           -- A packet capture format for capturing / processing network traffic
                         http://en.wikipedia.org/wiki/Pcap
@@ -144,9 +144,10 @@ def _log_data_to_pcap(log_data, log_index, filename, overwrite=False):
 def _gen_pcap_log_index(log_index):
     """Uses a log index to create a pcap log index.
 
-    For each supported entry in the log index, an entry is created in the
-    pcap_log_index that is a list of tuples: 
-    (entry_type_id, timestamp_offset, length_offset, payload_offset).
+    For each supported entry in the log index, a row is created in the
+    pcap_log_index array that contains the offsets: 
+    (timestamp_offset, length_offset, payload_offset).  The rows are sorted
+    by log data offset.  The log index values can be lists or numpy arrays.
 
     Currently supported entry_types are:    
         RX_DSSS
@@ -154,7 +155,9 @@ def _gen_pcap_log_index(log_index):
         TX
         TX_LOW
     """
-    pcap_log_index = []
+    import numpy as np
+
+    pcap_log_index = [np.zeros((0, 3), dtype=np.int64)]
 
     # Create a list of entry type ids to filter the index
     from . import entry_types
@@ -167,9 +170,9 @@ def _gen_pcap_log_index(log_index):
             entry         = entry_types.log_entry_types[entry_type]
             entry_offsets = entry.get_field_offsets()
 
-            entry_type_offsets[entry_type] = [entry_offsets['timestamp'],
-                                              entry_offsets['length'],
-                                              entry_offsets['mac_payload_len']]
+            entry_type_offsets[entry_type] = np.array([entry_offsets['timestamp'],
+                                                       entry_offsets['length'],
+                                                       entry_offsets['mac_payload_len']], dtype=np.int64)
         except KeyError:
             print("Could not filter log data with event type: {0}".format(entry_type))
 
@@ -178,16 +181,15 @@ def _gen_pcap_log_index(log_index):
     for entry_type in log_index.keys():
         try: 
             offsets = entry_type_offsets[entry_type]
-            for offset in log_index[entry_type]:
-                pcap_log_index.append((entry_type, offset + offsets[0], offset + offsets[1], offset + offsets[2]))
+            entries = np.asarray(log_index[entry_type], dtype=np.int64)
+            pcap_log_index.append(entries[:, np.newaxis] + offsets)
         except KeyError:
             print("Can not use entry type: {0} in PCAP generation.".format(entry_type))
 
+    pcap_log_index = np.concatenate(pcap_log_index)
     
     # Sort the PCAP data
-    from operator import itemgetter
-    
-    sorted(pcap_log_index, key=itemgetter(1))
+    pcap_log_index = pcap_log_index[np.argsort(pcap_log_index[:, 0], kind='stable')]
 
     return pcap_log_index
 
@@ -223,33 +225,34 @@ def _covert_log_data_to_pcap(file, log_data, log_pcap_index):
     global pcap_global_header
 
     import struct
+    from . import util as log_util
+
     time_factor = 1000000        # Timestamps are in # of microseconds (ie 10^(-6) seconds)
 
     # Write the Global header to the file
     file.write(_serialize_header(pcap_global_header, pcap_global_header_fmt))
+
+    # Read the timestamp (# of microseconds), length and payload length of 
+    #   every packet at once
+    log_bytes    = log_util._log_data_as_np(log_data)
+    timestamps   = log_util._get_le_column(log_bytes, log_pcap_index[:, 0], '<u8')
+    orig_lens    = log_util._get_le_column(log_bytes, log_pcap_index[:, 1], '<u2')
+    incl_lens    = log_util._get_le_column(log_bytes, log_pcap_index[:, 2], '<u4')
+    payload_offs = log_pcap_index[:, 2] + 4
+
+    ts_secs      = timestamps // time_factor
+    ts_usecs     = timestamps % time_factor
+
+    fmt = '<I I I I'
     
     # Iterate through the index and create a pcap entry for each item
-    for item in log_pcap_index:
-        # Get the timestamp (# of microseconds)
-        timestamp    = struct.unpack("<Q", log_data[item[1]:(item[1] + 8)])[0]
-        
-        # Get the length
-        orig_len     = struct.unpack("<H", log_data[item[2]:(item[2] + 2)])[0]
-        
-        # Get the payload
-        incl_len_end = item[3] + 4
-        incl_len     = struct.unpack("<I", log_data[item[3]:incl_len_end])[0]
-        payload      = log_data[incl_len_end:(incl_len_end + incl_len)]
-        
-        # Populate the packet header
-        ts_sec       = int(timestamp / time_factor)
-        ts_usec      = int(timestamp % time_factor)
-
-        fmt = '<I I I I'
+    for (ts_sec, ts_usec, incl_len, orig_len, payload_off) in zip(ts_secs, ts_usecs, incl_lens, orig_lens, payload_offs):
+        payload_off = int(payload_off)
+        incl_len    = int(incl_len)
 
         try:
-            file.write(struct.pack(fmt, ts_sec, ts_usec, incl_len, orig_len))
-            file.write(payload)
+            file.write(struct.pack(fmt, int(ts_sec), int(ts_usec), incl_len, int(orig_len)))
+            file.write(log_bytes[payload_off:(payload_off + incl_len)].tobytes())
         except struct.error as err:
             print("Error packing packet: {0}".format(err))
 
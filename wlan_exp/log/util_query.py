@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+------------------------------------------------------------------------------
+WLAN Experiment Log Queries
+------------------------------------------------------------------------------
+Authors:   Chris Hunter (chunter [at] mangocomm.com)
+           Patrick Murphy (murphpo [at] mangocomm.com)
+           Erik Welsh (welsh [at] mangocomm.com)
+License:   Copyright 2014, Mango Communications. All rights reserved.
+           Distributed under the WARP license (http://warpproject.org/license)
+------------------------------------------------------------------------------
+
+This module provides queries that select the entries of one entry type in
+WLAN Exp log data by the values of their fields.
+
+log_util.filter_log_index() only selects entries by entry type, so selecting
+entries by field values usually requires decoding every entry first (see
+log_util.log_data_to_np_arrays()).  A LogQuery instead evaluates its
+predicates directly on the log data:  each predicate reads only the field it
+tests, and only for the entries that passed the previous predicates.  Only
+the entries that pass every predicate are decoded:
+
+    query = LogQuery('RX_OFDM')
+    query.where('fcs_result', '==', 0)
+    query.where('addr2', '==', 0x40D855042100)
+    query.where('flags', '==', 0, mask=0x1)
+    query.between(t0, t1)
+
+    rx    = query.run(log_data, log_index, fields=['timestamp', 'power'])
+
+Naming convention:
+
+  log_data       -- The binary data from a WLAN Exp node's log.
+
+  log_index      -- A raw or filtered log index of the log data (see
+                    wlan_exp.log.util).
+
+"""
+
+__all__ = ['LogQuery']
+
+
+from . import util as log_util
+
+
+# Comparison operators of query predicates
+_QUERY_OPS = ['==', '!=', '<', '<=', '>', '>=', 'in', 'not in']
+
+
+#-----------------------------------------------------------------------------
+# Log Query Class
+#-----------------------------------------------------------------------------
+class LogQuery(object):
+    """Class to define a query of the entries of one entry type.
+
+    Attributes:
+        entry_type           -- Name of the entry type of the query
+        predicates           -- List of predicates (field, op, value, mask)
+                                that every selected entry must satisfy
+
+    Predicates are evaluated in the order they are added, so the predicates
+    that select the fewest entries should be added first.
+    """
+    entry_type               = None
+    predicates               = None
+
+
+    def __init__(self, entry_type):
+        self.entry_type = str(entry_type)
+        self.predicates = []
+
+
+    def where(self, field, op, value, mask=None):
+        """Add a predicate to the query.
+
+        Attributes:
+            field            -- Name of the field.  Fields added by gen_numpy
+                                callbacks (eg 'addr2') can be used.
+            op               -- Comparison operator:  '==', '!=', '<', '<=',
+                                '>', '>=', 'in' or 'not in'
+            value            -- Value compared to the field (list of values
+                                for 'in' and 'not in')
+            mask             -- Bit mask applied to the field before the
+                                comparison (ie (field & mask) op value)
+
+        Returns:
+            The LogQuery, so predicates can be chained
+        """
+        if op not in _QUERY_OPS:
+            raise ValueError("Unknown query operator '{0}'; must be one of {1}".format(op, _QUERY_OPS))
+
+        self.predicates.append((field, op, value, mask))
+
+        return self
+
+
+    def between(self, start=None, end=None):
+        """Add predicates to select the entries with timestamps in [start, end).
+
+        Returns:
+            The LogQuery, so predicates can be chained
+        """
+        if start is not None:
+            self.where('timestamp', '>=', start)
+
+        if end is not None:
+            self.where('timestamp', '<', end)
+
+        return self
+
+
+    def filter_log_index(self, log_data, log_index):
+        """Select the entries of the log index that satisfy the query.
+
+        Attributes:
+            log_data         -- Binary WLAN Exp log data
+            log_index        -- Raw or filtered log index of the log data
+
+        Returns:
+            LogIndex with the entry type of the query as its only key and the
+            offsets of the selected entries (in the order of log_index)
+        """
+        import numpy as np
+
+        log_bytes  = log_util._log_data_as_np(log_data)
+        entry_type = self._get_entry_type()
+        offsets    = self._get_offsets(log_index)
+
+        for (field, op, value, mask) in self.predicates:
+            if (len(offsets) == 0):
+                break
+
+            column = self._get_column(entry_type, log_bytes, offsets, field)
+
+            if (column.ndim != 1):
+                raise ValueError("Query predicates require scalar fields ({0} has shape {1})".format(field, column.shape[1:]))
+
+            if mask is not None:
+                column = column & mask
+
+            offsets = offsets[self._eval_predicate(column, op, value)]
+
+        return log_util.LogIndex({entry_type: log_util._index_array(offsets.astype(np.uint64))})
+
+
+    def run(self, log_data, log_index, fields=None):
+        """Decode the entries of the log index that satisfy the query.
+
+        Attributes:
+            log_data         -- Binary WLAN Exp log data
+            log_index        -- Raw or filtered log index of the log data
+            fields           -- List of fields to decode (default: all fields;
+                                see WlanExpLogEntryType.generate_numpy_array())
+
+        Returns:
+            numpy structured array of the selected entries
+        """
+        entry_type = self._get_entry_type()
+        log_index  = self.filter_log_index(log_data, log_index)
+
+        return entry_type.generate_numpy_array(log_data, log_index[entry_type], fields)
+
+
+    def __repr__(self):
+        msg = "LogQuery({0}".format(self.entry_type)
+
+        for (field, op, value, mask) in self.predicates:
+            if mask is not None:
+                field = "({0} & 0x{1:x})".format(field, mask)
+
+            msg += ", {0} {1} {2}".format(field, op, value)
+
+        return msg + ")"
+
+
+    #-------------------------------------------------------------------------
+    # Internal methods for the query
+    #-------------------------------------------------------------------------
+    def _get_entry_type(self):
+        """Internal method to get the WlanExpLogEntryType of the query."""
+        from .entry_types import log_entry_types
+
+        return log_entry_types[self.entry_type]
+
+
+    def _get_offsets(self, log_index):
+        """Internal method to get the offsets of the entry type of the query
+        in the log index as an int64 numpy array.
+        """
+        import numpy as np
+
+        log_index = log_util.filter_log_index(log_index, include_only=[self.entry_type])
+
+        for v in log_index.values():
+            return np.asarray(v, dtype=np.int64)
+
+        return np.zeros((0,), dtype=np.int64)
+
+
+    def _get_column(self, entry_type, log_bytes, offsets, field):
+        """Internal method to read one field of the entries at the offsets.
+
+        Only the bytes of the field are read from the log data.  MAC header
+        addresses are read directly from the MAC header instead of computing
+        every field added by np_array_add_MAC_addr_fields().
+        """
+        from .entry_types import np_array_add_MAC_addr_fields
+
+        if np_array_add_MAC_addr_fields in entry_type.gen_numpy_callbacks:
+            for (addr_field, addr_offset) in log_util._MAC_HDR_ADDR_OFFSETS:
+                if (field == addr_field):
+                    mac_hdr_offset = entry_type.get_field_offsets()['mac_payload']
+                    return log_util._get_mac_addr_column(log_bytes, offsets + (mac_hdr_offset + addr_offset))
+
+        np_arr = entry_type.generate_numpy_array(log_bytes, offsets, fields=[field])
+
+        if field not in np_arr.dtype.names:
+            raise KeyError("Entry type {0} does not have field '{1}'".format(entry_type, field))
+
+        return np_arr[field]
+
+
+    def _eval_predicate(self, column, op, value):
+        """Internal method to evaluate a predicate on a column.
+
+        Returns:
+            bool numpy array with one element per element of column
+        """
+        import numpy as np
+
+        if   (op == '=='):      return (column == value)
+        elif (op == '!='):      return (column != value)
+        elif (op == '<'):       return (column <  value)
+        elif (op == '<='):      return (column <= value)
+        elif (op == '>'):       return (column >  value)
+        elif (op == '>='):      return (column >= value)
+        elif (op == 'in'):      return np.isin(column, value)
+        elif (op == 'not in'):  return ~np.isin(column, value)
+
+# End class()
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+------------------------------------------------------------------------------
+WLAN Experiment Log View
+------------------------------------------------------------------------------
+Authors:   Chris Hunter (chunter [at] mangocomm.com)
+           Patrick Murphy (murphpo [at] mangocomm.com)
+           Erik Welsh (welsh [at] mangocomm.com)
+License:   Copyright 2014, Mango Communications. All rights reserved.
+           Distributed under the WARP license (http://warpproject.org/license)
+------------------------------------------------------------------------------
+
+This module provides a lazy, column-oriented view of WLAN Exp log data.
+
+log_util.log_data_to_np_arrays() decodes every field of every entry in the
+log index up front.  For large log data, this can require much more memory
+than the analysis actually uses.  A LogView instead decodes one field (ie
+column) of one entry type when it is first accessed:
+
+    view   = LogView(log_data, log_index)
+    power  = view['RX_OFDM']['power']       # Decodes only RX_OFDM 'power'
+    addr2  = view['RX_OFDM']['addr2']       # Reads only the MAC headers
+
+Decoded columns are kept in a least-recently-used cache with a memory budget
+so that repeated accesses do not decode the log data again.  Fields added by
+gen_numpy callbacks (ie 'addr1', 'addr2', 'addr3', 'mac_seq') are computed
+when they are accessed (see WlanExpLogEntryType.generate_numpy_array()).
+
+Naming convention:
+
+  log_data       -- The binary data from a WLAN Exp node's log.
+
+  log_index      -- A raw or filtered log index of the log data (see
+                    wlan_exp.log.util).
+
+"""
+
+__all__ = ['LogView',
+           'LogViewEntries']
+
+
+from . import util as log_util
+
+
+#-----------------------------------------------------------------------------
+# Log View Classes
+#-----------------------------------------------------------------------------
+class LogView(object):
+    """Class to define a lazy view of the entries in log data.
+
+    Attributes:
+        log_data             -- Binary WLAN Exp log data
+        log_index            -- Filtered log index of the entries in the view
+        cache_size           -- Maximum number of bytes of decoded columns
+                                kept in the cache
+
+    view[<entry type name>] returns a LogViewEntries of the entries of that
+    type.  Raw log indexes are filtered (see log_util.filter_log_index()) so
+    that entry types are accessed by name.
+    """
+    log_data                 = None
+    log_index                = None
+    cache_size               = None
+
+    _cache                   = None
+    _cache_bytes             = None
+
+
+    def __init__(self, log_data, log_index, cache_size=2**28):
+        from collections import OrderedDict
+
+        self.log_data     = log_data
+        self.log_index    = log_util.filter_log_index(log_index)
+        self.cache_size   = cache_size
+
+        self._cache       = OrderedDict()
+        self._cache_bytes = 0
+
+
+    def keys(self):
+        """Entry types in the view."""
+        return self.log_index.keys()
+
+
+    def clear_cache(self):
+        """Remove all decoded columns from the cache."""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+
+    def get_column(self, entry_type, field):
+        """Get the decoded values of a field of all entries of an entry type.
+
+        Attributes:
+            entry_type       -- Name of the entry type
+            field            -- Name of the field
+
+        Returns:
+            numpy array with one value per entry (in log index order)
+        """
+        key = (str(entry_type), field)
+
+        try:
+            column             = self._cache.pop(key)
+            self._cache_bytes -= column.nbytes
+        except KeyError:
+            column             = self._decode_column(entry_type, field)
+
+        self._add_to_cache(key, column)
+
+        return column
+
+
+    def __getitem__(self, entry_type):
+        if entry_type not in self.log_index:
+            raise KeyError(entry_type)
+
+        return LogViewEntries(self, entry_type)
+
+    def __contains__(self, entry_type):
+        return entry_type in self.log_index
+
+    def __iter__(self):
+        return iter(self.log_index)
+
+    def __len__(self):
+        return len(self.log_index)
+
+    def __repr__(self):
+        msg  = "LogView({0} entry types, ".format(len(self.log_index))
+        msg += "{0:,} of {1:,} bytes cached)".format(self._cache_bytes, self.cache_size)
+        return msg
+
+
+    #-------------------------------------------------------------------------
+    # Internal methods for the view
+    #-------------------------------------------------------------------------
+    def _get_entry_type(self, entry_type):
+        """Internal method to get the WlanExpLogEntryType key of the log index."""
+        for k in self.log_index.keys():
+            if (k == entry_type):
+                return k
+
+        raise KeyError(entry_type)
+
+
+    def _decode_column(self, entry_type, field):
+        """Internal method to decode a field of all entries of an entry type.
+
+        MAC header addresses are read directly from the MAC header instead
+        of computing every field added by np_array_add_MAC_addr_fields().
+        """
+        import numpy as np
+        from .entry_types import np_array_add_MAC_addr_fields
+
+        k      = self._get_entry_type(entry_type)
+
+        if np_array_add_MAC_addr_fields in k.gen_numpy_callbacks:
+            for (addr_field, addr_offset) in log_util._MAC_HDR_ADDR_OFFSETS:
+                if (field == addr_field):
+                    log_bytes      = log_util._log_data_as_np(self.log_data)
+                    offsets        = np.asarray(self.log_index[k], dtype=np.int64)
+                    mac_hdr_offset = k.get_field_offsets()['mac_payload']
+                    return log_util._get_mac_addr_column(log_bytes, offsets + (mac_hdr_offset + addr_offset))
+
+        np_arr = k.generate_numpy_array(self.log_data, self.log_index[k], fields=[field])
+
+        if field not in np_arr.dtype.names:
+            msg  = "Entry type {0} does not have field '{1}'".format(k, field)
+            raise KeyError(msg)
+
+        return np_arr[field]
+
+
+    def _add_to_cache(self, key, column):
+        """Internal method to add a column to the cache as the most recently
+        used column.  Least recently used columns are removed until the
+        cache is within the memory budget.  Columns larger than the memory
+        budget are not cached.
+        """
+        if (column.nbytes > self.cache_size):
+            return
+
+        self._cache[key]   = column
+        self._cache_bytes += column.nbytes
+
+        while (self._cache_bytes > self.cache_size):
+            (_, lru_column)    = self._cache.popitem(last=False)
+            self._cache_bytes -= lru_column.nbytes
+
+# End class()
+
+
+
+class LogViewEntries(object):
+    """Class to define the entries of one entry type in a LogView.
+
+    entries[<field name>] returns the decoded values of that field for all
+    entries (see LogView.get_column()).
+    """
+    view                     = None
+    entry_type               = None
+
+
+    def __init__(self, view, entry_type):
+        self.view       = view
+        self.entry_type = view._get_entry_type(entry_type)
+
+
+    def fields(self):
+        """Names of the fields of the entry type, including fields added by
+        gen_numpy callbacks.
+        """
+        names = list(self.entry_type.fields_np_dt.names)
+
+        for callback in self.entry_type.gen_numpy_callbacks:
+            names.extend(getattr(callback, 'output_fields', ()))
+
+        return names
+
+
+    def offsets(self):
+        """Offsets of the entries in the log data."""
+        return self.view.log_index[self.entry_type]
+
+
+    def to_array(self, fields=None):
+        """Decode the entries in to a numpy structured array (not cached).
+
+        Attributes:
+            fields           -- List of fields to decode (default: all fields)
+        """
+        return self.entry_type.generate_numpy_array(self.view.log_data, self.offsets(), fields)
+
+
+    def __getitem__(self, field):
+        return self.view.get_column(self.entry_type, field)
+
+    def __len__(self):
+        return len(self.offsets())
+
+    def __repr__(self):
+        return "LogViewEntries({0}, {1:,} entries)".format(self.entry_type, len(self))
+
+# End class()
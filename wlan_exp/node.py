@@ -363,7 +363,7 @@ class WlanExpNode(wn_node.WnNode, device.WlanDevice):
         self.send_cmd(cmds.StatsConfigure(promisc_stats))
 
 
-    def stats_get_txrx(self, device_list=None):
+    def stats_get_txrx(self, device_list=None, as_np_array=False):
         """Get the statistics from the node.
         
         Returns a list of statistic dictionaries or a single dictionary.  
@@ -374,24 +374,27 @@ class WlanExpNode(wn_node.WnNode, device.WlanDevice):
         devices in the list.  If any of the staistics are not there, 
         None will be inserted in the list.  If the device_list is not 
         specified, then all the statistics on the node will be returned.
+
+        If as_np_array is True, the statistics are numpy structured arrays
+        (see WlanExpLogEntryType.deserialize()) instead of dictionaries.
         """
         ret_val = []
         if not device_list is None:
             if (type(device_list) is list):
                 for device in device_list:
-                    stats = self.send_cmd(cmds.StatsGetTxRx(device))
+                    stats = self.send_cmd(cmds.StatsGetTxRx(device, as_np_array))
                     if (len(stats) == 1):
                         ret_val.append(stats)
                     else:
                         ret_val.append(None)
             else:
-                ret_val = self.send_cmd(cmds.StatsGetTxRx(device_list))
+                ret_val = self.send_cmd(cmds.StatsGetTxRx(device_list, as_np_array))
                 if (len(ret_val) == 1):
                     ret_val = ret_val[0]
                 else:
                     ret_val = None
         else:
-            ret_val = self.send_cmd(cmds.StatsGetTxRx())
+            ret_val = self.send_cmd(cmds.StatsGetTxRx(as_np_array=as_np_array))
         
         return ret_val
     
@@ -562,7 +565,7 @@ class WlanExpNode(wn_node.WnNode, device.WlanDevice):
         return ret_val
 
 
-    def get_station_info(self, device_list=None):
+    def get_station_info(self, device_list=None, as_np_array=False):
         """Get the station info from the node.
         
         Returns:
@@ -574,24 +577,28 @@ class WlanExpNode(wn_node.WnNode, device.WlanDevice):
         devices in the list.  If any of the station info are not there, 
         None will be inserted in the list.  If the device_list is not 
         specified, then all the station infos on the node will be returned.
+
+        If as_np_array is True, the station infos are numpy structured 
+        arrays (see WlanExpLogEntryType.deserialize()) instead of 
+        dictionaries.
         """
         ret_val = []
         if not device_list is None:
             if (type(device_list) is list):
                 for device in device_list:
-                    info = self.send_cmd(cmds.NodeGetStationInfo(device))
+                    info = self.send_cmd(cmds.NodeGetStationInfo(device, as_np_array))
                     if (len(info) == 1):
                         ret_val.append(info)
                     else:
                         ret_val.append(None)
             else:
-                ret_val = self.send_cmd(cmds.NodeGetStationInfo(device_list))
+                ret_val = self.send_cmd(cmds.NodeGetStationInfo(device_list, as_np_array))
                 if (len(ret_val) == 1):
                     ret_val = ret_val[0]
                 else:
                     ret_val = None
         else:
-            ret_val = self.send_cmd(cmds.NodeGetStationInfo())
+            ret_val = self.send_cmd(cmds.NodeGetStationInfo(as_np_array=as_np_array))
 
         return ret_val
     